@@ -0,0 +1,560 @@
+import sys
+from array import array
+from typing import TypeVar, Generic, Iterable
+
+from AlgorithmLibrary.red_black_tree import typeCheck
+
+T = TypeVar('T')
+
+# Slot 0 is the NIL node, it is always black and never holds a key
+NIL = 0
+
+
+class ArrayRedBlackTree(Generic[T]):
+    """
+    A class that represent Red-black tree stored as struct of arrays.
+
+    Nodes are integer slots instead of objects. Links of slot i are kept in
+    parallel arrays, its color is the i-th bit of a bitmap (set bit means red).
+    Slots released by remove() are chained into a free-list through the parent
+    array and reused by next insertions.
+
+    ...
+
+    Attributes
+    ----------
+    __keys : list[T | None]
+        key of every slot
+    __left : array
+        left child slot of every slot
+    __right : array
+        right child slot of every slot
+    __parent : array
+        parent slot of every slot, next free slot for released slots
+    __red : bytearray
+        bitmap of red slots
+    __free : int
+        first slot of the free-list, NIL when the list is empty
+    __root : int
+        slot of the root
+    __key_type : type | None
+        The datatype of keys, resolved on the first check
+
+    Methods
+    -------
+    insert(value: T)
+        Inserts value of datatype T into the tree
+    remove(value: T)
+        Removes value of datatype T from the tree
+    contains(value: T)
+        Search for value of datatype T in the tree
+    bytes_per_key()
+        Returns memory used by the tree structure per key
+    """
+
+    def __init__(self, key_type: type | None = None) -> None:
+        """
+        It initializes the tree with the NIL slot only.
+
+        :param key_type: The datatype of keys, by default the argument of the generic
+        (ArrayRedBlackTree[int]) or the type of the first checked key
+        :type key_type: type | None
+        """
+        self.size: int = 0
+        self.__key_type: type | None = key_type
+        self.__keys: list[T | None] = [None]
+        self.__left: array = array('l', [NIL])
+        self.__right: array = array('l', [NIL])
+        self.__parent: array = array('l', [NIL])
+        self.__red: bytearray = bytearray(1)
+        self.__free: int = NIL
+        self.__root: int = NIL
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable[T],
+                    key_type: type | None = None) -> 'ArrayRedBlackTree[T]':
+        """
+        Builds a tree from keys in ascending order in O(n).
+
+        Keys are stored into slots in their order, so the arrays are filled
+        sequentially and the tree shape is computed from the indexes.
+
+        :param iterable: The keys in ascending order
+        :type iterable: Iterable[T]
+        :param key_type: The datatype of keys, by default the type of the first key.
+        Class methods of ArrayRedBlackTree[int] do not see the argument, pass key_type=int
+        :type key_type: type | None
+        :return: The new tree
+        """
+        keys: list[T | None] = [None]
+        for key in iterable:
+            if key_type is None:
+                key_type = type(key)
+            typeCheck(key_type, key)
+            if len(keys) > 1:
+                if key == keys[-1]:
+                    continue
+                if key < keys[-1]:
+                    raise ValueError("Keys are not sorted: " +
+                                     str(key) + " follows " + str(keys[-1]))
+            keys.append(key)
+
+        tree = cls(key_type=key_type)
+        tree.__build(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T],
+                      key_type: type | None = None) -> 'ArrayRedBlackTree[T]':
+        """
+        Builds a tree from keys in any order, they are sorted first.
+
+        :param iterable: The keys to insert
+        :type iterable: Iterable[T]
+        :param key_type: The datatype of keys, by default the type of the first key
+        :type key_type: type | None
+        :return: The new tree
+        """
+        return cls.from_sorted(sorted(iterable), key_type)
+
+    @property
+    def key_type(self) -> type | None:
+        """
+        The datatype of keys, None while it is not known yet
+        """
+        if self.__key_type is None:
+            orig_class = getattr(self, "__orig_class__", None)
+            self.__key_type = None if orig_class is None else orig_class.__args__[0]
+        return self.__key_type
+
+    def insert(self, value: T) -> bool:
+        """
+        Inserts value into the tree with a single descent
+
+        :param value: The value to be inserted into the tree
+        :type value: T
+        :return: value is not in the tree return true, otherwise false
+        """
+        self.__check_value(value)
+
+        return self.__insert_value(value)
+
+    def remove(self, value: T) -> None:
+        """
+        If the value is in the tree, remove it and release its slot
+
+        :param value: The value to remove from the tree
+        :type value: T
+        """
+        self.__check_value(value)
+
+        slot = self.__find(value)
+        if slot != NIL:
+            self.__remove_slot(slot)
+
+    def contains(self, value: T) -> bool:
+        """
+        If the key is in the tree, return True, otherwise return False
+
+        :param value: The key to search for
+        :type value: T
+        :return: The value of the key.
+        """
+        self.__check_value(value)
+
+        return self.__find(value) != NIL
+
+    def insert_many(self, values: Iterable[T]) -> int:
+        """
+        Inserts a batch of values in ascending order
+
+        :param values: The values to be inserted into the tree
+        :type values: Iterable[T]
+        :return: Number of values which were not in the tree yet
+        """
+        values = sorted(values)
+        self.__check_batch(values)
+        return sum(self.__insert_value(value) for value in values)
+
+    def remove_many(self, values: Iterable[T]) -> int:
+        """
+        Removes a batch of values in ascending order
+
+        :param values: The values to remove from the tree
+        :type values: Iterable[T]
+        :return: Number of values which were removed
+        """
+        values = sorted(values)
+        self.__check_batch(values)
+
+        removed = 0
+        for value in values:
+            slot = self.__find(value)
+            if slot != NIL:
+                self.__remove_slot(slot)
+                removed += 1
+        return removed
+
+    def contains_many(self, values: Iterable[T]) -> list[bool]:
+        """
+        Searches for a batch of values
+
+        :param values: The keys to search for
+        :type values: Iterable[T]
+        :return: For every value in the batch, whether it is in the tree
+        """
+        values = list(values)
+        self.__check_batch(values)
+        return [self.__find(value) != NIL for value in values]
+
+    def to_list(self) -> list[T]:
+        """
+        Method converts tree to list in O(n) - ordered
+
+        Returns:
+            list: content of tree as list
+        """
+        keys, left, right = self.__keys, self.__left, self.__right
+        content = list()
+        stack: list[int] = []
+        slot = self.__root
+        while stack or slot != NIL:
+            while slot != NIL:
+                stack.append(slot)
+                slot = left[slot]
+            slot = stack.pop()
+            content.append(keys[slot])
+            slot = right[slot]
+        return content
+
+    def bytes_per_key(self) -> float:
+        """
+        Returns bytes used by the key list, link arrays and color bitmap per key.
+        Key objects themselves are not counted, they are shared with the caller.
+
+        :return: Used bytes divided by number of keys
+        """
+        used = sys.getsizeof(self.__keys) + sys.getsizeof(self.__left) + \
+            sys.getsizeof(self.__right) + sys.getsizeof(self.__parent) + \
+            sys.getsizeof(self.__red)
+        return used / max(self.size, 1)
+
+    def print(self):
+        """
+        Prints the tree, every node with its key and color
+        """
+        self.__print_tree(self.__root, "", True)
+
+    def __print_tree(self, slot: int, indent, last: bool) -> None:
+        # iterative pre-order walk, indentation of a slot is pushed with it
+        stack: list[tuple[int, str, bool]] = [] if slot == NIL else [(slot, indent, last)]
+        while stack:
+            slot, indent, last = stack.pop()
+            print(indent, end=' ')
+            print("└─(R)────" if last else "├─(L)────", end=' ')
+            print(str(self.__keys[slot])+" ("+("RED" if self.__is_red(slot) else "BLACK")+")")
+            indent += "     " if last else " │ "
+            if self.__right[slot] != NIL:
+                stack.append((self.__right[slot], indent, True))
+            if self.__left[slot] != NIL:
+                stack.append((self.__left[slot], indent, False))
+
+    def __build(self, keys: list[T | None]) -> None:
+        """
+        Replaces content of the empty tree, slot i holds keys[i]
+
+        :param keys: None followed by keys in strictly ascending order
+        :type keys: list[T | None]
+        """
+        count = len(keys) - 1
+        self.size = count
+        self.__keys = keys
+        self.__left = array('l', [NIL]) * (count + 1)
+        self.__right = array('l', [NIL]) * (count + 1)
+        self.__parent = array('l', [NIL]) * (count + 1)
+        self.__red = bytearray((count >> 3) + 1)
+        if count == 0:
+            return
+        # slots at the deepest level are red, unless that level is full
+        red_depth = count.bit_length() - 1 if (count + 1) & count else -1
+        self.__root = self.__build_range(1, count, 0, red_depth, NIL)
+
+    def __build_range(self, low: int, high: int, depth: int, red_depth: int, parent: int) -> int:
+        if low > high:
+            return NIL
+        mid = (low + high) // 2
+        self.__parent[mid] = parent
+        if depth == red_depth:
+            self.__set_red(mid)
+        self.__left[mid] = self.__build_range(low, mid - 1, depth + 1, red_depth, mid)
+        self.__right[mid] = self.__build_range(mid + 1, high, depth + 1, red_depth, mid)
+        return mid
+
+    def __check_value(self, value: T) -> None:
+        # after the first check it costs a single identity test of the type
+        if type(value) is not self.__key_type:
+            if self.key_type is None:
+                self.__key_type = type(value)
+            typeCheck(self.__key_type, value)
+
+    def __check_batch(self, values: list[T]) -> None:
+        for value in dict(zip(map(type, values), values)).values():
+            self.__check_value(value)
+
+    def __find(self, value: T) -> int:
+        keys, left, right = self.__keys, self.__left, self.__right
+        slot = self.__root
+        while slot != NIL:
+            key = keys[slot]
+            if value == key:
+                return slot
+            slot = left[slot] if value < key else right[slot]
+        return NIL
+
+    def __is_red(self, slot: int) -> int:
+        return self.__red[slot >> 3] >> (slot & 7) & 1
+
+    def __set_red(self, slot: int) -> None:
+        self.__red[slot >> 3] |= 1 << (slot & 7)
+
+    def __set_black(self, slot: int) -> None:
+        self.__red[slot >> 3] &= 0xFF ^ (1 << (slot & 7))
+
+    def __allocate(self, value: T) -> int:
+        """
+        Takes a slot from the free-list, or appends a new one, for red node with value
+
+        :param value: The key of the new node
+        :return: The slot of the new node
+        """
+        slot = self.__free
+        if slot != NIL:
+            self.__free = self.__parent[slot]
+            self.__parent[slot] = NIL
+            self.__keys[slot] = value
+        else:
+            slot = len(self.__keys)
+            self.__keys.append(value)
+            self.__left.append(NIL)
+            self.__right.append(NIL)
+            self.__parent.append(NIL)
+            if slot >> 3 == len(self.__red):
+                self.__red.append(0)
+        self.__set_red(slot)
+        return slot
+
+    def __release(self, slot: int) -> None:
+        """
+        Pushes the slot on the free-list
+
+        :param slot: The slot of removed node
+        """
+        self.__keys[slot] = None
+        self.__left[slot] = NIL
+        self.__right[slot] = NIL
+        self.__set_black(slot)
+        self.__parent[slot] = self.__free
+        self.__free = slot
+
+    def __insert_value(self, value: T) -> bool:
+        keys, left, right = self.__keys, self.__left, self.__right
+        y = NIL
+        x = self.__root
+        while x != NIL:
+            y = x
+            key = keys[x]
+            if value == key:
+                return False
+            x = left[x] if value < key else right[x]
+
+        self.size += 1
+        node = self.__allocate(value)
+        self.__parent[node] = y
+        if y == NIL:
+            self.__root = node
+        elif value < keys[y]:
+            left[y] = node
+        else:
+            right[y] = node
+
+        self.__insert_balance(node)
+        return True
+
+    def __insert_balance(self, x: int) -> None:
+        left, right, parent = self.__left, self.__right, self.__parent
+        while self.__is_red(parent[x]):
+            p = parent[x]
+            g = parent[p]
+            if p == right[g]:
+                y = left[g]
+                if self.__is_red(y):
+                    self.__set_black(y)
+                    self.__set_black(p)
+                    self.__set_red(g)
+                    x = g
+                else:
+                    if x == left[p]:
+                        x = p
+                        self.__right_rotation(x)
+                        p = parent[x]
+                    self.__set_black(p)
+                    self.__set_red(g)
+                    self.__left_rotation(g)
+            else:
+                y = right[g]
+                if self.__is_red(y):
+                    self.__set_black(y)
+                    self.__set_black(p)
+                    self.__set_red(g)
+                    x = g
+                else:
+                    if x == right[p]:
+                        x = p
+                        self.__left_rotation(x)
+                        p = parent[x]
+                    self.__set_black(p)
+                    self.__set_red(g)
+                    self.__right_rotation(g)
+        self.__set_black(self.__root)
+
+    def __remove_slot(self, z: int) -> None:
+        left, right, parent = self.__left, self.__right, self.__parent
+        y = z
+        y_red = self.__is_red(y)
+        if left[z] == NIL:
+            x = right[z]
+            self.__transplant(z, x)
+        elif right[z] == NIL:
+            x = left[z]
+            self.__transplant(z, x)
+        else:
+            y = right[z]
+            while left[y] != NIL:
+                y = left[y]
+            y_red = self.__is_red(y)
+            x = right[y]
+            if parent[y] == z:
+                parent[x] = y
+            else:
+                self.__transplant(y, x)
+                right[y] = right[z]
+                parent[right[y]] = y
+
+            self.__transplant(z, y)
+            left[y] = left[z]
+            parent[left[y]] = y
+            if self.__is_red(z):
+                self.__set_red(y)
+            else:
+                self.__set_black(y)
+        if not y_red:
+            self.__remove_balance(x)
+
+        parent[NIL] = NIL
+        self.__release(z)
+        self.size -= 1
+
+    def __remove_balance(self, x: int) -> None:
+        left, right, parent = self.__left, self.__right, self.__parent
+        while x != self.__root and not self.__is_red(x):
+            p = parent[x]
+            if x == left[p]:
+                s = right[p]
+                if self.__is_red(s):
+                    self.__set_black(s)
+                    self.__set_red(p)
+                    self.__left_rotation(p)
+                    s = right[p]
+
+                if not self.__is_red(left[s]) and not self.__is_red(right[s]):
+                    self.__set_red(s)
+                    x = p
+                else:
+                    if not self.__is_red(right[s]):
+                        self.__set_black(left[s])
+                        self.__set_red(s)
+                        self.__right_rotation(s)
+                        s = right[p]
+
+                    if self.__is_red(p):
+                        self.__set_red(s)
+                    else:
+                        self.__set_black(s)
+                    self.__set_black(p)
+                    self.__set_black(right[s])
+                    self.__left_rotation(p)
+                    x = self.__root
+            else:
+                s = left[p]
+                if self.__is_red(s):
+                    self.__set_black(s)
+                    self.__set_red(p)
+                    self.__right_rotation(p)
+                    s = left[p]
+
+                if not self.__is_red(left[s]) and not self.__is_red(right[s]):
+                    self.__set_red(s)
+                    x = p
+                else:
+                    if not self.__is_red(left[s]):
+                        self.__set_black(right[s])
+                        self.__set_red(s)
+                        self.__left_rotation(s)
+                        s = left[p]
+
+                    if self.__is_red(p):
+                        self.__set_red(s)
+                    else:
+                        self.__set_black(s)
+                    self.__set_black(p)
+                    self.__set_black(left[s])
+                    self.__right_rotation(p)
+                    x = self.__root
+        self.__set_black(x)
+
+    def __transplant(self, x: int, y: int) -> None:
+        parent = self.__parent
+        p = parent[x]
+        if p == NIL:
+            self.__root = y
+        elif x == self.__left[p]:
+            self.__left[p] = y
+        else:
+            self.__right[p] = y
+        parent[y] = p
+
+    def __left_rotation(self, x: int) -> None:
+        left, right, parent = self.__left, self.__right, self.__parent
+        y = right[x]
+        right[x] = left[y]
+        if left[y] != NIL:
+            parent[left[y]] = x
+
+        p = parent[x]
+        parent[y] = p
+        if p == NIL:
+            self.__root = y
+        elif x == left[p]:
+            left[p] = y
+        else:
+            right[p] = y
+        left[y] = x
+        parent[x] = y
+
+    def __right_rotation(self, x: int) -> None:
+        left, right, parent = self.__left, self.__right, self.__parent
+        y = left[x]
+        left[x] = right[y]
+        if right[y] != NIL:
+            parent[right[y]] = x
+
+        p = parent[x]
+        parent[y] = p
+        if p == NIL:
+            self.__root = y
+        elif x == right[p]:
+            right[p] = y
+        else:
+            left[p] = y
+        right[y] = x
+        parent[x] = y
@@ -0,0 +1,80 @@
+from typing import TypeVar
+
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from Structures.AVLNode import AVLNode as Node
+
+T = TypeVar('T')
+
+
+class AVLTree(BinarySearchTree[T]):
+    """
+    A class that represent AVL tree, a height-balanced binary search tree.
+
+    Heights of the two subtrees of every node differ by at most one, so the height
+    of the tree is below 1.44 log2(n) and lookups are the fastest of the balanced
+    trees. Inserts and removals pay for it with rotations on the way up.
+    It has the same API as BinarySearchTree.
+
+    ...
+
+    Methods
+    -------
+    insert(key: T)
+        Inserts key of datatype T, at most two rotations
+    remove(key: T)
+        Removes key of datatype T, up to O(log n) rotations
+    contains(key: T)
+        Search for key of datatype T in O(log n)
+    """
+    _node_class: type = Node
+
+    def _inserted(self, node: Node) -> None:
+        self.__rebalance(node.parent)
+
+    def _remove_node(self, x: Node) -> None:
+        if x.left_child is not None and x.right_child is not None:
+            # the successor takes the place of x, the walk up compares with the old height
+            successor = x.right_child
+            while successor.left_child is not None:
+                successor = successor.left_child
+            successor.height = x.height
+        self.__rebalance(self._unlink(x))
+
+    def __rebalance(self, node: Node | None) -> None:
+        # walks up until a subtree keeps its height, above it nothing changed
+        while node is not None:
+            height = node.height
+            node = self.__balance(node)
+            if node.height == height:
+                return
+            node = node.parent
+
+    def __balance(self, node: Node) -> Node:
+        # restores balance of node whose subtrees differ by at most two, returns the new root
+        left_height = self.__height(node.left_child)
+        right_height = self.__height(node.right_child)
+        if left_height > right_height + 1:
+            left = node.left_child
+            if self.__height(left.left_child) < self.__height(left.right_child):
+                self._rotate_left(left)
+                self.__update(left)
+            self._rotate_right(node)
+        elif right_height > left_height + 1:
+            right = node.right_child
+            if self.__height(right.right_child) < self.__height(right.left_child):
+                self._rotate_right(right)
+                self.__update(right)
+            self._rotate_left(node)
+        else:
+            node.height = 1 + max(left_height, right_height)
+            return node
+        self.__update(node)
+        self.__update(node.parent)
+        return node.parent
+
+    @staticmethod
+    def __height(node: Node | None) -> int:
+        return 0 if node is None else node.height
+
+    def __update(self, node: Node) -> None:
+        node.height = 1 + max(self.__height(node.left_child), self.__height(node.right_child))
@@ -0,0 +1,325 @@
+from bisect import bisect_left
+from typing import TypeVar, Generic, Iterable, Iterator, get_args, get_origin
+
+from AlgorithmLibrary.red_black_tree import typeCheck
+from Structures.BTreeNode import BTreeNode as Node
+
+T = TypeVar('T')
+
+
+class BTree(Generic[T]):
+    """
+    A class that represent B-tree, a sorted set with wide nodes.
+
+    Every node keeps up to fanout - 1 sorted keys in a list searched with bisect,
+    so a search visits only log_fanout(n) nodes. Full nodes are split on the way
+    down during insertion and thin nodes are refilled on the way down during
+    removal, so both run in a single pass. It has the same API as RedBlackTree.
+
+    ...
+
+    Attributes
+    ----------
+    __degree : int
+        minimum degree, every node except the root has degree - 1 to 2 * degree - 1 keys
+    __root : Node[T]
+        Root of the tree
+    __validate : bool
+        Whether datatype of keys is checked
+    __key_type : type | None
+        The datatype of keys, resolved on the first check
+
+    Methods
+    -------
+    insert(value: T)
+        Inserts value of datatype T into the tree
+    remove(value: T)
+        Removes value of datatype T from the tree
+    contains(value: T)
+        Search for value of datatype T in the tree
+    """
+
+    def __init__(self, fanout: int = 64, validate: bool = True,
+                 key_type: type | None = None) -> None:
+        """
+        It initializes the tree.
+
+        :param fanout: Maximum number of children of a node, at least 4,
+        odd numbers are rounded down
+        :type fanout: int
+        :param validate: Check datatype of keys, False trusts callers entirely
+        :type validate: bool
+        :param key_type: The datatype of keys, by default the argument of the generic
+        (BTree[int]) or the type of the first key
+        :type key_type: type | None
+        """
+        if fanout < 4:
+            raise ValueError("Fanout must be at least 4, got: " + str(fanout))
+        self.size: int = 0
+        self.__degree: int = fanout // 2
+        self.__root: Node[T] = Node()
+        self.__validate: bool = validate
+        self.__key_type: type | None = key_type
+
+    @property
+    def fanout(self) -> int:
+        return 2 * self.__degree
+
+    @property
+    def key_type(self) -> type | None:
+        if self.__key_type is None:
+            self.__key_type = self.__generic_type()
+        return self.__key_type
+
+    def insert(self, value: T) -> bool:
+        """
+        Inserts value, splitting full nodes on the path
+
+        :param value: The value to be inserted into the tree
+        :type value: T
+        :return: value is not in the tree return true, otherwise false
+        """
+        self.__check_value(value)
+
+        return self.__insert(value)
+
+    def remove(self, value: T) -> None:
+        """
+        If the value is in the tree, remove it
+
+        :param value: The value to remove from the tree
+        :type value: T
+        """
+        self.__check_value(value)
+
+        self.__remove(value)
+
+    def contains(self, value: T) -> bool:
+        """
+        If the key is in the tree, return True, otherwise return False
+
+        :param value: The key to search for
+        :type value: T
+        :return: The value of the key.
+        """
+        self.__check_value(value)
+
+        return self.__contains(value)
+
+    def insert_many(self, values: Iterable[T]) -> int:
+        values = sorted(values)
+        self.__check_batch(values)
+        return sum(self.__insert(value) for value in values)
+
+    def remove_many(self, values: Iterable[T]) -> int:
+        values = sorted(values)
+        self.__check_batch(values)
+        return sum(self.__remove(value) for value in values)
+
+    def contains_many(self, values: Iterable[T]) -> list[bool]:
+        values = list(values)
+        self.__check_batch(values)
+        return [self.__contains(value) for value in values]
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Lazily iterates keys in ascending order
+
+        :return: Iterator over keys
+        """
+        return self.__iter_node(self.__root)
+
+    def to_list(self) -> list[T]:
+        """
+        Method converts tree to list in O(n) - ordered
+
+        Returns:
+            list: content of tree as list
+        """
+        content = list()
+        self.__collect(self.__root, content)
+        return content
+
+    def __iter_node(self, node: Node) -> Iterator[T]:
+        if not node.children:
+            yield from node.keys
+            return
+        for child, key in zip(node.children, node.keys):
+            yield from self.__iter_node(child)
+            yield key
+        yield from self.__iter_node(node.children[-1])
+
+    def __collect(self, node: Node, content: list[T]) -> None:
+        if not node.children:
+            content.extend(node.keys)
+            return
+        for child, key in zip(node.children, node.keys):
+            self.__collect(child, content)
+            content.append(key)
+        self.__collect(node.children[-1], content)
+
+    def __check_value(self, value: T) -> None:
+        # after the first check it costs a single identity test of the type
+        if self.__validate and type(value) is not self.__key_type:
+            if self.__key_type is None:
+                self.__key_type = self.__generic_type() or type(value)
+            typeCheck(self.__key_type, value)
+
+    def __check_batch(self, values: list[T]) -> None:
+        for value in dict(zip(map(type, values), values)).values():
+            self.__check_value(value)
+
+    def __generic_type(self) -> type | None:
+        # argument of BTree[int]() or of a base like BTree[int], None if there is none
+        orig_class = getattr(self, "__orig_class__", None)
+        if orig_class is not None:
+            return orig_class.__args__[0]
+        for cls in type(self).__mro__:
+            for base in getattr(cls, "__orig_bases__", ()):
+                origin = get_origin(base)
+                if isinstance(origin, type) and issubclass(origin, BTree) and \
+                        isinstance(get_args(base)[0], type):
+                    return get_args(base)[0]
+        return None
+
+    def __contains(self, key: T) -> bool:
+        node = self.__root
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return True
+            if not node.children:
+                return False
+            node = node.children[i]
+
+    def __insert(self, key: T) -> bool:
+        full = 2 * self.__degree - 1
+        node = self.__root
+        if len(node.keys) == full:
+            self.__root = Node([], [node])
+            self.__split_child(self.__root, 0)
+            node = self.__root
+
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return False
+            if not node.children:
+                keys.insert(i, key)
+                self.size += 1
+                return True
+            if len(node.children[i].keys) == full:
+                self.__split_child(node, i)
+                if keys[i] == key:
+                    return False
+                if keys[i] < key:
+                    i += 1
+            node = node.children[i]
+
+    def __split_child(self, node: Node, i: int) -> None:
+        """
+        Splits full i-th child of node, its middle key moves up to node
+
+        :param node: The parent of the full child
+        :param i: Index of the full child
+        """
+        child = node.children[i]
+        degree = self.__degree
+        right = Node(child.keys[degree:], child.children[degree:])
+        node.keys.insert(i, child.keys[degree - 1])
+        node.children.insert(i + 1, right)
+        del child.keys[degree - 1:]
+        del child.children[degree:]
+
+    def __remove(self, key: T) -> bool:
+        degree = self.__degree
+        node = self.__root
+        removed = False
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                if not node.children:
+                    del keys[i]
+                    removed = True
+                    break
+                left, right = node.children[i], node.children[i + 1]
+                if len(left.keys) >= degree:
+                    # replace key by its predecessor and remove that one from left
+                    key = self.__maximum(left)
+                    keys[i] = key
+                    node = left
+                elif len(right.keys) >= degree:
+                    key = self.__minimum(right)
+                    keys[i] = key
+                    node = right
+                else:
+                    self.__merge(node, i)
+                    node = left
+            else:
+                if not node.children:
+                    break
+                if len(node.children[i].keys) < degree:
+                    i = self.__fill(node, i)
+                node = node.children[i]
+
+        if not self.__root.keys and self.__root.children:
+            self.__root = self.__root.children[0]
+        if removed:
+            self.size -= 1
+        return removed
+
+    def __fill(self, node: Node, i: int) -> int:
+        """
+        Gives i-th child of node at least degree keys, borrowing a key
+        from a sibling or merging the child with it
+
+        :param node: The parent of the thin child
+        :param i: Index of the thin child
+        :return: Index of the child holding the keys of the original child
+        """
+        child = node.children[i]
+        if i > 0 and len(node.children[i - 1].keys) >= self.__degree:
+            left = node.children[i - 1]
+            child.keys.insert(0, node.keys[i - 1])
+            node.keys[i - 1] = left.keys.pop()
+            if left.children:
+                child.children.insert(0, left.children.pop())
+            return i
+        if i < len(node.keys) and len(node.children[i + 1].keys) >= self.__degree:
+            right = node.children[i + 1]
+            child.keys.append(node.keys[i])
+            node.keys[i] = right.keys.pop(0)
+            if right.children:
+                child.children.append(right.children.pop(0))
+            return i
+        if i < len(node.keys):
+            self.__merge(node, i)
+            return i
+        self.__merge(node, i - 1)
+        return i - 1
+
+    def __merge(self, node: Node, i: int) -> None:
+        """
+        Merges (i+1)-th child of node and the key between into i-th child
+
+        :param node: The parent of the children
+        :param i: Index of the left child
+        """
+        left = node.children[i]
+        right = node.children.pop(i + 1)
+        left.keys.append(node.keys.pop(i))
+        left.keys.extend(right.keys)
+        left.children.extend(right.children)
+
+    def __minimum(self, node: Node) -> T:
+        while node.children:
+            node = node.children[0]
+        return node.keys[0]
+
+    def __maximum(self, node: Node) -> T:
+        while node.children:
+            node = node.children[-1]
+        return node.keys[-1]
@@ -1,5 +1,6 @@
-from typing import TypeVar, Generic
-from Structures import Node
+from typing import TypeVar, Generic, Iterable, get_args, get_origin
+from Structures.Node import Node
+from Structures.Traversal import in_order
 
 T = TypeVar('T')
 
@@ -13,37 +14,126 @@ def typeCheck(gen_class, value):
 
 
 class BinarySearchTree(Generic[T]):
+    # class of created nodes, balanced subclasses keep their balance data in it
+    _node_class: type = Node
 
-    def __init__(self) -> None:
+    def __init__(self, validate: bool = True, key_type: type | None = None) -> None:
         self.size: int = 0
         self.root: Node[T] | None = None
+        # validate=False trusts callers, key_type is resolved on the first check if omitted
+        self.__validate: bool = validate
+        self.__key_type: type | None = key_type
+
+    @property
+    def key_type(self) -> type | None:
+        if self.__key_type is None:
+            self.__key_type = self.__generic_type()
+        return self.__key_type
 
     def insert(self, key: T) -> bool:
-        typeCheck(self.__orig_class__.__args__[0], key)
+        if self.__validate and type(key) is not self.__key_type:
+            self.__check_type(key)
 
-        if self.contains(key):
-            return False
+        return self.__insert_from(self.root, key)[1]
 
-        self.size += 1
+    def remove(self, key: T) -> None:
 
-        node = Node(key)
+        if self.__validate and type(key) is not self.__key_type:
+            self.__check_type(key)
 
-        if self.root is None:
-            self.root = node
-            return True
+        x = self.__find(self.root, key)
+
+        if x is None:
+            return
+
+        self._remove_node(x)
+
+    def contains(self, key: T) -> bool:
+        return self.__find(self.root, key) is not None
+
+    def insert_many(self, keys: Iterable[T]) -> int:
+        keys = sorted(keys)
+        self.__check_batch(keys)
+
+        # every search continues from the previous insertion point
+        inserted = 0
+        finger = None
+        for key in keys:
+            start = self.root if finger is None else self.__climb(finger, key)
+            finger, created = self.__insert_from(start, key)
+            inserted += created
+        return inserted
 
+    def remove_many(self, keys: Iterable[T]) -> int:
+        keys = sorted(keys)
+        self.__check_batch(keys)
+
+        removed = 0
+        finger = None
+        for key in keys:
+            start = self.root if finger is None else self.__climb(finger, key)
+            x, lower = self.__descend(start, key)
+            if x is not None:
+                self._remove_node(x)
+                removed += 1
+            # the lower ancestor survives the removal of x
+            if lower is not None:
+                finger = lower
+        return removed
+
+    def contains_many(self, keys: Iterable[T]) -> list[bool]:
+        keys = list(keys)
+        self.__check_batch(keys)
+
+        result = [False] * len(keys)
+        finger = None
+        for index in sorted(range(len(keys)), key=keys.__getitem__):
+            key = keys[index]
+            start = self.root if finger is None else self.__climb(finger, key)
+            x, lower = self.__descend(start, key)
+            if x is not None:
+                result[index] = True
+                finger = x
+            elif lower is not None:
+                finger = lower
+        return result
+
+    # hooks without type check, used by subclasses and instrumentation
+    def _insert_key(self, key: T, probe=None) -> tuple[Node, bool]:
+        # probe, if given, is compared with node keys in place of key
+        return self.__insert_from(self.root, key, probe)
+
+    def _find_node(self, key: T) -> Node | None:
+        return self.__find(self.root, key)
+
+    def _remove_node(self, x: Node) -> None:
+        self._unlink(x)
+
+    def _inserted(self, node: Node) -> None:
+        # called after a new leaf is linked, balanced subclasses restore their balance here
+        pass
+
+    def to_list(self) -> list[T]:
+        # iterative in-order walk, a degenerate tree would overflow the recursion
+        return [x.key for x in in_order(self.root)]
+
+    def __insert_from(self, start: Node | None, key: T, probe=None) -> tuple[Node, bool]:
         y = None
-        x = self.root
+        x = start
+        search = key if probe is None else probe
 
         while x is not None:
             y = x
-            if node.key == x.key:
-                break
-            elif node.key < x.key:
+            if search == x.key:
+                return x, False
+            elif search < x.key:
                 x = x.left_child
             else:
                 x = x.right_child
 
+        self.size += 1
+
+        node = self._node_class(key)
         node.parent = y
         if y is None:
             self.root = node
@@ -51,49 +141,61 @@ class BinarySearchTree(Generic[T]):
             y.left_child = node
         else:
             y.right_child = node
-        return True
-
-    def remove(self, key: T) -> None:
+        self._inserted(node)
+        return node, True
 
-        typeCheck(self.__orig_class__.__args__[0], key)
-
-        x = self.__find(self.root, key)
-
-        if x == self.root:
-            to_find = self.root
+    def _unlink(self, x: Node) -> Node | None:
+        # removes x and returns the lowest node whose subtree lost a node (None for the root)
+        # If node has at most one child, the child takes its place
+        if x.left_child is None:
+            lowest = x.parent
+            self.__transplant(x, x.right_child)
+        elif x.right_child is None:
+            lowest = x.parent
+            self.__transplant(x, x.left_child)
+        # else the minimum of right subtree takes its place
         else:
-            to_find = x.parent
+            y = self.__minimum(x.right_child)
+            lowest = y
+            if y.parent is not x:
+                lowest = y.parent
+                self.__transplant(y, y.right_child)
+                y.right_child = x.right_child
+                y.right_child.parent = y
+            self.__transplant(x, y)
+            y.left_child = x.left_child
+            y.left_child.parent = y
+        self.size -= 1
+        return lowest
 
-        if x is None:
-            return
+    def _rotate_left(self, x: Node) -> None:
+        # right child of x takes its place, x becomes its left child
+        y = x.right_child
+        x.right_child = y.left_child
+        if y.left_child is not None:
+            y.left_child.parent = x
+        self.__transplant(x, y)
+        y.left_child = x
+        x.parent = y
 
-        # If node has not any child
-        if x.right_child is None and x.left_child is None:
-            if to_find.left_child is x:
-                to_find.left_child = None
-            else:
-                to_find.right_child = None
-        # else if node has only right child
-        elif x.right_child is None and x.left_child is not None:
-            if to_find.left_child is x:
-                to_find.left_child = x.left_child
-            else:
-                to_find.right_child = x.left_child
-        # else if node has only left child
-        elif x.right_child is not None and x.left_child is None:
-            if to_find.left_child is x:
-                to_find.left_child = x.right_child
-            else:
-                to_find.right_child = x.right_child
-        # else if node has no children
-        else:
-            right_minimum = self.__minimum(x.right_child)
-            self.remove(right_minimum.key)
-            x.key = right_minimum.key
-        self.size -= 1
+    def _rotate_right(self, x: Node) -> None:
+        y = x.left_child
+        x.left_child = y.right_child
+        if y.right_child is not None:
+            y.right_child.parent = x
+        self.__transplant(x, y)
+        y.right_child = x
+        x.parent = y
 
-    def contains(self, key: T) -> bool:
-        return self.__find(self.root, key) is not None
+    def __transplant(self, x: Node, y: Node | None) -> None:
+        if x.parent is None:
+            self.root = y
+        elif x is x.parent.left_child:
+            x.parent.left_child = y
+        else:
+            x.parent.right_child = y
+        if y is not None:
+            y.parent = x.parent
 
     def __find(self, x: Node, key: T) -> Node | None:
         while x is not None and key != x.key:
@@ -103,6 +205,54 @@ class BinarySearchTree(Generic[T]):
                 x = x.right_child
         return x
 
+    def __descend(self, x: Node | None, key: T) -> tuple[Node | None, Node | None]:
+        # returns node with key (or None) and the last node on the path with a smaller key
+        lower = None
+        while x is not None and key != x.key:
+            if key < x.key:
+                x = x.left_child
+            else:
+                lower = x
+                x = x.right_child
+        return x, lower
+
+    def __climb(self, finger: Node, key: T) -> Node:
+        # lowest ancestor of finger (finger.key <= key) whose subtree holds place of key
+        while finger.parent is not None and not key < finger.parent.key:
+            finger = finger.parent
+        return finger
+
+    def __check_batch(self, keys: list[T]) -> None:
+        # datatype is checked once per distinct type of the batch
+        if not self.__validate:
+            return
+        for key_type, key in dict(zip(map(type, keys), keys)).items():
+            if key_type is not self.__key_type:
+                self.__check_type(key)
+
+    def _check_value(self, key: T) -> None:
+        if self.__validate and type(key) is not self.__key_type:
+            self.__check_type(key)
+
+    def __check_type(self, key: T) -> None:
+        # the datatype is resolved once, afterwards only keys of another type get here
+        if self.__key_type is None:
+            self.__key_type = self.__generic_type() or type(key)
+        typeCheck(self.__key_type, key)
+
+    def __generic_type(self) -> type | None:
+        # argument of BinarySearchTree[int]() or of a base like BinarySearchTree[int]
+        orig_class = getattr(self, "__orig_class__", None)
+        if orig_class is not None:
+            return orig_class.__args__[0]
+        for cls in type(self).__mro__:
+            for base in getattr(cls, "__orig_bases__", ()):
+                origin = get_origin(base)
+                if isinstance(origin, type) and issubclass(origin, BinarySearchTree) and \
+                        isinstance(get_args(base)[0], type):
+                    return get_args(base)[0]
+        return None
+
     def __minimum(self, node: Node) -> Node:
         while node.left_child is not None:
             node = node.left_child
@@ -0,0 +1,171 @@
+import threading
+from contextlib import contextmanager
+from typing import TypeVar, Generic, Iterable, Iterator
+
+from AlgorithmLibrary.persistent_red_black_tree import PersistentRedBlackTree
+
+T = TypeVar('T')
+
+
+class ConcurrentTree(Generic[T]):
+    """
+    A thread-safe wrapper of a search tree, by default of a new PersistentRedBlackTree.
+
+    Changes run under an exclusive lock, a batch takes the lock once for all
+    its keys. Any tree with the insert / remove / contains API can be wrapped,
+    e.g. RedBlackTree or BinarySearchTree.
+
+    Only a PersistentRedBlackTree lets readers run in parallel: every change
+    publishes a new snapshot of the tree in O(1) and readers search the last
+    published one without any lock, so they never wait for writers nor for
+    each other. Use it, the default, whenever reads should scale.
+
+    Any other tree gives no read parallelism at all: its searches take the same
+    plain lock as changes, so readers are serialized with each other and with
+    writers. A shared reader-writer lock would not help: the interpreter lock
+    runs the searches one at a time anyway, and the bookkeeping of a shared lock
+    costs more than a single contains call.
+
+    ...
+
+    Attributes
+    ----------
+    __tree : any
+        The wrapped tree
+    __lock : threading.Lock
+        Lock guarding the tree
+    __published : PersistentRedBlackTree[T] | None
+        Snapshot read by readers, None when the tree is not persistent
+
+    Methods
+    -------
+    insert(value: T), remove(value: T)
+        Changes the tree under the lock
+    contains(value: T)
+        Searches the published snapshot, or the tree under the lock
+    reading(), writing()
+        Context managers giving the tree to several calls under one lock
+    snapshot()
+        Returns the published snapshot of persistent tree
+    """
+
+    def __init__(self, tree=None) -> None:
+        """
+        It wraps the tree. The tree must not be used directly afterwards.
+
+        :param tree: The tree to wrap, None for a new PersistentRedBlackTree
+        whose readers do not take the lock
+        """
+        self.__tree = PersistentRedBlackTree() if tree is None else tree
+        self.__lock: threading.Lock = threading.Lock()
+        self.__published: PersistentRedBlackTree[T] | None = None
+        self.__publish()
+
+    def __publish(self) -> None:
+        # called by writers under the lock, the assignment is atomic for readers
+        if isinstance(self.__tree, PersistentRedBlackTree):
+            self.__published = self.__tree.snapshot()
+
+    @property
+    def size(self) -> int:
+        published = self.__published
+        if published is not None:
+            return published.size
+        with self.__lock:
+            return self.__tree.size
+
+    def insert(self, value: T) -> bool:
+        with self.__lock:
+            inserted = self.__tree.insert(value)
+            self.__publish()
+            return inserted
+
+    def remove(self, value: T) -> None:
+        with self.__lock:
+            self.__tree.remove(value)
+            self.__publish()
+
+    def contains(self, value: T) -> bool:
+        published = self.__published
+        if published is not None:
+            return published.contains(value)
+        with self.__lock:
+            return self.__tree.contains(value)
+
+    def insert_many(self, values: Iterable[T]) -> int:
+        values = list(values)
+        with self.__lock:
+            if self.__published is None:
+                return self.__tree.insert_many(values)
+            try:
+                return sum(self.__tree.insert(value) for value in values)
+            finally:
+                self.__publish()
+
+    def remove_many(self, values: Iterable[T]) -> int:
+        values = list(values)
+        with self.__lock:
+            if self.__published is None:
+                return self.__tree.remove_many(values)
+            try:
+                size = self.__tree.size
+                for value in values:
+                    self.__tree.remove(value)
+                return size - self.__tree.size
+            finally:
+                self.__publish()
+
+    def contains_many(self, values: Iterable[T]) -> list[bool]:
+        values = list(values)
+        published = self.__published
+        if published is not None:
+            return [published.contains(value) for value in values]
+        with self.__lock:
+            return self.__tree.contains_many(values)
+
+    def to_list(self) -> list[T]:
+        published = self.__published
+        if published is not None:
+            return published.to_list()
+        with self.__lock:
+            return self.__tree.to_list()
+
+    @contextmanager
+    def reading(self) -> Iterator:
+        """
+        Gives the block the published snapshot of persistent tree, other trees
+        under the lock. The block must not change the tree.
+
+        :return: The snapshot or the wrapped tree
+        """
+        published = self.__published
+        if published is not None:
+            yield published
+            return
+        with self.__lock:
+            yield self.__tree
+
+    @contextmanager
+    def writing(self) -> Iterator:
+        """
+        Holds the lock for the block and gives it the wrapped tree
+
+        :return: The wrapped tree
+        """
+        with self.__lock:
+            try:
+                yield self.__tree
+            finally:
+                self.__publish()
+
+    def snapshot(self) -> PersistentRedBlackTree[T]:
+        """
+        Returns the last published snapshot of the wrapped persistent tree
+        (PersistentRedBlackTree). The snapshot never changes.
+
+        :return: The snapshot
+        """
+        published = self.__published
+        if published is None:
+            raise TypeError("Only a persistent tree has snapshots")
+        return published
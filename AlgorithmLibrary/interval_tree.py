@@ -0,0 +1,162 @@
+from typing import Any, Iterable, Iterator
+
+from AlgorithmLibrary.red_black_tree import RedBlackTree, NIL
+from Structures.IntervalNode import IntervalNode
+from Structures.OrderStatisticIntervalNode import OrderStatisticIntervalNode
+
+
+class IntervalTree(RedBlackTree[tuple]):
+    """
+    A class that represent interval tree built on Red-black tree.
+
+    Keys are closed intervals as pairs (low, high) with low <= high, ordered by low
+    and then by high. Every node keeps the greatest high endpoint of its subtree,
+    recomputed bottom up wherever the subtree changes, rotations included. A query
+    walks the intervals in order and skips every subtree whose greatest endpoint
+    lies before the query, so it visits only paths to the reported intervals:
+    O(min(n, (k + 1) log n)) for k reported intervals.
+    All methods of RedBlackTree work on the intervals.
+
+    ...
+
+    Methods
+    -------
+    overlapping(low: Any, high: Any)
+        Lazily iterates intervals which overlap [low, high]
+    stabbing(point: Any)
+        Lazily iterates intervals which contain point
+    """
+    _node_class: type = IntervalNode
+    _order_statistic_node_class: type = OrderStatisticIntervalNode
+    _keyed_node_class: type | None = None
+    _keyed_order_statistic_node_class: type | None = None
+    _multiset_node_class: type | None = None
+    _multiset_order_statistic_node_class: type | None = None
+    _augmented: bool = True
+
+    def __init__(self, order_statistics: bool = False, key: None = None,
+                 validate: bool = True, key_type: type | None = tuple,
+                 multiset: bool = False) -> None:
+        """
+        It initializes the tree.
+
+        :param order_statistics: Keep subtree sizes in nodes as well
+        :type order_statistics: bool
+        :param validate: Check intervals, False trusts callers entirely
+        :type validate: bool
+        :param key_type: Keys are always tuples, only tuple or None is accepted
+        :type key_type: type | None
+        """
+        _check_key_type(key_type)
+        super().__init__(order_statistics, key, validate, tuple, multiset)
+        self.__order_statistics: bool = order_statistics
+        self.__validate: bool = validate
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable[tuple], key_type: type | None = tuple,
+                    order_statistics: bool = False, key: None = None,
+                    multiset: bool = False) -> 'IntervalTree':
+        """
+        Builds the tree from intervals in ascending order in O(n), the greatest
+        endpoints are computed bottom up during the build
+
+        :param iterable: The intervals in ascending order
+        :type iterable: Iterable[tuple]
+        :param key_type: Keys are always tuples, only tuple or None is accepted
+        :type key_type: type | None
+        :param order_statistics: Keep subtree sizes in nodes
+        :type order_statistics: bool
+        :return: The new tree
+        """
+        _check_key_type(key_type)
+        intervals = list(iterable)
+        for interval in intervals:
+            _check_interval(interval)
+        return super().from_sorted(intervals, tuple, order_statistics, key, multiset)
+
+    def insert(self, value: tuple) -> bool:
+        """
+        Inserts interval (low, high)
+
+        :param value: The interval to be inserted into the tree
+        :type value: tuple
+        :return: value is not in the tree return true, otherwise false
+        """
+        if self.__validate:
+            _check_interval(value)
+
+        return super().insert(value)
+
+    def insert_many(self, values: Iterable[tuple]) -> int:
+        values = list(values)
+        if self.__validate:
+            for value in values:
+                _check_interval(value)
+        return super().insert_many(values)
+
+    def _check_value(self, value: tuple) -> None:
+        # callers of the hook, like trees with stats enabled, get intervals checked as well
+        if self.__validate:
+            _check_interval(value)
+
+    def _augment(self, node: IntervalNode) -> None:
+        if self.__order_statistics:
+            super()._augment(node)
+        max_high = node.key[1]
+        left, right = node.left_child, node.right_child
+        if left is not NIL and max_high < left.max_high:
+            max_high = left.max_high
+        if right is not NIL and max_high < right.max_high:
+            max_high = right.max_high
+        node.max_high = max_high
+
+    def overlapping(self, low: Any, high: Any) -> Iterator[tuple]:
+        """
+        Lazily iterates intervals (a, b) with a <= high and low <= b in ascending order.
+        Subtrees whose greatest endpoint is smaller than low are skipped and the walk
+        stops at the first interval starting after high.
+
+        :param low: Lower bound of the query window
+        :param high: Upper bound of the query window
+        :return: Iterator over the overlapping intervals
+        """
+        if high < low:
+            return
+        stack = []
+        node = self._root_node() or NIL
+        while True:
+            while node is not NIL and not node.max_high < low:
+                stack.append(node)
+                node = node.left_child
+            if not stack:
+                return
+            node = stack.pop()
+            start, end = node.key
+            if high < start:
+                return
+            if not end < low:
+                yield node.key
+            node = node.right_child
+
+    def stabbing(self, point: Any) -> Iterator[tuple]:
+        """
+        Lazily iterates intervals (a, b) with a <= point <= b in ascending order
+
+        :param point: The query point
+        :return: Iterator over the intervals containing point
+        """
+        return self.overlapping(point, point)
+
+
+def _check_key_type(key_type: type | None) -> None:
+    if key_type is not None and key_type is not tuple:
+        raise TypeError("Keys of IntervalTree are tuples, but got key_type: " +
+                        getattr(key_type, "__name__", str(key_type)))
+
+
+def _check_interval(value: tuple) -> None:
+    if type(value) is not tuple:
+        raise TypeError("Invalid datatype. Expected: tuple, but got: " + type(value).__name__)
+    if len(value) != 2 or value[1] < value[0]:
+        raise ValueError("Interval must be a pair (low, high) with low <= high, got: " +
+                         str(value))
@@ -0,0 +1,305 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import TypeVar, Generic, Iterable, Iterator
+
+from AlgorithmLibrary.red_black_tree import typeCheck
+
+T = TypeVar('T', int, float, str)
+
+# magic, format version, key kind, byte order, number of keys
+HEADER = struct.Struct('<4sBBBxQ')
+# length prefix of a string record
+LENGTH = struct.Struct('<I')
+MAGIC = b'RBTS'
+VERSION = 1
+BYTE_ORDER = {'little': 0, 'big': 1}
+
+# kind stored in the header -> key datatype and array typecode of fixed-width keys
+_KEY_TYPES: dict[int, type] = {0: int, 1: float, 2: str}
+_KINDS: dict[type, int] = {key_type: kind for kind, key_type in _KEY_TYPES.items()}
+_TYPECODES: dict[type, str] = {int: 'q', float: 'd'}
+
+
+def save_keys(path: str, keys: Iterable[T], key_type: type | None) -> int:
+    """
+    Writes keys in ascending order as a binary image. After the header follows an array
+    of 64-bit ints or floats, or for strings a table of 64-bit record offsets followed
+    by records of 32-bit length and UTF-8 bytes. Numbers use the byte order of the machine.
+    Int keys must fit into 64 bits, the datatype must be known even for no keys.
+
+    :param path: Path of the file to write
+    :type path: str
+    :param keys: Unique keys in ascending order
+    :type keys: Iterable[T]
+    :param key_type: The datatype of keys, int, float or str
+    :type key_type: type | None
+    :return: Number of written keys
+    """
+    # keys are checked before the file is opened, a rejected call leaves it untouched
+    if key_type is None:
+        raise TypeError("Datatype of keys is unknown, give the tree a key_type to save it")
+    if key_type not in _KINDS:
+        raise TypeError("Invalid datatype. Expected: int, float or str, but got: " +
+                        getattr(key_type, "__name__", str(key_type)))
+
+    if key_type is str:
+        records = [key.encode() for key in keys]
+        offsets = array('Q')
+        position = HEADER.size + offsets.itemsize * len(records)
+        for record in records:
+            offsets.append(position)
+            position += LENGTH.size + len(record)
+        with open(path, 'wb') as file:
+            file.write(_header(str, len(records)))
+            offsets.tofile(file)
+            for record in records:
+                file.write(LENGTH.pack(len(record)))
+                file.write(record)
+        return len(records)
+
+    try:
+        values = array(_TYPECODES[key_type], keys)
+    except OverflowError:
+        raise ValueError("Int keys must fit into 64 bits to be saved") from None
+    with open(path, 'wb') as file:
+        file.write(_header(key_type, len(values)))
+        values.tofile(file)
+    return len(values)
+
+
+def load_mmap(path: str) -> 'MappedSortedSet':
+    """
+    Opens a file written by save_keys() or RedBlackTree.save() as a read-only set
+
+    :param path: Path of the file
+    :type path: str
+    :return: The memory-mapped set
+    """
+    return MappedSortedSet(path)
+
+
+def _header(key_type: type, count: int) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, _KINDS[key_type], BYTE_ORDER[sys.byteorder], count)
+
+
+class _StringRecords:
+    """
+    Sequence of UTF-8 encoded keys read from the records on demand.
+    UTF-8 bytes sort in the same order as the strings, so bisect works on them directly.
+    """
+    __slots__ = ('__buffer', '__offsets')
+
+    def __init__(self, buffer: mmap.mmap, offsets: memoryview) -> None:
+        self.__buffer = buffer
+        self.__offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    def __getitem__(self, index: int) -> bytes:
+        start = self.__offsets[index]
+        length = LENGTH.unpack_from(self.__buffer, start)[0]
+        start += LENGTH.size
+        return self.__buffer[start:start + length]
+
+
+class MappedSortedSet(Generic[T]):
+    """
+    A class that represent read-only sorted set answered directly from a memory-mapped file.
+
+    Opening the set only maps the file, no key is read and no node is built. Queries
+    bisect the mapped keys, so they run in O(log n) and touch only the pages they
+    need. The file is written by RedBlackTree.save() or save_keys().
+
+    ...
+
+    Attributes
+    ----------
+    size : int
+        Number of keys
+    __key_type : type
+        The datatype of keys, read from the header
+    __buffer : mmap.mmap
+        The mapped file
+    __keys : memoryview | _StringRecords
+        Keys in ascending order, numbers as they are and strings encoded
+
+    Methods
+    -------
+    contains(value: T)
+        Search for value of datatype T in the set
+    rank(value: T)
+        Returns number of keys smaller than value
+    count_range(low: T, high: T)
+        Returns number of keys between low and high
+    irange(low: T | None, high: T | None, inclusive: tuple[bool, bool])
+        Lazily iterates keys between low and high
+    select(index: int)
+        Returns the key at index in sorted order
+    close()
+        Unmaps the file
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        It maps the file.
+
+        :param path: Path of the file written by save_keys()
+        :type path: str
+        """
+        with open(path, 'rb') as file:
+            self.__buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.__buffer) < HEADER.size:
+            self.__buffer.close()
+            raise ValueError("File is too short to be a saved tree: " + path)
+        magic, version, kind, byte_order, count = HEADER.unpack_from(self.__buffer)
+        if magic != MAGIC or version != VERSION or kind not in _KEY_TYPES:
+            self.__buffer.close()
+            raise ValueError("File is not a saved tree of a known version: " + path)
+        if byte_order != BYTE_ORDER[sys.byteorder]:
+            self.__buffer.close()
+            raise ValueError("File was saved on a machine with different byte order: " + path)
+        if len(self.__buffer) < HEADER.size + 8 * count:
+            self.__buffer.close()
+            raise ValueError("File is truncated: " + path)
+
+        self.size: int = count
+        self.__key_type: type = _KEY_TYPES[kind]
+        self.__view = memoryview(self.__buffer)
+        if self.__key_type is str:
+            self.__array = self.__view[HEADER.size:HEADER.size + 8 * count].cast('Q')
+            self.__keys = _StringRecords(self.__buffer, self.__array)
+        else:
+            self.__array = self.__view[HEADER.size:HEADER.size + 8 * count] \
+                .cast(_TYPECODES[self.__key_type])
+            self.__keys = self.__array
+
+    @property
+    def key_type(self) -> type:
+        return self.__key_type
+
+    def __enter__(self) -> 'MappedSortedSet[T]':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps the file, the set cannot be used afterwards
+        """
+        if self.__buffer.closed:
+            return
+        self.__keys = None
+        self.__array.release()
+        self.__view.release()
+        self.__buffer.close()
+
+    def contains(self, value: T) -> bool:
+        """
+        If the key is in the set, return True, otherwise return False
+
+        :param value: The key to search for
+        :type value: T
+        :return: The value of the key.
+        """
+        typeCheck(self.__key_type, value)
+
+        key = self.__encode(value)
+        index = bisect_left(self.__keys, key)
+        return index < self.size and self.__keys[index] == key
+
+    def rank(self, value: T) -> int:
+        """
+        Returns number of keys smaller than value
+
+        :param value: The key to rank
+        :type value: T
+        :return: Number of smaller keys
+        """
+        typeCheck(self.__key_type, value)
+
+        return bisect_left(self.__keys, self.__encode(value))
+
+    def count_range(self, low: T, high: T) -> int:
+        """
+        Returns number of keys k with low <= k <= high
+
+        :param low: Lower bound of the range
+        :type low: T
+        :param high: Upper bound of the range
+        :type high: T
+        :return: Number of keys in the range
+        """
+        typeCheck(self.__key_type, low)
+        typeCheck(self.__key_type, high)
+
+        if high < low:
+            return 0
+        return bisect_right(self.__keys, self.__encode(high)) - \
+            bisect_left(self.__keys, self.__encode(low))
+
+    def select(self, index: int) -> T:
+        """
+        Returns the key at index in sorted order, negative index counts from the end
+
+        :param index: Position of the key in to_list()
+        :type index: int
+        :return: The key at index
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range: " + str(index))
+        return self.__decode(self.__keys[index])
+
+    def irange(self, low: T | None = None, high: T | None = None,
+               inclusive: tuple[bool, bool] = (True, True)) -> Iterator[T]:
+        """
+        Lazily iterates keys between low and high in ascending order
+
+        :param low: Lower bound, None means no bound
+        :type low: T | None
+        :param high: Upper bound, None means no bound
+        :type high: T | None
+        :param inclusive: Whether low and high themselves are included
+        :type inclusive: tuple[bool, bool]
+        :return: Iterator over keys in the range
+        """
+        start, stop = 0, self.size
+        if low is not None:
+            typeCheck(self.__key_type, low)
+            search = bisect_left if inclusive[0] else bisect_right
+            start = search(self.__keys, self.__encode(low))
+        if high is not None:
+            typeCheck(self.__key_type, high)
+            search = bisect_right if inclusive[1] else bisect_left
+            stop = search(self.__keys, self.__encode(high))
+
+        keys = self.__keys
+        for index in range(start, stop):
+            yield self.__decode(keys[index])
+
+    def __iter__(self) -> Iterator[T]:
+        return self.irange()
+
+    def to_list(self) -> list[T]:
+        """
+        Method converts set to list in O(n) - ordered
+
+        Returns:
+            list: content of set as list
+        """
+        if self.__key_type is str:
+            return list(self)
+        return self.__array.tolist()
+
+    def __encode(self, value: T):
+        return value.encode() if self.__key_type is str else value
+
+    def __decode(self, key) -> T:
+        return key.decode() if self.__key_type is str else key
@@ -0,0 +1,341 @@
+from bisect import bisect_left, insort
+from typing import TypeVar, Generic, Iterable, Iterator, get_args, get_origin
+
+import numpy as np
+
+from AlgorithmLibrary.red_black_tree import RedBlackTree, typeCheck
+
+T = TypeVar('T', int, float)
+
+# numpy kinds of arrays accepted for int and float keys
+_KINDS: dict[type, str] = {int: "iu", float: "iuf"}
+_DTYPES: dict[type, type] = {int: np.int64, float: np.float64}
+# int keys are stored as np.int64, larger ones cannot be merged into the array
+_INT64_MIN: int = int(np.iinfo(np.int64).min)
+_INT64_MAX: int = int(np.iinfo(np.int64).max)
+
+
+class NumericSortedSet(Generic[T]):
+    """
+    A class that represent sorted set of int or float keys stored in NumPy arrays.
+
+    Keys live in one sorted array, batches of lookups are answered by a single
+    np.searchsorted call. Inserts go to a small sorted delta buffer and removals of
+    keys in the array to a set of deleted keys; once both together exceed the
+    buffer limit they are merged into the array in bulk. Int keys are stored as
+    np.int64, keys out of its range are rejected with ValueError.
+
+    ...
+
+    Attributes
+    ----------
+    __keys : np.ndarray
+        sorted unique keys, including deleted ones until the next merge
+    __inserted : list[T]
+        sorted keys inserted since the last merge
+    __deleted : set[T]
+        keys of __keys removed since the last merge
+    __buffer_limit : int
+        maximal number of buffered changes
+    __validate : bool
+        Whether datatype and range of keys are checked
+    __type : type | None
+        The datatype of keys, resolved on the first use
+
+    Methods
+    -------
+    insert(value: T), remove(value: T), contains(value: T)
+        Changes or searches single key
+    contains_many(values: Iterable[T])
+        Vectorized membership of a batch
+    rank_many(values: Iterable[T])
+        Vectorized number of smaller keys for a batch
+    from_tree(tree: RedBlackTree), to_tree()
+        Converts from and to RedBlackTree in O(n)
+    """
+
+    def __init__(self, buffer_limit: int = 4096, validate: bool = True,
+                 key_type: type | None = None) -> None:
+        """
+        It initializes the set.
+
+        :param buffer_limit: Number of buffered changes which triggers a merge
+        :type buffer_limit: int
+        :param validate: Check datatype and range of keys, False trusts callers entirely
+        :type validate: bool
+        :param key_type: int or float, by default the argument of the generic
+        (NumericSortedSet[int]) or the type of the first key
+        :type key_type: type | None
+        """
+        self.size: int = 0
+        self.__keys: np.ndarray | None = None
+        self.__inserted: list[T] = []
+        self.__deleted: set[T] = set()
+        self.__buffer_limit: int = buffer_limit
+        self.__validate: bool = validate
+        self.__type: type | None = None
+        if key_type is not None:
+            self.__set_type(key_type)
+
+    @classmethod
+    def from_tree(cls, tree: RedBlackTree, buffer_limit: int = 4096) -> 'NumericSortedSet[T]':
+        """
+        Builds the set from keys of RedBlackTree[int] or RedBlackTree[float] in O(n).
+        Keys of a multiset or of a tree with a key function are deduplicated and
+        sorted by value in O(n log n).
+
+        :param tree: The tree to convert
+        :type tree: RedBlackTree
+        :param buffer_limit: Number of buffered changes which triggers a merge
+        :type buffer_limit: int
+        :return: The new set
+        """
+        key_type = tree.key_type
+        if key_type not in _DTYPES:
+            raise TypeError("Invalid datatype. Expected: int or float, but got: " +
+                            getattr(key_type, "__name__", str(key_type)))
+        numeric_set = cls(buffer_limit, key_type=key_type)
+        try:
+            if tree.multiset or tree.key is not None:
+                # keys repeat or are ordered by the key function, they are sorted again
+                keys = np.unique(np.fromiter(tree, dtype=_DTYPES[key_type]))
+            else:
+                keys = np.fromiter(tree, dtype=_DTYPES[key_type], count=tree.size)
+        except OverflowError:
+            raise ValueError("Keys of the tree are out of the int64 range") from None
+        numeric_set.__keys = keys
+        numeric_set.size = len(keys)
+        return numeric_set
+
+    def to_tree(self, order_statistics: bool = False) -> RedBlackTree:
+        """
+        Converts the set to RedBlackTree in O(n)
+
+        :param order_statistics: Keep subtree sizes in nodes of the tree
+        :type order_statistics: bool
+        :return: The new tree
+        """
+        return RedBlackTree.from_sorted(self.to_list(), self.__key_type(), order_statistics)
+
+    def insert(self, value: T) -> bool:
+        """
+        Inserts value into the delta buffer
+
+        :param value: The value to be inserted into the set
+        :type value: T
+        :return: value is not in the set return true, otherwise false
+        """
+        self.__check_value(value)
+
+        if value in self.__deleted:
+            self.__deleted.remove(value)
+        elif self.__in_keys(value) or self.__in_inserted(value):
+            return False
+        else:
+            insort(self.__inserted, value)
+            self.__merge_if_full()
+        self.size += 1
+        return True
+
+    def remove(self, value: T) -> None:
+        """
+        If the value is in the set, remove it
+
+        :param value: The value to remove from the set
+        :type value: T
+        """
+        self.__check_value(value)
+
+        index = bisect_left(self.__inserted, value)
+        if index < len(self.__inserted) and self.__inserted[index] == value:
+            del self.__inserted[index]
+        elif value not in self.__deleted and self.__in_keys(value):
+            self.__deleted.add(value)
+            self.__merge_if_full()
+        else:
+            return
+        self.size -= 1
+
+    def contains(self, value: T) -> bool:
+        """
+        If the key is in the set, return True, otherwise return False
+
+        :param value: The key to search for
+        :type value: T
+        :return: The value of the key.
+        """
+        self.__check_value(value)
+
+        if value in self.__deleted:
+            return False
+        return self.__in_keys(value) or self.__in_inserted(value)
+
+    def contains_many(self, values: Iterable[T]) -> np.ndarray:
+        """
+        Searches for a batch of values with one np.searchsorted call
+
+        :param values: The keys to search for
+        :type values: Iterable[T]
+        :return: Boolean array, for every value whether it is in the set
+        """
+        queries = self.__as_array(values)
+        keys = self.__merged_keys()
+        index = self.__search(keys, queries)
+        found = index < len(keys)
+        found[found] = keys[index[found]] == queries[found]
+        return found
+
+    def rank_many(self, values: Iterable[T]) -> np.ndarray:
+        """
+        Counts keys smaller than each value of a batch with one np.searchsorted call
+
+        :param values: The keys to rank
+        :type values: Iterable[T]
+        :return: Integer array, for every value number of smaller keys
+        """
+        return self.__search(self.__merged_keys(), self.__as_array(values))
+
+    def rank(self, value: T) -> int:
+        """
+        Returns number of keys smaller than value
+
+        :param value: The key to rank
+        :type value: T
+        :return: Number of smaller keys
+        """
+        self.__check_value(value)
+
+        return int(np.searchsorted(self.__merged_keys(), value))
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.to_list())
+
+    def to_list(self) -> list[T]:
+        """
+        Method converts set to list in O(n) - ordered
+
+        Returns:
+            list: content of set as list
+        """
+        return self.__merged_keys().tolist()
+
+    def __key_type(self) -> type | None:
+        """
+        Returns the datatype of keys, None while it is not known yet
+        """
+        if self.__type is None:
+            generic_type = self.__generic_type()
+            if generic_type is not None:
+                self.__set_type(generic_type)
+        return self.__type
+
+    def __set_type(self, key_type: type) -> None:
+        if key_type not in _DTYPES:
+            raise TypeError("Invalid datatype. Expected: int or float, but got: " +
+                            getattr(key_type, "__name__", str(key_type)))
+        self.__type = key_type
+
+    def __generic_type(self) -> type | None:
+        # argument of NumericSortedSet[int]() or of a base like NumericSortedSet[int]
+        orig_class = getattr(self, "__orig_class__", None)
+        if orig_class is not None:
+            return orig_class.__args__[0]
+        for cls in type(self).__mro__:
+            for base in getattr(cls, "__orig_bases__", ()):
+                origin = get_origin(base)
+                if isinstance(origin, type) and issubclass(origin, NumericSortedSet) and \
+                        isinstance(get_args(base)[0], type):
+                    return get_args(base)[0]
+        return None
+
+    def __check_value(self, value: T) -> None:
+        # after the first check it costs a single identity test of the type
+        if type(value) is not self.__type:
+            if self.__key_type() is None:
+                self.__set_type(type(value))
+            if self.__validate:
+                typeCheck(self.__type, value)
+        if self.__validate and type(value) is int and not _INT64_MIN <= value <= _INT64_MAX:
+            raise ValueError("Key " + str(value) + " is out of the int64 range")
+
+    def __array(self) -> np.ndarray:
+        if self.__keys is None:
+            key_type = self.__key_type()
+            if key_type is None:
+                # no key was stored yet, the datatype comes with the first one
+                return np.empty(0)
+            self.__keys = np.empty(0, dtype=_DTYPES[key_type])
+        return self.__keys
+
+    def __as_array(self, values: Iterable[T]) -> np.ndarray:
+        """
+        Converts a batch to an array of the key datatype, rejecting other kinds of values
+        """
+        key_type = self.__key_type()
+        if not isinstance(values, np.ndarray):
+            values = list(values)
+        queries = np.asarray(values)
+        if key_type is None:
+            if not queries.size:
+                return queries.astype(np.float64)
+            # the datatype of an untyped set is taken from the batch like from a key
+            key_type = int if queries.dtype.kind in "iu" else \
+                float if queries.dtype.kind == "f" else type(queries.flat[0])
+            self.__set_type(key_type)
+        if not self.__validate:
+            return queries.astype(_DTYPES[key_type], copy=False)
+        # python ints beyond int64 make an array of uint64, float64 or objects
+        if key_type is int and queries.dtype.kind != "i":
+            items = values.tolist() if isinstance(values, np.ndarray) else values
+            if any(isinstance(item, int) and not _INT64_MIN <= item <= _INT64_MAX
+                   for item in items):
+                raise ValueError("Keys of the batch are out of the int64 range")
+        if queries.size and queries.dtype.kind not in _KINDS[key_type]:
+            raise TypeError("Invalid datatype. Expected: " + key_type.__name__ +
+                            ", but got array of: " + str(queries.dtype))
+        return queries.astype(_DTYPES[key_type], copy=False)
+
+    def __search(self, keys: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """
+        np.searchsorted of the queries. Large batches are sorted first, sorted queries
+        walk the keys in order and run about twice as fast as random ones.
+        """
+        if len(queries) < 1024:
+            return np.searchsorted(keys, queries)
+        order = np.argsort(queries, kind="stable")
+        index = np.empty(len(queries), dtype=np.intp)
+        index[order] = np.searchsorted(keys, queries[order])
+        return index
+
+    def __in_keys(self, value: T) -> bool:
+        keys = self.__array()
+        index = int(np.searchsorted(keys, value))
+        return index < len(keys) and keys[index] == value
+
+    def __in_inserted(self, value: T) -> bool:
+        index = bisect_left(self.__inserted, value)
+        return index < len(self.__inserted) and self.__inserted[index] == value
+
+    def __merge_if_full(self) -> None:
+        if len(self.__inserted) + len(self.__deleted) > self.__buffer_limit:
+            self.__merge()
+
+    def __merged_keys(self) -> np.ndarray:
+        if self.__inserted or self.__deleted:
+            self.__merge()
+        return self.__array()
+
+    def __merge(self) -> None:
+        """
+        Applies buffered removals and inserts to the key array in bulk
+        """
+        keys = self.__array()
+        if self.__deleted:
+            deleted = np.fromiter(self.__deleted, dtype=keys.dtype, count=len(self.__deleted))
+            keys = keys[~np.isin(keys, deleted, assume_unique=True)]
+        if self.__inserted:
+            inserted = np.asarray(self.__inserted, dtype=keys.dtype)
+            keys = np.insert(keys, np.searchsorted(keys, inserted), inserted)
+        self.__keys = keys
+        self.__inserted = []
+        self.__deleted = set()
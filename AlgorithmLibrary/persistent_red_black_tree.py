@@ -0,0 +1,319 @@
+from typing import TypeVar, Generic, Iterator, get_args, get_origin
+
+from AlgorithmLibrary.red_black_tree import typeCheck
+from Structures.Color import Color
+from Structures.PersistentNode import PersistentNode as Node
+from Structures.Traversal import in_order
+
+T = TypeVar('T')
+
+RED = Color.RED
+BLACK = Color.BLACK
+
+
+def _is_red(node: Node | None) -> bool:
+    return node is not None and node.color is RED
+
+
+def _is_black(node: Node | None) -> bool:
+    return node is not None and node.color is BLACK
+
+
+def _with_color(node: Node, color: Color) -> Node:
+    if node.color is color:
+        return node
+    return Node(color, node.left_child, node.key, node.right_child)
+
+
+class PersistentRedBlackTree(Generic[T]):
+    """
+    A class that represent persistent Red-black tree.
+
+    Nodes are immutable. Insert and remove copy only the nodes on the search
+    path and share everything else with the previous version, so a snapshot
+    is just a reference to the current root. Balancing follows the functional
+    algorithm of Okasaki (insertion) and Kahrs (deletion).
+
+    ...
+
+    Attributes
+    ----------
+    __root : Node[T] | None
+        Root of the tree
+    __read_only : bool
+        Whether the tree is a snapshot
+    __validate : bool
+        Whether datatype of keys is checked
+    __key_type : type | None
+        The datatype of keys, resolved on the first check
+
+    Methods
+    -------
+    insert(value: T)
+        Inserts value of datatype T into the tree
+    remove(value: T)
+        Removes value of datatype T from the tree
+    contains(value: T)
+        Search for value of datatype T in the tree
+    snapshot()
+        Returns immutable tree with the current content in O(1)
+    """
+
+    def __init__(self, validate: bool = True, key_type: type | None = None) -> None:
+        """
+        It initializes the tree.
+
+        :param validate: Check datatype of keys, False trusts callers entirely
+        :type validate: bool
+        :param key_type: The datatype of keys, by default the argument of the generic
+        (PersistentRedBlackTree[int]) or the type of the first key
+        :type key_type: type | None
+        """
+        self.size: int = 0
+        self.__root: Node[T] | None = None
+        self.__read_only: bool = False
+        self.__validate: bool = validate
+        self.__key_type: type | None = key_type
+
+    @property
+    def read_only(self) -> bool:
+        return self.__read_only
+
+    @property
+    def key_type(self) -> type | None:
+        if self.__key_type is None:
+            self.__key_type = self.__generic_type()
+        return self.__key_type
+
+    def snapshot(self) -> 'PersistentRedBlackTree[T]':
+        """
+        Returns read-only tree which shares all nodes with this tree. Later changes
+        of this tree copy their paths, so the snapshot never changes.
+
+        :return: The snapshot
+        """
+        tree = getattr(self, "__orig_class__", type(self))(self.__validate, self.__key_type)
+        tree.__root = self.__root
+        tree.size = self.size
+        tree.__read_only = True
+        return tree
+
+    def insert(self, value: T) -> bool:
+        """
+        Inserts value, copying the O(log n) nodes on its path
+
+        :param value: The value to be inserted into the tree
+        :type value: T
+        :return: value is not in the tree return true, otherwise false
+        """
+        self.__check_value(value)
+        self.__check_writable()
+
+        if self.__find(value) is not None:
+            return False
+
+        self.__root = _with_color(self.__insert(self.__root, value), BLACK)
+        self.size += 1
+        return True
+
+    def remove(self, value: T) -> None:
+        """
+        If the value is in the tree, remove it, copying the O(log n) nodes on its path
+
+        :param value: The value to remove from the tree
+        :type value: T
+        """
+        self.__check_value(value)
+        self.__check_writable()
+
+        if self.__find(value) is None:
+            return
+
+        root = self.__remove(self.__root, value)
+        self.__root = None if root is None else _with_color(root, BLACK)
+        self.size -= 1
+
+    def contains(self, value: T) -> bool:
+        """
+        If the key is in the tree, return True, otherwise return False
+
+        :param value: The key to search for
+        :type value: T
+        :return: The value of the key.
+        """
+        self.__check_value(value)
+
+        return self.__find(value) is not None
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Lazily iterates keys in ascending order with a stack of O(log n) nodes.
+        The iterated version stays consistent even if the tree changes meanwhile.
+
+        :return: Iterator over keys
+        """
+        for node in in_order(self.__root):
+            yield node.key
+
+    def to_list(self) -> list[T]:
+        """
+        Method converts tree to list in O(n) - ordered
+
+        Returns:
+            list: content of tree as list
+        """
+        return list(self)
+
+    def __check_value(self, value: T) -> None:
+        # after the first check it costs a single identity test of the type
+        if self.__validate and type(value) is not self.__key_type:
+            if self.__key_type is None:
+                self.__key_type = self.__generic_type() or type(value)
+            typeCheck(self.__key_type, value)
+
+    def __generic_type(self) -> type | None:
+        # argument of PersistentRedBlackTree[int]() or of a base like
+        # PersistentRedBlackTree[int], None if there is none
+        orig_class = getattr(self, "__orig_class__", None)
+        if orig_class is not None:
+            return orig_class.__args__[0]
+        for cls in type(self).__mro__:
+            for base in getattr(cls, "__orig_bases__", ()):
+                origin = get_origin(base)
+                if isinstance(origin, type) and issubclass(origin, PersistentRedBlackTree) and \
+                        isinstance(get_args(base)[0], type):
+                    return get_args(base)[0]
+        return None
+
+    def __check_writable(self) -> None:
+        if self.__read_only:
+            raise TypeError("Snapshot of the tree is read-only")
+
+    def __find(self, key: T) -> Node | None:
+        node = self.__root
+        while node is not None and key != node.key:
+            node = node.left_child if key < node.key else node.right_child
+        return node
+
+    def __insert(self, node: Node | None, key: T) -> Node:
+        """
+        Returns a copy of subtree node with key inserted, its root may be red with a red child
+
+        :param node: Root of the subtree
+        :param key: The key which is not in the subtree
+        :return: The new subtree
+        """
+        if node is None:
+            return Node(RED, None, key, None)
+        if key < node.key:
+            if node.color is BLACK:
+                return self.__balance(self.__insert(node.left_child, key), node.key,
+                                      node.right_child)
+            return Node(RED, self.__insert(node.left_child, key), node.key, node.right_child)
+        if node.color is BLACK:
+            return self.__balance(node.left_child, node.key,
+                                  self.__insert(node.right_child, key))
+        return Node(RED, node.left_child, node.key, self.__insert(node.right_child, key))
+
+    def __remove(self, node: Node | None, key: T) -> Node | None:
+        """
+        Returns a copy of subtree node without key. Removing from a black subtree
+        lowers its black height by one, the callers rebalance it.
+
+        :param node: Root of the subtree
+        :param key: The key which is in the subtree
+        :return: The new subtree
+        """
+        if node is None:
+            return None
+        if key < node.key:
+            if _is_black(node.left_child):
+                return self.__balance_left(self.__remove(node.left_child, key), node.key,
+                                           node.right_child)
+            return Node(RED, self.__remove(node.left_child, key), node.key, node.right_child)
+        if node.key < key:
+            if _is_black(node.right_child):
+                return self.__balance_right(node.left_child, node.key,
+                                            self.__remove(node.right_child, key))
+            return Node(RED, node.left_child, node.key, self.__remove(node.right_child, key))
+        return self.__append(node.left_child, node.right_child)
+
+    def __balance(self, left: Node | None, key: T, right: Node | None) -> Node:
+        """
+        Builds a black node, resolving a red child with a red child of its own
+        (or two red children) into a red node with two black children
+        """
+        if _is_red(left) and _is_red(right):
+            return Node(RED, _with_color(left, BLACK), key, _with_color(right, BLACK))
+        if _is_red(left):
+            if _is_red(left.left_child):
+                return Node(RED, _with_color(left.left_child, BLACK), left.key,
+                            Node(BLACK, left.right_child, key, right))
+            if _is_red(left.right_child):
+                inner = left.right_child
+                return Node(RED, Node(BLACK, left.left_child, left.key, inner.left_child),
+                            inner.key, Node(BLACK, inner.right_child, key, right))
+        if _is_red(right):
+            if _is_red(right.right_child):
+                return Node(RED, Node(BLACK, left, key, right.left_child), right.key,
+                            _with_color(right.right_child, BLACK))
+            if _is_red(right.left_child):
+                inner = right.left_child
+                return Node(RED, Node(BLACK, left, key, inner.left_child), inner.key,
+                            Node(BLACK, inner.right_child, right.key, right.right_child))
+        return Node(BLACK, left, key, right)
+
+    def __balance_left(self, left: Node | None, key: T, right: Node) -> Node:
+        """
+        Joins left subtree, whose black height dropped by one, with key and right subtree
+        """
+        if _is_red(left):
+            return Node(RED, _with_color(left, BLACK), key, right)
+        if _is_black(right):
+            return self.__balance(left, key, _with_color(right, RED))
+        inner = right.left_child
+        return Node(RED, Node(BLACK, left, key, inner.left_child), inner.key,
+                    self.__balance(inner.right_child, right.key,
+                                   _with_color(right.right_child, RED)))
+
+    def __balance_right(self, left: Node, key: T, right: Node | None) -> Node:
+        """
+        Joins left subtree with key and right subtree, whose black height dropped by one
+        """
+        if _is_red(right):
+            return Node(RED, left, key, _with_color(right, BLACK))
+        if _is_black(left):
+            return self.__balance(_with_color(left, RED), key, right)
+        inner = left.right_child
+        return Node(RED, self.__balance(_with_color(left.left_child, RED), left.key,
+                                        inner.left_child),
+                    inner.key, Node(BLACK, inner.right_child, key, right))
+
+    def __append(self, left: Node | None, right: Node | None) -> Node | None:
+        """
+        Concatenates two subtrees of equal black height, all keys of left are smaller
+        """
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if _is_red(left) and _is_red(right):
+            middle = self.__append(left.right_child, right.left_child)
+            if _is_red(middle):
+                return Node(RED, Node(RED, left.left_child, left.key, middle.left_child),
+                            middle.key,
+                            Node(RED, middle.right_child, right.key, right.right_child))
+            return Node(RED, left.left_child, left.key,
+                        Node(RED, middle, right.key, right.right_child))
+        if _is_black(left) and _is_black(right):
+            middle = self.__append(left.right_child, right.left_child)
+            if _is_red(middle):
+                return Node(RED, Node(BLACK, left.left_child, left.key, middle.left_child),
+                            middle.key,
+                            Node(BLACK, middle.right_child, right.key, right.right_child))
+            return self.__balance_left(left.left_child, left.key,
+                                       Node(BLACK, middle, right.key, right.right_child))
+        if _is_red(right):
+            return Node(RED, self.__append(left, right.left_child), right.key,
+                        right.right_child)
+        return Node(RED, left.left_child, left.key, self.__append(left.right_child, right))
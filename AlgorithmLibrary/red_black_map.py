@@ -0,0 +1,285 @@
+from collections.abc import ItemsView, Mapping, MutableMapping, ValuesView
+from operator import itemgetter
+from typing import TypeVar, Generic, Iterable, Iterator
+
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+from Structures.MapNode import MapNode
+from Structures.OrderStatisticMapNode import OrderStatisticMapNode
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+_MISSING = object()
+
+
+class _ItemsView(ItemsView):
+    """
+    Ordered view of (key, value) pairs which reads values from the nodes
+    """
+
+    def __iter__(self) -> Iterator[tuple]:
+        return self._mapping.irange_items()
+
+    def __reversed__(self) -> Iterator[tuple]:
+        node = self._mapping._last_node()
+        while node is not None:
+            yield node.key, node.value
+            node = self._mapping._predecessor_node(node)
+
+
+class _ValuesView(ValuesView):
+    """
+    Ordered view of values which reads them from the nodes
+    """
+
+    def __iter__(self) -> Iterator:
+        for _, value in self._mapping.irange_items():
+            yield value
+
+    def __reversed__(self) -> Iterator:
+        for _, value in reversed(self._mapping.items()):
+            yield value
+
+
+class RedBlackMap(RedBlackTree[K], MutableMapping, Generic[K, V]):
+    """
+    A class that represent sorted map built on Red-black tree.
+
+    Every node keeps the value next to its key, so each operation needs
+    a single descent and no parallel dictionary. Keys are iterated in
+    ascending order, all methods of RedBlackTree work on the keys.
+
+    ...
+
+    Methods
+    -------
+    from_sorted(items: Iterable[tuple[K, V]], key_type: type | None, order_statistics: bool)
+        Builds a map from pairs in ascending order of keys in O(n)
+    from_iterable(items: Mapping | Iterable[tuple[K, V]], key_type: type | None,
+                  order_statistics: bool)
+        Builds a map from a mapping or pairs in any order
+    map[key] = value
+        Inserts or replaces value of key
+    map[key]
+        Returns value of key, raises KeyError when key is missing
+    del map[key]
+        Removes key with its value
+    get(key: K, default: V)
+        Returns value of key, or default
+    setdefault(key: K, default: V)
+        Returns value of key, inserts default when key is missing
+    pop(key: K, default: V)
+        Removes key and returns its value
+    items(), values(), keys()
+        Ordered views of the map
+    irange_items(low: K | None, high: K | None, inclusive: tuple[bool, bool])
+        Lazily iterates (key, value) pairs between low and high
+    """
+    _node_class: type = MapNode
+    _order_statistic_node_class: type = OrderStatisticMapNode
+    _keyed_node_class: type | None = None
+    _keyed_order_statistic_node_class: type | None = None
+    _multiset_node_class: type | None = None
+    _multiset_order_statistic_node_class: type | None = None
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[tuple[K, V]], key_type: type | None = None,
+                    order_statistics: bool = False) -> 'RedBlackMap[K, V]':
+        """
+        Builds a map from (key, value) pairs in ascending order of keys in O(n).
+        Of pairs with equal keys the last one is kept, like in dict.
+
+        :param items: The pairs in ascending order of keys
+        :type items: Iterable[tuple[K, V]]
+        :param key_type: The datatype of keys, by default the type of the first key.
+        Class methods of RedBlackMap[int, str] do not see the arguments, pass key_type=int
+        :type key_type: type | None
+        :param order_statistics: Keep subtree sizes in nodes
+        :type order_statistics: bool
+        :return: The new map
+        """
+        keys: list[K] = []
+        values: list[V] = []
+        for key, value in items:
+            if keys and key == keys[-1]:
+                values[-1] = value
+                continue
+            keys.append(key)
+            values.append(value)
+
+        rbm = super().from_sorted(keys, key_type, order_statistics)
+        node = rbm._first_node()
+        for value in values:
+            node.value = value
+            node = rbm._successor_node(node)
+        return rbm
+
+    @classmethod
+    def from_iterable(cls, items: Mapping | Iterable[tuple[K, V]], key_type: type | None = None,
+                      order_statistics: bool = False) -> 'RedBlackMap[K, V]':
+        """
+        Builds a map from a mapping or (key, value) pairs in any order in O(n log n).
+        Of pairs with equal keys the last one is kept, like in dict.
+
+        :param items: The mapping or the pairs
+        :type items: Mapping | Iterable[tuple[K, V]]
+        :param key_type: The datatype of keys, by default the type of the first key
+        :type key_type: type | None
+        :param order_statistics: Keep subtree sizes in nodes
+        :type order_statistics: bool
+        :return: The new map
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        # the sort is stable, the last of equal keys stays last
+        return cls.from_sorted(sorted(items, key=itemgetter(0)), key_type, order_statistics)
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Returns value of key
+
+        :param key: The key to search for
+        :type key: K
+        :return: The value of the key
+        """
+        self._check_value(key)
+
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """
+        Inserts key with value, or replaces value of an existing key
+
+        :param key: The key to be inserted into the map
+        :type key: K
+        :param value: The value of the key
+        :type value: V
+        """
+        self._check_value(key)
+
+        self._insert_key(key)[0].value = value
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Removes key with its value
+
+        :param key: The key to remove from the map
+        :type key: K
+        """
+        self._check_value(key)
+
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        self._remove_node(node)
+
+    def __contains__(self, key: K) -> bool:
+        # like in dict, a key of another datatype is just not in the map
+        try:
+            return self.contains(key)
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return self.size
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """
+        Returns value of key, or default when key is missing
+
+        :param key: The key to search for
+        :type key: K
+        :param default: The value returned for missing key
+        :type default: V | None
+        :return: The value of the key
+        """
+        self._check_value(key)
+
+        node = self._find_node(key)
+        return default if node is None else node.value
+
+    def setdefault(self, key: K, default: V | None = None) -> V | None:
+        """
+        Returns value of key. Missing key is inserted with default in the same descent.
+
+        :param key: The key to search for
+        :type key: K
+        :param default: The value inserted for missing key
+        :type default: V | None
+        :return: The value of the key
+        """
+        self._check_value(key)
+
+        node, created = self._insert_key(key)
+        if created:
+            node.value = default
+        return node.value
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """
+        Removes key and returns its value
+
+        :param key: The key to remove from the map
+        :type key: K
+        :param default: The value returned for missing key, KeyError is raised without it
+        :type default: V
+        :return: The value of the key
+        """
+        self._check_value(key)
+
+        node = self._find_node(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._remove_node(node)
+        return node.value
+
+    def popitem(self) -> tuple[K, V]:
+        """
+        Removes the pair with the smallest key and returns it
+
+        :return: The removed (key, value) pair
+        """
+        node = self._first_node()
+        if node is None:
+            raise KeyError("popitem(): map is empty")
+        self._remove_node(node)
+        return node.key, node.value
+
+    def items(self) -> ItemsView:
+        return _ItemsView(self)
+
+    def values(self) -> ValuesView:
+        return _ValuesView(self)
+
+    def irange_items(self, low: K | None = None, high: K | None = None,
+                     inclusive: tuple[bool, bool] = (True, True)) -> Iterator[tuple[K, V]]:
+        """
+        Lazily iterates (key, value) pairs with keys between low and high in ascending order
+
+        :param low: Lower bound, None means no bound
+        :type low: K | None
+        :param high: Upper bound, None means no bound
+        :type high: K | None
+        :param inclusive: Whether low and high themselves are included
+        :type inclusive: tuple[bool, bool]
+        :return: Iterator over pairs in the range
+        """
+        if low is None:
+            node = self._first_node()
+        else:
+            self._check_value(low)
+            node = self._lower_bound(low, inclusive[0])
+        if high is not None:
+            self._check_value(high)
+
+        while node is not None:
+            if high is not None and (high < node.key or
+                                     not inclusive[1] and high == node.key):
+                return
+            yield node.key, node.value
+            node = self._successor_node(node)
@@ -1,16 +1,14 @@
-from enum import Enum
-from typing import TypeVar, Generic
-
-
-class Color(Enum):
-    """
-    An Enum which represents 2 possible colors of node
-
-    ...
-    """
-    RED = 1
-    BLACK = 0
-
+from itertools import groupby
+from operator import attrgetter
+from typing import TypeVar, Generic, Any, Callable, Iterable, Iterator, get_args, get_origin
+from Structures.Color import Color
+from Structures.RedBlackNode import RedBlackNode as Node
+from Structures.OrderStatisticNode import OrderStatisticNode
+from Structures.KeyedNode import KeyedNode
+from Structures.OrderStatisticKeyedNode import OrderStatisticKeyedNode
+from Structures.MultisetNode import MultisetNode
+from Structures.OrderStatisticMultisetNode import OrderStatisticMultisetNode
+from Structures.Traversal import in_order, pre_order_states
 
 T = TypeVar('T')
 
@@ -23,73 +21,11 @@ def typeCheck(gen_class, value):
                         type(value).__name__)
 
 
-# > A node in a binary tree that can hold any type of data
-class Node(Generic[T]):
-    """
-    A class to represent a node of tree.
-
-    ...
-
-    Attributes
-    ----------
-    __color : Color
-        color of the node
-    __key : TypeVar
-        key value of T datatype
-    __left_child : Node | None
-        left child of the node
-    __right_child : Node | None
-        right child of the node
-    __parent : Node | None
-        parent of the node
-    """
-
-    def __init__(self, value: T) -> None:
-        self.__color: Color = Color.RED
-        self.__key: T = value
-        self.__left_child: Node | None = None
-        self.__right_child: Node | None = None
-        self.__parent: Node | None = None
-
-    @property
-    def color(self) -> Color:
-        return self.__color
-
-    @color.setter
-    def color(self, color: Color) -> None:
-        self.__color = color
-
-    @property
-    def key(self) -> T:
-        return self.__key
-
-    @key.setter
-    def key(self, value: T) -> None:
-        self.__key = value
-
-    @property
-    def left_child(self):
-        return self.__left_child
-
-    @left_child.setter
-    def left_child(self, child) -> None:
-        self.__left_child = child
-
-    @property
-    def right_child(self):
-        return self.__right_child
-
-    @right_child.setter
-    def right_child(self, child) -> None:
-        self.__right_child = child
-
-    @property
-    def parent(self):
-        return self.__parent
-
-    @parent.setter
-    def parent(self, child) -> None:
-        self.__parent = child
+# NULL node shared by all trees, so a subtree can move to another tree just by relinking
+# its root. It is never changed: it stays black with size 0 and without any links.
+NIL = OrderStatisticNode(0)
+NIL.color = Color.BLACK
+NIL.size = 0
 
 
 class RedBlackTree(Generic[T]):
@@ -104,6 +40,26 @@ class RedBlackTree(Generic[T]):
         Node which represents NULL node
     __root : Node[T]
         Root of the tree
+    __order_statistics : bool
+        Whether nodes keep sizes of their subtrees
+    __augmented : bool
+        Whether nodes keep data of their subtrees, which _augment() maintains
+    __key : Callable[[T], Any] | None
+        Key function, nodes are ordered by its results
+    __key_type : type | None
+        The datatype of values, resolved on the first check
+    __validate : bool
+        Whether datatype of values is checked
+    __multiset : bool
+        Whether nodes count occurrences of their keys, size counts every occurrence
+    _node_class : type
+        Class of nodes of the tree
+    _order_statistic_node_class : type
+        Class of nodes of the tree with order statistics
+    _keyed_node_class, _keyed_order_statistic_node_class : type | None
+        Classes of nodes of the tree with a key function, None when not supported
+    _multiset_node_class, _multiset_order_statistic_node_class : type | None
+        Classes of nodes of the multiset, None when not supported
 
     Methods
     -------
@@ -113,23 +69,225 @@ class RedBlackTree(Generic[T]):
         Removes value of datatype T from the tree
     contains(value: T)
         Search for value of datatype T in the tree
+    count(value: T)
+        Returns number of occurrences of value
     minimum()
         Returns minimum value in the tree
     maximum()
         Return maximum value in the tree
+    from_sorted(iterable: Iterable[T])
+        Builds the tree from ascending keys in O(n)
+    from_iterable(iterable: Iterable[T])
+        Builds the tree from arbitrary keys in O(n log n)
+    select(index: int)
+        Returns the key at index in sorted order in O(log n)
+    rank(value: T)
+        Returns number of keys smaller than value in O(log n)
+    count_range(low: T, high: T)
+        Returns number of keys between low and high in O(log n)
+    irange(low: T | None, high: T | None, inclusive: tuple[bool, bool])
+        Lazily iterates keys between low and high
+    floor(value: T), ceiling(value: T)
+        Returns the nearest key not greater / not smaller than value
+    predecessor(value: T), successor(value: T)
+        Returns the nearest key smaller / greater than value
+    split(value: T), join(left: RedBlackTree, right: RedBlackTree)
+        Splits the tree at value / concatenates two trees in O(log n)
+    union(other), intersection(other), difference(other)
+        Set operations with another tree in O(m log(n/m + 1))
+    remove_range(low: T, high: T)
+        Removes keys between low and high
+    save(path: str), load_mmap(path: str)
+        Writes keys to a binary file / opens the file as a read-only memory-mapped set
     """
-
-    def __init__(self) -> None:
+    _node_class: type = Node
+    _order_statistic_node_class: type = OrderStatisticNode
+    _keyed_node_class: type | None = KeyedNode
+    _keyed_order_statistic_node_class: type | None = OrderStatisticKeyedNode
+    _multiset_node_class: type | None = MultisetNode
+    _multiset_order_statistic_node_class: type | None = OrderStatisticMultisetNode
+    # subclasses whose nodes summarize their subtrees set it and extend _augment()
+    _augmented: bool = False
+
+    def __init__(self, order_statistics: bool = False, key: Callable[[T], Any] | None = None,
+                 validate: bool = True, key_type: type | None = None,
+                 multiset: bool = False) -> None:
         """
         It initializes the tree.
+
+        :param order_statistics: Keep subtree sizes in nodes, which enables
+        select(), rank() and count_range()
+        :type order_statistics: bool
+        :param key: Function computing the sort key of a value, like in sorted(). It runs
+        once per inserted value, the result is stored in the node next to the value.
+        :type key: Callable[[T], Any] | None
+        :param validate: Check datatype of values, False trusts callers entirely
+        :type validate: bool
+        :param key_type: The datatype of values, by default the argument of the generic
+        (RedBlackTree[int]) or the type of the first checked value
+        :type key_type: type | None
+        :param multiset: Count occurrences of keys, insert of a present key increments
+        its count and remove decrements it. Memory stays O(distinct keys).
+        :type multiset: bool
         """
         self.size: int = 0
-        self.__nil = Node(0)
-        self.__nil.color = Color.BLACK
-        self.__nil.left_child = None
-        self.__nil.right_child = None
+        self.__order_statistics: bool = order_statistics
+        self.__augmented: bool = order_statistics or self._augmented
+        # sizes of order statistics are updated inline, without a call per node
+        self.__sizes_only: bool = order_statistics and not self._augmented
+        self.__multiset: bool = multiset
+        if multiset:
+            self.__node = self._multiset_order_statistic_node_class if order_statistics \
+                else self._multiset_node_class
+            if self.__node is None or key is not None:
+                raise TypeError("Multiset is not supported by " + type(self).__name__ +
+                                ("" if key is None else " with a key function"))
+        elif key is None:
+            self.__node = self._order_statistic_node_class if order_statistics \
+                else self._node_class
+        else:
+            self.__node = self._keyed_order_statistic_node_class if order_statistics \
+                else self._keyed_node_class
+            if self.__node is None:
+                raise TypeError("Key function is not supported by " + type(self).__name__)
+        self.__key: Callable[[T], Any] | None = key
+        self.__item = attrgetter('key' if key is None else 'item')
+        self.__validate: bool = validate
+        self.__key_type: type | None = key_type
+        self.__nil = NIL
         self.__root: Node[T] = self.__nil
 
+    @property
+    def key_type(self) -> type | None:
+        """
+        The datatype of values, None while it is not known yet
+        """
+        if self.__key_type is None:
+            self.__key_type = self.__generic_type()
+        return self.__key_type
+
+    @property
+    def key(self) -> Callable[[T], Any] | None:
+        return self.__key
+
+    @property
+    def multiset(self) -> bool:
+        return self.__multiset
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable[T], key_type: type | None = None,
+                    order_statistics: bool = False, key: Callable[[T], Any] | None = None,
+                    multiset: bool = False) -> 'RedBlackTree[T]':
+        """
+        Builds a tree from keys in ascending order in O(n) without any rotation.
+
+        Adjacent duplicates are skipped, or counted in a multiset. The keys are split
+        at the middle recursively, so the tree is as balanced as possible; every node
+        is black except the nodes of an incomplete last level, which are red.
+
+        :param iterable: The keys in ascending order
+        :type iterable: Iterable[T]
+        :param key_type: The datatype of keys, by default the type of the first key.
+        Class methods of RedBlackTree[int] do not see the argument, pass key_type=int
+        :type key_type: type | None
+        :param order_statistics: Keep subtree sizes in nodes
+        :type order_statistics: bool
+        :param key: Key function of the tree, values must be ascending by its results
+        :type key: Callable[[T], Any] | None
+        :param multiset: Build a multiset which counts occurrences of keys
+        :type multiset: bool
+        :return: The new tree
+        """
+        keys: list = []
+        items: list[T] | None = None if key is None else []
+        counts: list[int] | None = [] if multiset else None
+        for value in iterable:
+            if key_type is None:
+                key_type = type(value)
+            typeCheck(key_type, value)
+            sort_key = value if key is None else key(value)
+            if keys:
+                if sort_key == keys[-1]:
+                    if counts is not None:
+                        counts[-1] += 1
+                    continue
+                if sort_key < keys[-1]:
+                    raise ValueError("Keys are not sorted: " +
+                                     str(sort_key) + " follows " + str(keys[-1]))
+            keys.append(sort_key)
+            if items is not None:
+                items.append(value)
+            if counts is not None:
+                counts.append(1)
+
+        # subclasses which fix the datatype are not generic
+        # and generics of more parameters (RedBlackMap) take the datatype as key_type
+        tree_class = cls
+        if key_type is not None and len(cls.__parameters__) == 1:
+            tree_class = cls[key_type]
+        tree = tree_class(order_statistics=order_statistics, key=key, key_type=key_type,
+                          multiset=multiset)
+        tree.__build(keys, items, counts)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], key_type: type | None = None,
+                      order_statistics: bool = False, key: Callable[[T], Any] | None = None,
+                      multiset: bool = False) -> 'RedBlackTree[T]':
+        """
+        Builds a tree from keys in any order. The keys are sorted first,
+        so it runs in O(n log n), or O(n) for already sorted input.
+
+        :param iterable: The keys to insert
+        :type iterable: Iterable[T]
+        :param key_type: The datatype of keys, by default the type of the first key.
+        Class methods of RedBlackTree[int] do not see the argument, pass key_type=int
+        :type key_type: type | None
+        :param order_statistics: Keep subtree sizes in nodes
+        :type order_statistics: bool
+        :param key: Key function of the tree
+        :type key: Callable[[T], Any] | None
+        :param multiset: Build a multiset which counts occurrences of keys
+        :type multiset: bool
+        :return: The new tree
+        """
+        return cls.from_sorted(sorted(iterable, key=key), key_type, order_statistics, key,
+                               multiset)
+
+    def save(self, path: str) -> int:
+        """
+        Writes the keys to a compact binary file in O(n). Keys must be int, float or str.
+        The file is opened by load_mmap() without building the tree again. It holds
+        every distinct value once in natural order: a multiset writes each key once and
+        values of a tree with a key function are sorted again in O(n log n).
+
+        :param path: Path of the file to write
+        :type path: str
+        :return: Number of written keys
+        """
+        # imported here, the module itself imports typeCheck from this one
+        from AlgorithmLibrary.mapped_sorted_set import save_keys
+
+        keys: Iterable[T] = self
+        if self.__key is not None:
+            keys = sorted(set(self))
+        elif self.__multiset:
+            keys = (key for key, _ in groupby(self))
+        return save_keys(path, keys, self.key_type)
+
+    @staticmethod
+    def load_mmap(path: str):
+        """
+        Opens a file written by save() as a read-only MappedSortedSet, which answers
+        contains, range and rank queries from the mapped file in O(log n)
+
+        :param path: Path of the file
+        :type path: str
+        :return: The memory-mapped set
+        """
+        from AlgorithmLibrary.mapped_sorted_set import MappedSortedSet
+        return MappedSortedSet(path)
+
     def insert(self, value: T) -> bool:
         """
         We start at the root and traverse down the tree until we find the correct place to insert
@@ -151,73 +309,443 @@ class RedBlackTree(Generic[T]):
 
         :param value: The value to be inserted into the tree
         :type value: T
-        :return: value is not in the tree return true, otherwise false
+        :return: value is not in the tree return true, otherwise false. A multiset
+        counts the value in both cases.
         """
+        if self.__validate and type(value) is not self.__key_type:
+            self.__check_type(value)
 
-        typeCheck(self.__orig_class__.__args__[0], value)
+        if self.__key is None:
+            return self.__insert_from(self.__root, value)[1]
+        node, created = self.__insert_from(self.__root, self.__key(value))
+        if created:
+            node.item = value
+        return created
 
-        if self.contains(value):
-            return False
+    def remove(self, value: T) -> None:
+        """
+        If the value is in the tree, remove it
 
-        self.size += 1
+        :param value: The value to remove from the tree
+        :type value: T
+        """
+        if self.__validate and type(value) is not self.__key_type:
+            self.__check_type(value)
 
-        node = Node(value)
-        node.parent = None
-        node.left_child = self.__nil
-        node.right_child = self.__nil
-        node.color = Color.RED
+        node = self.__descend(self.__root, value if self.__key is None else self.__key(value))[0]
+        if node is not self.__nil:
+            self._remove_node(node)
 
-        y = None
-        x = self.__root
+    def contains(self, value: T) -> bool:
+        """
+        If the key is in the tree, return True, otherwise return False
 
-        while x != self.__nil:
-            y = x
-            if node.key < x.key:
-                x = x.left_child
+        :param value: The key to search for
+        :type value: T
+        :return: The value of the key.
+        """
+        if self.__validate and type(value) is not self.__key_type:
+            self.__check_type(value)
+
+        return self.__find_value(self.__root, value if self.__key is None
+                                 else self.__key(value)) is not self.__nil
+
+    def count(self, value: T) -> int:
+        """
+        Returns number of occurrences of value, 0 or 1 unless the tree is a multiset
+
+        :param value: The key to count
+        :type value: T
+        :return: Number of occurrences
+        """
+        self._check_value(value)
+
+        node = self.__find_value(self.__root, self.__sort_key(value))
+        return 0 if node is self.__nil else node.count
+
+    def insert_many(self, values: Iterable[T]) -> int:
+        """
+        Inserts a batch of values. The batch is sorted once and every search
+        continues from the previous insertion point instead of from the root.
+
+        :param values: The values to be inserted into the tree
+        :type values: Iterable[T]
+        :return: Number of values which were not in the tree yet
+        """
+        values = list(values)
+        self.__check_batch(values)
+        keys, values = self.__sorted_batch(values)
+
+        inserted = 0
+        finger = None
+        for key, value in zip(keys, values):
+            start = self.__root if finger is None else self.__climb(finger, key)
+            finger, created = self.__insert_from(start, key)
+            if created and self.__key is not None:
+                finger.item = value
+            inserted += created
+        return inserted
+
+    def remove_many(self, values: Iterable[T]) -> int:
+        """
+        Removes a batch of values, visiting them in ascending order and
+        continuing every search from the previous search path.
+
+        :param values: The values to remove from the tree
+        :type values: Iterable[T]
+        :return: Number of values which were removed
+        """
+        values = list(values)
+        self.__check_batch(values)
+        keys = self.__sorted_batch(values)[0]
+
+        removed = 0
+        finger = None
+        for key in keys:
+            start = self.__root if finger is None else self.__climb(finger, key)
+            node, lower = self.__descend(start, key)
+            if node is not self.__nil:
+                self._remove_node(node)
+                removed += 1
+            # the lower ancestor survives the removal of node
+            if lower is not None:
+                finger = lower
+        return removed
+
+    def contains_many(self, values: Iterable[T]) -> list[bool]:
+        """
+        Searches for a batch of values. The values are looked up in ascending order,
+        every search continues from the previous search path.
+
+        :param values: The keys to search for
+        :type values: Iterable[T]
+        :return: For every value in the batch, whether it is in the tree
+        """
+        values = list(values)
+        self.__check_batch(values)
+        keys = values if self.__key is None else list(map(self.__key, values))
+
+        result = [False] * len(keys)
+        finger = None
+        for index in sorted(range(len(keys)), key=keys.__getitem__):
+            key = keys[index]
+            start = self.__root if finger is None else self.__climb(finger, key)
+            node, lower = self.__descend(start, key)
+            if node is not self.__nil:
+                result[index] = True
+                finger = node
+            elif lower is not None:
+                finger = lower
+        return result
+
+    def select(self, index: int) -> T:
+        """
+        Returns the key at index in sorted order, negative index counts from the end.
+        Requires order statistics.
+
+        :param index: Position of the key in to_list()
+        :type index: int
+        :return: The key at index
+        """
+        self.__require_order_statistics()
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range: " + str(index))
+
+        node = self.__root
+        while True:
+            left_size = node.left_child.size
+            if index < left_size:
+                node = node.left_child
+            elif index >= left_size + node.count:
+                index -= left_size + node.count
+                node = node.right_child
             else:
-                x = x.right_child
+                return self.__item(node)
 
-        node.parent = y
-        if y is None:
-            self.__root = node
-        elif node.key < y.key:
-            y.left_child = node
-        else:
-            y.right_child = node
+    def rank(self, value: T) -> int:
+        """
+        Returns number of keys smaller than value, which is the index of value
+        in to_list() if it is in the tree. Requires order statistics.
 
-        if node.parent is None:
-            node.color = Color.BLACK
-            return True
+        :param value: The key to rank
+        :type value: T
+        :return: Number of smaller keys
+        """
+        self._check_value(value)
+        self.__require_order_statistics()
 
-        if node.parent.parent is None:
-            return True
+        return self.__rank(self.__sort_key(value), False)
 
-        self.__insert_balance(node)
-        return True
+    def count_range(self, low: T, high: T) -> int:
+        """
+        Returns number of keys k with low <= k <= high. Requires order statistics.
 
-    def remove(self, value: T) -> None:
+        :param low: Lower bound of the range
+        :type low: T
+        :param high: Upper bound of the range
+        :type high: T
+        :return: Number of keys in the range
         """
-        If the value is in the tree, remove it
+        self._check_value(low)
+        self._check_value(high)
+        self.__require_order_statistics()
 
-        :param value: The value to remove from the tree
+        low, high = self.__sort_key(low), self.__sort_key(high)
+        if high < low:
+            return 0
+        return self.__rank(high, True) - self.__rank(low, False)
+
+    def split(self, value: T) -> tuple['RedBlackTree[T]', 'RedBlackTree[T]']:
+        """
+        Splits the tree into keys smaller than value and keys not smaller than value
+        in O(log n). The nodes move to the two new trees, this tree is left empty.
+        Without order statistics the sizes of the new trees are counted
+        in O(min(left size, right size)).
+
+        :param value: The key to split at
         :type value: T
+        :return: The tree with smaller keys and the tree with the other keys
         """
-        typeCheck(self.__orig_class__.__args__[0], value)
+        self._check_value(value)
+
+        nil = self.__nil
+        left, left_height, found, right, right_height = \
+            self.__split(self.__root, self.__black_height(self.__root), self.__sort_key(value))
+        if found is not None:
+            right, right_height = self.__join(nil, 0, found, right, right_height)
+        left_size, right_size = self.__split_sizes(left, right, self.size)
+
+        left_tree = self.__adopt(left, left_size)
+        right_tree = self.__adopt(right, right_size)
+        self.__clear()
+        return left_tree, right_tree
+
+    @staticmethod
+    def join(left: 'RedBlackTree[T]', right: 'RedBlackTree[T]') -> 'RedBlackTree[T]':
+        """
+        Concatenates two trees, all keys of left must be smaller than all keys of right.
+        Runs in O(log n), the nodes move to the new tree and both trees are left empty.
+
+        :param left: The tree with smaller keys
+        :type left: RedBlackTree[T]
+        :param right: The tree with greater keys
+        :type right: RedBlackTree[T]
+        :return: The joined tree
+        """
+        left.__check_compatible(right)
+        if left.size and right.size and \
+                not left.maximum(left.__root).key < right.minimum(right.__root).key:
+            raise ValueError("Keys of the left tree must be smaller than keys of the right tree")
+
+        root, _ = left.__join_trees(left.__root, left.__black_height(left.__root),
+                                    right.__root, right.__black_height(right.__root))
+        tree = left.__adopt(root, left.size + right.size)
+        left.__clear()
+        right.__clear()
+        return tree
+
+    def union(self, other: 'RedBlackTree[T]') -> None:
+        """
+        Adds all keys of other to this tree in O(m log(n/m + 1)), where m is the size
+        of the smaller tree. Nodes of other are moved, other is left empty.
+        Keys present in both trees keep the node of this tree, a multiset adds
+        their counts.
 
-        self.__remove_from_tree(self.__root, value)
+        :param other: The tree whose keys are added
+        :type other: RedBlackTree[T]
+        """
+        self.__check_compatible(other)
 
-    def contains(self, value: T) -> bool:
+        matched = [0]
+        self.__root, _ = self.__union(self.__root, self.__black_height(self.__root),
+                                      other.__root, other.__black_height(other.__root),
+                                      matched)
+        self.size += other.size - matched[0]
+        other.__clear()
+
+    def intersection(self, other: 'RedBlackTree[T]') -> None:
         """
-        If the key is in the tree, return True, otherwise return False
+        Keeps only keys which are also in other, in O(m log(n/m + 1)).
+        A multiset keeps the smaller count of both. Other is left empty.
+
+        :param other: The tree whose keys are kept
+        :type other: RedBlackTree[T]
+        """
+        self.__check_compatible(other)
+
+        matched = [0]
+        self.__root, _ = self.__intersection(self.__root, self.__black_height(self.__root),
+                                             other.__root, other.__black_height(other.__root),
+                                             matched)
+        self.size = matched[0]
+        other.__clear()
+
+    def difference(self, other: 'RedBlackTree[T]') -> None:
+        """
+        Removes all keys of other from this tree in O(m log(n/m + 1)).
+        A multiset subtracts the counts of other. Other is left empty.
+
+        :param other: The tree whose keys are removed
+        :type other: RedBlackTree[T]
+        """
+        self.__check_compatible(other)
+
+        matched = [0]
+        self.__root, _ = self.__difference(self.__root, self.__black_height(self.__root),
+                                           other.__root, other.__black_height(other.__root),
+                                           matched)
+        self.size -= matched[0]
+        other.__clear()
+
+    def remove_range(self, low: T, high: T) -> int:
+        """
+        Removes all keys k with low <= k <= high by two splits and one join.
+        Runs in O(log n) with order statistics, otherwise the removed keys
+        are counted in O(log n + k).
+
+        :param low: Lower bound of the range
+        :type low: T
+        :param high: Upper bound of the range
+        :type high: T
+        :return: Number of removed keys
+        """
+        self._check_value(low)
+        self._check_value(high)
+
+        low, high = self.__sort_key(low), self.__sort_key(high)
+        if high < low:
+            return 0
+        left, left_height, low_node, rest, rest_height = \
+            self.__split(self.__root, self.__black_height(self.__root), low)
+        middle, _, high_node, right, right_height = self.__split(rest, rest_height, high)
+        removed = self.__count(middle)
+        for node in (low_node, high_node):
+            if node is not None:
+                removed += node.count
+
+        self.__root, _ = self.__join_trees(left, left_height, right, right_height)
+        self.size -= removed
+        return removed
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Lazily iterates keys in ascending order. Every step follows parent pointers,
+        so the iterator keeps only the current node. The tree must not be modified
+        during the iteration.
+
+        :return: Iterator over keys
+        """
+        item, multiset = self.__item, self.__multiset
+        node = self._first_node()
+        while node is not None:
+            yield item(node)
+            if multiset:
+                for _ in range(node.count - 1):
+                    yield item(node)
+            node = self._successor_node(node)
+
+    def __reversed__(self) -> Iterator[T]:
+        """
+        Lazily iterates keys in descending order
+
+        :return: Iterator over keys
+        """
+        item, multiset = self.__item, self.__multiset
+        node = self._last_node()
+        while node is not None:
+            yield item(node)
+            if multiset:
+                for _ in range(node.count - 1):
+                    yield item(node)
+            node = self._predecessor_node(node)
+
+    def irange(self, low: T | None = None, high: T | None = None,
+               inclusive: tuple[bool, bool] = (True, True)) -> Iterator[T]:
+        """
+        Lazily iterates keys between low and high in ascending order. The first key
+        is found in O(log n), every next one in amortized O(1).
+
+        :param low: Lower bound, None means no bound
+        :type low: T | None
+        :param high: Upper bound, None means no bound
+        :type high: T | None
+        :param inclusive: Whether low and high themselves are included
+        :type inclusive: tuple[bool, bool]
+        :return: Iterator over keys in the range
+        """
+        if low is None:
+            node = self._first_node()
+        else:
+            self._check_value(low)
+            node = self._lower_bound(self.__sort_key(low), inclusive[0])
+        if high is not None:
+            self._check_value(high)
+            high = self.__sort_key(high)
+
+        item, multiset = self.__item, self.__multiset
+        while node is not None:
+            if high is not None and (high < node.key or
+                                     not inclusive[1] and high == node.key):
+                return
+            yield item(node)
+            if multiset:
+                for _ in range(node.count - 1):
+                    yield item(node)
+            node = self._successor_node(node)
+
+    def floor(self, value: T) -> T | None:
+        """
+        Returns the greatest key not greater than value
 
         :param value: The key to search for
         :type value: T
-        :return: The value of the key.
+        :return: The found key, or None
         """
+        self._check_value(value)
 
-        typeCheck(self.__orig_class__.__args__[0], value)
+        node = self._upper_bound(self.__sort_key(value), True)
+        return None if node is None else self.__item(node)
 
-        return self.__find_value(self.__root, value) is not self.__nil
+    def ceiling(self, value: T) -> T | None:
+        """
+        Returns the smallest key not smaller than value
+
+        :param value: The key to search for
+        :type value: T
+        :return: The found key, or None
+        """
+        self._check_value(value)
+
+        node = self._lower_bound(self.__sort_key(value), True)
+        return None if node is None else self.__item(node)
+
+    def predecessor(self, value: T) -> T | None:
+        """
+        Returns the greatest key smaller than value
+
+        :param value: The key to search for
+        :type value: T
+        :return: The found key, or None
+        """
+        self._check_value(value)
+
+        node = self._upper_bound(self.__sort_key(value), False)
+        return None if node is None else self.__item(node)
+
+    def successor(self, value: T) -> T | None:
+        """
+        Returns the smallest key greater than value
+
+        :param value: The key to search for
+        :type value: T
+        :return: The found key, or None
+        """
+        self._check_value(value)
+
+        node = self._lower_bound(self.__sort_key(value), False)
+        return None if node is None else self.__item(node)
 
     def minimum(self, node: Node) -> Node:
         """
@@ -227,7 +755,7 @@ class RedBlackTree(Generic[T]):
         :type node: Node
         :return: The minimum value in the tree.
         """
-        while node.left_child != self.__nil:
+        while node.left_child is not self.__nil:
             node = node.left_child
         return node
 
@@ -239,8 +767,8 @@ class RedBlackTree(Generic[T]):
         :type node: Node
         :return: The maximum value in the tree.
         """
-        while node.right_node != self.__nil:
-            node = node.right_node
+        while node.right_child is not self.__nil:
+            node = node.right_child
         return node
 
     def to_list(self) -> list[T]:
@@ -250,16 +778,237 @@ class RedBlackTree(Generic[T]):
         Returns:
             list: content of tree as list
         """
-        content = list()
-        content = self.__in_order(self.__root, content)
-        return content
+        if self.__multiset:
+            return [node.key for node in in_order(self.__root, self.__nil)
+                    for _ in range(node.count)]
+        return list(map(self.__item, in_order(self.__root, self.__nil)))
+
+    def __build(self, keys: list, items: list[T] | None = None,
+                counts: list[int] | None = None) -> None:
+        """
+        Replaces content of the empty tree with sorted and unique keys
+
+        :param keys: The keys in strictly ascending order
+        :type keys: list
+        :param items: Values of the keys for a tree with key function
+        :type items: list[T] | None
+        :param counts: Occurrences of the keys for a multiset
+        :type counts: list[int] | None
+        """
+        count = len(keys)
+        self.size = count if counts is None else sum(counts)
+        if count == 0:
+            return
+        # nodes at the deepest level are red, unless that level is full
+        red_depth = count.bit_length() - 1 if (count + 1) & count else -1
+        self.__root = self.__build_range(keys, items, counts, 0, count - 1, 0, red_depth, None)
+
+    def __build_range(self, keys: list, items: list[T] | None, counts: list[int] | None,
+                      low: int, high: int, depth: int, red_depth: int,
+                      parent: Node | None) -> Node:
+        """
+        Builds the subtree from keys[low..high] and returns its root
+
+        :param keys: The keys in strictly ascending order
+        :param items: Values of the keys or None
+        :param counts: Occurrences of the keys or None
+        :param low: First index of the subtree keys
+        :param high: Last index of the subtree keys
+        :param depth: Depth of the subtree root
+        :param red_depth: Depth whose nodes are colored red
+        :param parent: Parent of the subtree root
+        :return: Root of the subtree
+        """
+        if low > high:
+            return self.__nil
+        mid = (low + high) // 2
+        node = self.__node(keys[mid])
+        if items is not None:
+            node.item = items[mid]
+        if counts is not None:
+            node.count = counts[mid]
+        node.parent = parent
+        node.color = Color.RED if depth == red_depth else Color.BLACK
+        node.left_child = self.__build_range(keys, items, counts, low, mid - 1, depth + 1,
+                                             red_depth, node)
+        node.right_child = self.__build_range(keys, items, counts, mid + 1, high, depth + 1,
+                                              red_depth, node)
+        if self.__augmented:
+            self._augment(node)
+        return node
+
+    def __rank(self, key: T, inclusive: bool) -> int:
+        """
+        Counts keys smaller than key, or not greater than key when inclusive
+
+        :param key: The key to rank
+        :type key: T
+        :param inclusive: Whether key itself is counted
+        :type inclusive: bool
+        :return: Number of keys before key
+        """
+        rank = 0
+        node = self.__root
+        while node is not self.__nil:
+            if key < node.key:
+                node = node.left_child
+            elif key == node.key:
+                return rank + node.left_child.size + (node.count if inclusive else 0)
+            else:
+                rank += node.left_child.size + node.count
+                node = node.right_child
+        return rank
+
+    def _insert_key(self, key: T, probe=None) -> tuple[Node, bool]:
+        """
+        Inserts key without type check, single descent from the root
+
+        :param key: The key to be inserted into the tree
+        :type key: T
+        :param probe: Compared with node keys in place of key during the descent,
+        e.g. a key which counts the comparisons; the node is built with key itself
+        :return: The node holding key and whether it was created
+        """
+        return self.__insert_from(self.__root, key, probe)
+
+    def _find_node(self, key: T) -> Node | None:
+        """
+        Finds node with key without type check
+
+        :param key: The key to search for
+        :type key: T
+        :return: The node with key, or None
+        """
+        node = self.__descend(self.__root, key)[0]
+        return None if node is self.__nil else node
+
+    def _first_node(self) -> Node | None:
+        """
+        Returns the node with the smallest key, or None for an empty tree
+        """
+        return None if self.__root is self.__nil else self.minimum(self.__root)
+
+    def _last_node(self) -> Node | None:
+        """
+        Returns the node with the greatest key, or None for an empty tree
+        """
+        return None if self.__root is self.__nil else self.maximum(self.__root)
+
+    def _lower_bound(self, key: T, inclusive: bool) -> Node | None:
+        """
+        Finds the first node whose key is greater than key, or equal when inclusive
+
+        :param key: The bound
+        :type key: T
+        :param inclusive: Whether node with key itself is accepted
+        :type inclusive: bool
+        :return: The found node, or None
+        """
+        found = None
+        node = self.__root
+        while node is not self.__nil:
+            if key < node.key or inclusive and key == node.key:
+                found = node
+                node = node.left_child
+            else:
+                node = node.right_child
+        return found
+
+    def _upper_bound(self, key: T, inclusive: bool) -> Node | None:
+        """
+        Finds the last node whose key is smaller than key, or equal when inclusive
+
+        :param key: The bound
+        :type key: T
+        :param inclusive: Whether node with key itself is accepted
+        :type inclusive: bool
+        :return: The found node, or None
+        """
+        found = None
+        node = self.__root
+        while node is not self.__nil:
+            if node.key < key or inclusive and key == node.key:
+                found = node
+                node = node.right_child
+            else:
+                node = node.left_child
+        return found
+
+    def _successor_node(self, node: Node) -> Node | None:
+        """
+        Returns the next node in order, or None for the maximum
+
+        :param node: The node to start from
+        :type node: Node
+        :return: The next node
+        """
+        if node.right_child is not self.__nil:
+            return self.minimum(node.right_child)
+        while node.parent is not None and node is node.parent.right_child:
+            node = node.parent
+        return node.parent
+
+    def _predecessor_node(self, node: Node) -> Node | None:
+        """
+        Returns the previous node in order, or None for the minimum
 
-    def __in_order(self, node: Node, content: list[T]) -> list[T]:
-        if node != self.__nil:
-            self.__in_order(node.left_child, content)
-            content.append(node.key)
-            self.__in_order(node.right_child, content)
-        return content
+        :param node: The node to start from
+        :type node: Node
+        :return: The previous node
+        """
+        if node.left_child is not self.__nil:
+            return self.maximum(node.left_child)
+        while node.parent is not None and node is node.parent.left_child:
+            node = node.parent
+        return node.parent
+
+    def __update_path(self, node: Node | None) -> None:
+        """
+        Recomputes augmented data from node up to the root
+
+        :param node: The lowest node whose subtree has changed
+        :type node: Node | None
+        """
+        if self.__sizes_only:
+            while node is not None:
+                node.size = node.left_child.size + node.right_child.size + node.count
+                node = node.parent
+            return
+        while node is not None:
+            self._augment(node)
+            node = node.parent
+
+    def _augment(self, node: Node) -> None:
+        """
+        Recomputes data which node keeps about its subtree from its children,
+        the subtree size. Called bottom up after every change of the subtree,
+        including rotations.
+
+        :param node: The node to update, its children are up to date
+        :type node: Node
+        """
+        node.size = node.left_child.size + node.right_child.size + node.count
+
+    def _root_node(self) -> Node | None:
+        """
+        Returns the root, or None for an empty tree
+        """
+        return None if self.__root is self.__nil else self.__root
+
+    def __add_occurrences(self, node: Node, count: int) -> None:
+        """
+        Changes the count of a multiset node by count, which may be negative
+        """
+        node.count += count
+        self.size += count
+        if self.__order_statistics:
+            while node is not None:
+                node.size += count
+                node = node.parent
+
+    def __require_order_statistics(self) -> None:
+        if not self.__order_statistics:
+            raise RuntimeError("Order statistics are not enabled for this tree")
 
     def __find_value(self, node: Node, key: T) -> Node:
         """
@@ -272,56 +1021,490 @@ class RedBlackTree(Generic[T]):
         :type key: T
         :return: The node that contains the key.
         """
-        if node is self.__nil or key is node.key:
-            return node
+        nil = self.__nil
+        while node is not nil and key != node.key:
+            node = node.left_child if key < node.key else node.right_child
+        return node
 
-        if key < node.key:
-            return self.__find_value(node.left_child, key)
-        return self.__find_value(node.right_child, key)
+    def __insert_from(self, start: Node, value: T, probe=None) -> tuple[Node, bool]:
+        """
+        Descends from start to the place of value and inserts a new node there
 
-    def __remove_from_tree(self, node: Node, key: T) -> None:
+        :param start: The node whose subtree can hold value
+        :type start: Node
+        :param value: The value to be inserted into the tree
+        :type value: T
+        :param probe: Compared with node keys in place of value, if given
+        :return: The node holding value and whether it was created
         """
-        We find the node to be removed, then we find its successor, and then
-        we replace the node to be removed with its successor
+        y = None
+        x = start
+        search = value if probe is None else probe
+
+        while x is not self.__nil:
+            y = x
+            if search == x.key:
+                if self.__multiset:
+                    self.__add_occurrences(x, 1)
+                return x, False
+            if search < x.key:
+                x = x.left_child
+            else:
+                x = x.right_child
+
+        self.size += 1
+
+        node = self.__node(value)
+        node.left_child = self.__nil
+        node.right_child = self.__nil
+        node.color = Color.RED
+
+        node.parent = y
+        if y is None:
+            self.__root = node
+        elif node.key < y.key:
+            y.left_child = node
+        else:
+            y.right_child = node
+
+        if self.__augmented:
+            self.__update_path(y)
+
+        if node.parent is None:
+            node.color = Color.BLACK
+            return node, True
+
+        if node.parent.parent is None:
+            return node, True
+
+        self.__insert_balance(node)
+        return node, True
+
+    def __descend(self, node: Node, key: T) -> tuple[Node, Node | None]:
+        """
+        Iteratively searches for key in the subtree of node
 
         :param node: The node to start searching from
         :type node: Node
-        :param key: The key to be removed from the tree
+        :param key: The key to search for
         :type key: T
-        :return: The node with the minimum key in the tree.
+        :return: The node with key (or NIL) and the last node on the path with a smaller key
         """
-        z = self.__nil
-        # find the element
+        lower = None
         while node is not self.__nil:
-            if node.key is key:
-                z = node
-
-            if node.key <= key:
-                node = node.right_child
-            else:
+            if key == node.key:
+                break
+            if key < node.key:
                 node = node.left_child
+            else:
+                lower = node
+                node = node.right_child
+        return node, lower
+
+    def __climb(self, finger: Node, key: T) -> Node:
+        """
+        Climbs from finger, whose key is not greater than key, to the lowest
+        ancestor whose subtree contains the place of key
+
+        :param finger: Node from the previous search path
+        :type finger: Node
+        :param key: The key to search for
+        :type key: T
+        :return: The node to start the search from
+        """
+        while finger.parent is not None and not key < finger.parent.key:
+            finger = finger.parent
+        return finger
+
+    def __check_batch(self, values: list[T]) -> None:
+        """
+        Checks datatype of the whole batch, once per distinct type
 
-        if z is self.__nil:
-            # Value is not in the tree
+        :param values: The batch of values
+        :type values: list[T]
+        """
+        if not self.__validate:
             return
+        for value_type, value in dict(zip(map(type, values), values)).items():
+            if value_type is not self.__key_type:
+                self.__check_type(value)
+
+    def _check_value(self, value: T) -> None:
+        """
+        Checks datatype of value unless validation is disabled. After the first
+        check it costs a single identity test of the type.
+
+        :param value: The value to check
+        :type value: T
+        """
+        if self.__validate and type(value) is not self.__key_type:
+            self.__check_type(value)
 
+    def __check_type(self, value: T) -> None:
+        if self.__key_type is None:
+            self.__key_type = self.__generic_type() or type(value)
+        typeCheck(self.__key_type, value)
+
+    def __generic_type(self) -> type | None:
+        """
+        Returns the argument of the generic, taken from RedBlackTree[int]() or
+        from a subclass like class IntTree(RedBlackTree[int]), None if there is none
+        """
+        orig_class = getattr(self, "__orig_class__", None)
+        if orig_class is not None:
+            return orig_class.__args__[0]
+        for cls in type(self).__mro__:
+            for base in getattr(cls, "__orig_bases__", ()):
+                origin = get_origin(base)
+                if isinstance(origin, type) and issubclass(origin, RedBlackTree) and \
+                        isinstance(get_args(base)[0], type):
+                    return get_args(base)[0]
+        return None
+
+    def __sort_key(self, value: T):
+        return value if self.__key is None else self.__key(value)
+
+    def _sort_key(self, value: T):
+        return self.__sort_key(value)
+
+    def _set_item(self, node: Node, value: T) -> None:
+        if self.__key is not None:
+            node.item = value
+
+    def __sorted_batch(self, values: list[T]) -> tuple[list, list[T]]:
+        """
+        Sorts the batch by keys, the key function runs once per value
+
+        :param values: The batch of values, sorted in place without a key function
+        :type values: list[T]
+        :return: Sorted keys and values in the same order
+        """
+        if self.__key is None:
+            values.sort()
+            return values, values
+        keys = list(map(self.__key, values))
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return [keys[i] for i in order], [values[i] for i in order]
+
+    def __check_compatible(self, other: 'RedBlackTree[T]') -> None:
+        """
+        Checks that nodes of other can be moved to this tree
+        """
+        if other is self:
+            raise ValueError("The tree cannot be combined with itself")
+        if type(other) is not type(self) or other.key_type is not self.key_type:
+            raise TypeError("Invalid datatype. Expected: " + str(self.__type_name()) +
+                            ", but got: " + str(other.__type_name()))
+        if other.__key is not self.__key:
+            raise TypeError("Both trees must have the same key function")
+        if other.__order_statistics != self.__order_statistics:
+            raise TypeError("Both trees must have order statistics enabled or disabled")
+        if other.__multiset != self.__multiset:
+            raise TypeError("Both trees must be multisets or sets")
+
+    def __adopt(self, root: Node, size: int) -> 'RedBlackTree[T]':
+        """
+        Returns a new tree of the same type which takes over a detached subtree
+        """
+        tree = getattr(self, "__orig_class__", type(self))(
+            order_statistics=self.__order_statistics, key=self.__key,
+            validate=self.__validate, key_type=self.__key_type, multiset=self.__multiset)
+        tree.__root = root
+        tree.size = size
+        return tree
+
+    def __type_name(self) -> str:
+        key_type = self.key_type
+        return type(self).__name__ + "[" + \
+            ("?" if key_type is None else key_type.__name__) + "]"
+
+    def __clear(self) -> None:
+        self.__root = self.__nil
+        self.size = 0
+
+    def __count(self, root: Node) -> int:
+        """
+        Counts keys of the subtree with their occurrences, in O(1) with order statistics
+        """
+        if self.__order_statistics:
+            return root.size
+        if self.__multiset:
+            return sum(node.count for node in in_order(root, self.__nil))
+        return sum(1 for _ in in_order(root, self.__nil))
+
+    def __split_sizes(self, left: Node, right: Node, total: int) -> tuple[int, int]:
+        """
+        Returns sizes of two subtrees with total keys together. Without order statistics
+        both are counted in lockstep, which stops after the smaller one.
+        """
+        if self.__order_statistics:
+            return left.size, right.size
+        lefts, rights = in_order(left, self.__nil), in_order(right, self.__nil)
+        smaller = sum(1 for _ in zip(lefts, rights))
+        if next(rights, None) is None:
+            if self.__multiset:
+                smaller = self.__count(right)
+            return total - smaller, smaller
+        if self.__multiset:
+            smaller = self.__count(left)
+        return smaller, total - smaller
+
+    def __black_height(self, node: Node) -> int:
+        """
+        Counts black nodes on the path from node down to NIL, NIL excluded
+        """
+        height = 0
+        while node is not self.__nil:
+            height += node.color is Color.BLACK
+            node = node.left_child
+        return height
+
+    def __detach(self, node: Node, height: int) -> tuple[Node, int]:
+        """
+        Makes node a black root of a separate tree
+
+        :param node: The node to detach from its parent
+        :param height: Black height of node
+        :return: The node and its black height as a root
+        """
+        if node is not self.__nil:
+            node.parent = None
+            if node.color is Color.RED:
+                node.color = Color.BLACK
+                height += 1
+        return node, height
+
+    def __children(self, node: Node, height: int) -> tuple[Node, int, Node, int]:
+        """
+        Detaches both subtrees of the root node
+
+        :param node: The root, it must be black
+        :param height: Black height of node
+        :return: The left subtree, its black height, the right subtree, its black height
+        """
+        left, left_height = self.__detach(node.left_child, height - 1)
+        right, right_height = self.__detach(node.right_child, height - 1)
+        return left, left_height, right, right_height
+
+    def __join(self, left: Node, left_height: int, node: Node,
+               right: Node, right_height: int) -> tuple[Node, int]:
+        """
+        Joins two detached trees with node between them. Node is hung on the spine of
+        the higher tree where the black heights match and the red violation is fixed
+        as after an insertion, so it runs in O(|left_height - right_height| + 1).
+
+        :param left: Root of the tree with smaller keys
+        :param left_height: Black height of left
+        :param node: The node with key between both trees, its links are replaced
+        :param right: Root of the tree with greater keys
+        :param right_height: Black height of right
+        :return: Root of the joined tree and its black height
+        """
+        nil = self.__nil
+        node.parent = None
+        if left_height == right_height:
+            node.left_child = left
+            node.right_child = right
+            node.color = Color.BLACK
+            if left is not nil:
+                left.parent = node
+            if right is not nil:
+                right.parent = node
+            if self.__augmented:
+                self._augment(node)
+            return node, left_height + 1
+
+        if left_height > right_height:
+            # descend the right spine of left to a black node of right's black height
+            parent, child, height = None, left, left_height
+            while child.color is Color.RED or height > right_height:
+                height -= child.color is Color.BLACK
+                parent, child = child, child.right_child
+            node.left_child = child
+            node.right_child = right
+            parent.right_child = node
+            self.__root = left
+        else:
+            parent, child, height = None, right, right_height
+            while child.color is Color.RED or height > left_height:
+                height -= child.color is Color.BLACK
+                parent, child = child, child.left_child
+            node.left_child = left
+            node.right_child = child
+            parent.left_child = node
+            self.__root = right
+        node.parent = parent
+        node.color = Color.RED
+        if node.left_child is not nil:
+            node.left_child.parent = node
+        if node.right_child is not nil:
+            node.right_child.parent = node
+        if self.__augmented:
+            self.__update_path(node)
+
+        height = max(left_height, right_height)
+        if parent.color is Color.RED and self.__insert_balance(node):
+            height += 1
+        return self.__root, height
+
+    def __join_trees(self, left: Node, left_height: int,
+                     right: Node, right_height: int) -> tuple[Node, int]:
+        """
+        Joins two detached trees without a middle node, the maximum of left is
+        taken out and used as one
+        """
+        if left is self.__nil:
+            return right, right_height
+        if right is self.__nil:
+            return left, left_height
+        self.__root = left
+        node = self.maximum(left)
+        if self.__unlink(node):
+            left_height -= 1
+        return self.__join(self.__root, left_height, node, right, right_height)
+
+    def __split(self, node: Node, height: int,
+                key: T) -> tuple[Node, int, Node | None, Node, int]:
+        """
+        Splits a detached tree at key. Subtrees on the search path are joined back
+        bottom up, which costs O(log n) in total.
+
+        :param node: Root of the tree
+        :param height: Black height of node
+        :param key: The key to split at
+        :return: The tree with smaller keys and its black height, the node with key
+        or None, the tree with greater keys and its black height
+        """
+        if node is self.__nil:
+            return node, 0, None, node, 0
+        left, left_height, right, right_height = self.__children(node, height)
+        if key == node.key:
+            return left, left_height, node, right, right_height
+        if key < node.key:
+            smaller, smaller_height, found, greater, greater_height = \
+                self.__split(left, left_height, key)
+            greater, greater_height = self.__join(greater, greater_height, node,
+                                                  right, right_height)
+        else:
+            smaller, smaller_height, found, greater, greater_height = \
+                self.__split(right, right_height, key)
+            smaller, smaller_height = self.__join(left, left_height, node,
+                                                  smaller, smaller_height)
+        return smaller, smaller_height, found, greater, greater_height
+
+    def __union(self, first: Node, first_height: int, second: Node, second_height: int,
+                matched: list[int]) -> tuple[Node, int]:
+        """
+        Unites two detached trees: the second is split at the root key of the first
+        and the halves are united recursively. Matched counts keys in both trees.
+        """
+        if first is self.__nil:
+            return second, second_height
+        if second is self.__nil:
+            return first, first_height
+        left, left_height, right, right_height = self.__children(first, first_height)
+        smaller, smaller_height, found, greater, greater_height = \
+            self.__split(second, second_height, first.key)
+        if found is not None:
+            # a multiset adds the occurrences, a set drops the node of the second tree
+            if self.__multiset:
+                first.count += found.count
+            else:
+                matched[0] += 1
+        left, left_height = self.__union(left, left_height, smaller, smaller_height, matched)
+        right, right_height = self.__union(right, right_height, greater, greater_height,
+                                           matched)
+        return self.__join(left, left_height, first, right, right_height)
+
+    def __intersection(self, first: Node, first_height: int, second: Node,
+                       second_height: int, matched: list[int]) -> tuple[Node, int]:
+        """
+        Intersects two detached trees, keeping nodes of the first one.
+        Matched counts the kept keys.
+        """
+        if first is self.__nil or second is self.__nil:
+            return self.__nil, 0
+        left, left_height, right, right_height = self.__children(first, first_height)
+        smaller, smaller_height, found, greater, greater_height = \
+            self.__split(second, second_height, first.key)
+        left, left_height = self.__intersection(left, left_height, smaller, smaller_height,
+                                                matched)
+        right, right_height = self.__intersection(right, right_height, greater,
+                                                  greater_height, matched)
+        if found is None:
+            return self.__join_trees(left, left_height, right, right_height)
+        if self.__multiset:
+            first.count = min(first.count, found.count)
+        matched[0] += first.count
+        return self.__join(left, left_height, first, right, right_height)
+
+    def __difference(self, first: Node, first_height: int, second: Node,
+                     second_height: int, matched: list[int]) -> tuple[Node, int]:
+        """
+        Removes keys of the second detached tree from the first one: the first is split
+        at the root key of the second. Matched counts the removed keys.
+        """
+        if first is self.__nil or second is self.__nil:
+            return first, first_height
+        left, left_height, right, right_height = self.__children(second, second_height)
+        smaller, smaller_height, found, greater, greater_height = \
+            self.__split(first, first_height, second.key)
+        smaller, smaller_height = self.__difference(smaller, smaller_height, left,
+                                                    left_height, matched)
+        greater, greater_height = self.__difference(greater, greater_height, right,
+                                                    right_height, matched)
+        if found is None:
+            return self.__join_trees(smaller, smaller_height, greater, greater_height)
+        if found.count > second.count:
+            # a multiset keeps the remaining occurrences
+            found.count -= second.count
+            matched[0] += second.count
+            return self.__join(smaller, smaller_height, found, greater, greater_height)
+        matched[0] += found.count
+        return self.__join_trees(smaller, smaller_height, greater, greater_height)
+
+    def _remove_node(self, z: Node) -> None:
+        """
+        We replace the node to be removed with its successor and then
+        rebalance the tree. A multiset node with more occurrences only
+        loses one of them.
+
+        :param z: The node to be removed from the tree
+        :type z: Node
+        """
+        if z.count > 1:
+            self.__add_occurrences(z, -1)
+            return
         self.size -= 1
+        self.__unlink(z)
+
+    def __unlink(self, z: Node) -> bool:
+        """
+        Removes node z from the tree without changing size. The parent of x is kept
+        in a variable, so the shared NIL node is never written to.
 
+        :param z: The node to be removed from the tree
+        :type z: Node
+        :return: Whether the black height of the tree decreased
+        """
         y = z
         y_color = y.color
         if z.left_child is self.__nil:
             x = z.right_child
+            x_parent = z.parent
             self.__rb_transplant(z, z.right_child)
         elif z.right_child is self.__nil:
             x = z.left_child
+            x_parent = z.parent
             self.__rb_transplant(z, z.left_child)
         else:
             y = self.minimum(z.right_child)
             y_color = y.color
             x = y.right_child
             if y.parent is z:
-                x.parent = y
+                x_parent = y
             else:
+                x_parent = y.parent
                 self.__rb_transplant(y, y.right_child)
                 y.right_child = z.right_child
                 y.right_child.parent = y
@@ -330,65 +1513,78 @@ class RedBlackTree(Generic[T]):
             y.left_child = z.left_child
             y.left_child.parent = y
             y.color = z.color
+        if self.__augmented:
+            self.__update_path(x_parent)
         if y_color is Color.BLACK:
-            self.__remove_balance(x)
+            return self.__remove_balance(x, x_parent)
+        return False
 
-    def __remove_balance(self, x: Node) -> None:
+    def __remove_balance(self, x: Node, parent: Node | None) -> bool:
         """
         If the node to be removed is black, then we need to rebalance the tree
 
         :param x: The node to be removed
         :type x: Node
+        :param parent: The parent of x, x may be NIL
+        :type parent: Node | None
+        :return: Whether the missing black reached the root, lowering the black height
         """
         while x is not self.__root and x.color is Color.BLACK:
-            if x is x.parent.left_child:
-                s_node = x.parent.right_child
+            if x is parent.left_child:
+                s_node = parent.right_child
                 if s_node.color is Color.RED:
                     s_node.color = Color.BLACK
-                    x.parent.color = Color.RED
-                    self.__left_rotation(x.parent)
-                    s_node = x.parent.right_child
+                    parent.color = Color.RED
+                    self.__left_rotation(parent)
+                    s_node = parent.right_child
 
                 if s_node.left_child.color is Color.BLACK \
                         and s_node.right_child.color is Color.BLACK:
                     s_node.color = Color.RED
-                    x = x.parent
+                    x = parent
+                    parent = x.parent
                 else:
                     if s_node.right_child.color is Color.BLACK:
                         s_node.left_child.color = Color.BLACK
                         s_node.color = Color.RED
                         self.__right_rotation(s_node)
-                        s_node = x.parent.right_child
+                        s_node = parent.right_child
 
-                    s_node.color = x.parent.color
-                    x.parent.color = Color.BLACK
+                    s_node.color = parent.color
+                    parent.color = Color.BLACK
                     s_node.right_child.color = Color.BLACK
-                    self.__left_rotation(x.parent)
-                    x = self.__root
+                    self.__left_rotation(parent)
+                    self.__root.color = Color.BLACK
+                    return False
             else:
-                s_node = x.parent.left_child
+                s_node = parent.left_child
                 if s_node.color is Color.RED:
                     s_node.color = Color.BLACK
-                    x.parent.color = Color.RED
-                    self.__right_rotation(x.parent)
-                    s_node = x.parent.left_child
+                    parent.color = Color.RED
+                    self.__right_rotation(parent)
+                    s_node = parent.left_child
 
-                if s_node.right_child.color is Color.BLACK \
+                if s_node.left_child.color is Color.BLACK \
                         and s_node.right_child.color is Color.BLACK:
                     s_node.color = Color.RED
-                    x = x.parent
+                    x = parent
+                    parent = x.parent
                 else:
                     if s_node.left_child.color is Color.BLACK:
                         s_node.right_child.color = Color.BLACK
                         s_node.color = Color.RED
                         self.__left_rotation(s_node)
-                        s_node = x.parent.left_child
-                    s_node.color = x.parent.color
-                    x.parent.color = Color.BLACK
+                        s_node = parent.left_child
+                    s_node.color = parent.color
+                    parent.color = Color.BLACK
                     s_node.left_child.color = Color.BLACK
-                    self.__right_rotation(x.parent)
-                    x = self.__root
-        x.color = Color.BLACK
+                    self.__right_rotation(parent)
+                    self.__root.color = Color.BLACK
+                    return False
+        if x.color is Color.RED:
+            x.color = Color.BLACK
+            return False
+        return True
 
     def __rb_transplant(self, x: Node, y: Node) -> None:
         """
@@ -406,20 +1602,20 @@ class RedBlackTree(Generic[T]):
             x.parent.left_child = y
         else:
             x.parent.right_child = y
-        y.parent = x.parent
+        if y is not self.__nil:
+            y.parent = x.parent
 
     def print(self):
         """
-        The function takes in a node, a string, and a boolean. It then prints the node's value,
-        and then calls itself on the left and right children of the node,
-        passing in the string and boolean
+        Prints the tree, every node with its key and color, children indented
+        below their parent, left child first
         """
         self.__print_tree(self.__root, "", True)
 
     def __print_tree(self, node: Node, indent, last: bool) -> None:
         """
-        If the node is not the NIL node, print the node's key and color,
-        then recursively print the left and right subtrees
+        Prints every node with its key and color below its parent, indented by depth.
+        The indentation of a node is passed down from its parent during an iterative walk.
 
         :param node: The node to print
         :type node: Node
@@ -428,25 +1624,22 @@ class RedBlackTree(Generic[T]):
         is the last child of its parent
         :type last: bool
         """
-        if node != self.__nil:
-            print(indent, end=' ')
-            if last:
-                print("└─(R)────", end=' ')
-                indent += "     "
-            else:
-                print("├─(L)────", end=' ')
-                indent += " │ "
+        def child_indent(state: tuple[str, bool], right: bool) -> tuple[str, bool]:
+            return state[0] + ("     " if state[1] else " │ "), right
 
+        for node, (indent, last) in pre_order_states(node, (indent, last), child_indent,
+                                                     self.__nil):
+            print(indent, end=' ')
+            print("└─(R)────" if last else "├─(L)────", end=' ')
             print(str(node.key)+" ("+("RED" if node.color == Color.RED else "BLACK")+")")
-            self.__print_tree(node.left_child, indent, False)
-            self.__print_tree(node.right_child, indent, True)
 
-    def __insert_balance(self, x: Node) -> None:
+    def __insert_balance(self, x: Node) -> bool:
         """
         It inserts a node into the tree and then balances the tree
 
         :param x: Node
         :type x: Node
+        :return: Whether the root was recolored, raising the black height
         """
         while x.parent.color is Color.RED:
             if x.parent is x.parent.parent.right_child:
@@ -479,7 +1672,9 @@ class RedBlackTree(Generic[T]):
                     self.__right_rotation(x.parent.parent)
             if x is self.__root:
                 break
+        grew = self.__root.color is Color.RED
         self.__root.color = Color.BLACK
+        return grew
 
     def __left_rotation(self, x: Node) -> None:
         """
@@ -506,6 +1701,12 @@ class RedBlackTree(Generic[T]):
             x.parent.right_child = y
         y.left_child = x
         x.parent = y
+        if self.__sizes_only:
+            y.size = x.size
+            x.size = x.left_child.size + x.right_child.size + x.count
+        elif self.__augmented:
+            self._augment(x)
+            self._augment(y)
 
     def __right_rotation(self, x: Node) -> None:
         """
@@ -533,3 +1734,9 @@ class RedBlackTree(Generic[T]):
             x.parent.left_child = y
         y.right_child = x
         x.parent = y
+        if self.__sizes_only:
+            y.size = x.size
+            x.size = x.left_child.size + x.right_child.size + x.count
+        elif self.__augmented:
+            self._augment(x)
+            self._augment(y)
@@ -0,0 +1,107 @@
+import math
+from typing import TypeVar
+
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from Structures.Node import Node
+from Structures.Traversal import in_order, pre_order
+
+T = TypeVar('T')
+
+
+class ScapegoatTree(BinarySearchTree[T]):
+    """
+    A class that represent scapegoat tree, a binary search tree balanced by rebuilding.
+
+    Nodes keep no balance data. When an insert lands deeper than log_{1/alpha}(n),
+    the highest too unbalanced ancestor (the scapegoat) has its subtree rebuilt
+    perfectly balanced; when removals shrink the tree below alpha times its largest
+    size, the whole tree is rebuilt. Rebuilds cost amortized O(log n) per operation
+    and lookups never touch anything but the keys. It has the same API as BinarySearchTree.
+
+    ...
+
+    Attributes
+    ----------
+    __alpha : float
+        Balance factor between 0.5 and 1, a child subtree holds at most alpha of its parent
+    __max_size : int
+        Largest size since the last rebuild of the whole tree
+
+    Methods
+    -------
+    insert(key: T)
+        Inserts key of datatype T, may rebuild a subtree
+    remove(key: T)
+        Removes key of datatype T, may rebuild the whole tree
+    contains(key: T)
+        Search for key of datatype T in O(log n)
+    """
+
+    def __init__(self, validate: bool = True, key_type: type | None = None,
+                 alpha: float = 2 / 3) -> None:
+        """
+        It initializes the tree.
+
+        :param validate: Check datatype of keys, False trusts callers entirely
+        :type validate: bool
+        :param key_type: The datatype of keys, resolved on the first check if omitted
+        :type key_type: type | None
+        :param alpha: Balance factor, lower values give lower trees and more rebuilds
+        :type alpha: float
+        """
+        if not 0.5 < alpha < 1:
+            raise ValueError("Alpha must be between 0.5 and 1, got: " + str(alpha))
+        super().__init__(validate, key_type)
+        self.__alpha: float = alpha
+        self.__log_base: float = math.log(1 / alpha)
+        self.__max_size: int = 0
+
+    def _inserted(self, node: Node) -> None:
+        self.__max_size = max(self.__max_size, self.size)
+        depth = 0
+        parent = node.parent
+        while parent is not None:
+            depth += 1
+            parent = parent.parent
+        if depth <= math.log(self.size) / self.__log_base:
+            return
+
+        # sizes are counted going up, only the subtree of the sibling has to be walked
+        child, child_size = node, 1
+        while child.parent is not None:
+            parent = child.parent
+            sibling = parent.right_child if child is parent.left_child else parent.left_child
+            size = child_size + 1 + sum(1 for _ in pre_order(sibling))
+            if child_size > self.__alpha * size:
+                self.__rebuild(parent, size)
+                return
+            child, child_size = parent, size
+
+    def _remove_node(self, x: Node) -> None:
+        self._unlink(x)
+        if self.size < self.__alpha * self.__max_size:
+            if self.root is not None:
+                self.__rebuild(self.root, self.size)
+            self.__max_size = self.size
+
+    def __rebuild(self, root: Node, size: int) -> None:
+        # the existing nodes are relinked, so references to them stay valid
+        nodes = list(in_order(root))
+        parent = root.parent
+        subtree = self.__build(nodes, 0, size - 1, parent)
+        if parent is None:
+            self.root = subtree
+        elif root is parent.left_child:
+            parent.left_child = subtree
+        else:
+            parent.right_child = subtree
+
+    def __build(self, nodes: list[Node], low: int, high: int, parent: Node | None) -> Node | None:
+        if low > high:
+            return None
+        mid = (low + high) // 2
+        node = nodes[mid]
+        node.parent = parent
+        node.left_child = self.__build(nodes, low, mid - 1, node)
+        node.right_child = self.__build(nodes, mid + 1, high, node)
+        return node
@@ -0,0 +1,38 @@
+from typing import Callable
+
+from AlgorithmLibrary.avl_tree import AVLTree
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+from AlgorithmLibrary.scapegoat_tree import ScapegoatTree
+from AlgorithmLibrary.treap import Treap
+
+# name -> class of a sorted set with insert, remove, contains, their batch variants and to_list
+TREES: dict[str, type] = {
+    "bst": BinarySearchTree,
+    "avl": AVLTree,
+    "treap": Treap,
+    "scapegoat": ScapegoatTree,
+    "red-black": RedBlackTree,
+}
+
+
+def create_tree(kind: str, key_type: type | None = None, **options):
+    """
+    Creates an empty search tree selected by name.
+
+    All trees share the API of BinarySearchTree, which stays unbalanced and suits only
+    keys in random order. Benchmarks.balanced_trees compares them on insert-heavy
+    and lookup-heavy workloads.
+
+    :param kind: Name of the tree, one of TREES
+    :type kind: str
+    :param key_type: The datatype of keys, same as subscripting the class
+    :type key_type: type | None
+    :param options: Options of the tree constructor, e.g. seed of Treap,
+    alpha of ScapegoatTree or order_statistics of RedBlackTree
+    :return: The new tree
+    """
+    if kind not in TREES:
+        raise ValueError("Unknown tree: " + kind + ", expected one of: " + ", ".join(TREES))
+    tree_class: Callable = TREES[kind] if key_type is None else TREES[kind][key_type]
+    return tree_class(**options)
@@ -0,0 +1,69 @@
+import random
+from typing import TypeVar
+
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from Structures.TreapNode import TreapNode as Node
+
+T = TypeVar('T')
+
+
+class Treap(BinarySearchTree[T]):
+    """
+    A class that represent treap, a binary search tree which is a heap of random priorities.
+
+    The shape equals a tree built by inserting keys in random order, so its expected
+    height is O(log n) whatever order keys come in. Balancing is cheap, an insert
+    makes 2 rotations on average, but the tree is higher than AVL or red-black tree.
+    It has the same API as BinarySearchTree.
+
+    ...
+
+    Attributes
+    ----------
+    __random : random.Random
+        Generator of node priorities
+
+    Methods
+    -------
+    insert(key: T)
+        Inserts key of datatype T, rotates it up by its priority
+    remove(key: T)
+        Removes key of datatype T, rotates it down to a leaf first
+    contains(key: T)
+        Search for key of datatype T in expected O(log n)
+    """
+    _node_class: type = Node
+
+    def __init__(self, validate: bool = True, key_type: type | None = None,
+                 seed: int | None = None) -> None:
+        """
+        It initializes the treap.
+
+        :param validate: Check datatype of keys, False trusts callers entirely
+        :type validate: bool
+        :param key_type: The datatype of keys, resolved on the first check if omitted
+        :type key_type: type | None
+        :param seed: Seed of the priorities, for a reproducible shape
+        :type seed: int | None
+        """
+        super().__init__(validate, key_type)
+        self.__random = random.Random(seed)
+
+    def _inserted(self, node: Node) -> None:
+        node.priority = self.__random.random()
+        parent = node.parent
+        while parent is not None and parent.priority < node.priority:
+            if node is parent.left_child:
+                self._rotate_right(parent)
+            else:
+                self._rotate_left(parent)
+            parent = node.parent
+
+    def _remove_node(self, x: Node) -> None:
+        # the child with higher priority moves up until x has at most one child
+        while x.left_child is not None and x.right_child is not None:
+            if x.left_child.priority > x.right_child.priority:
+                self._rotate_right(x)
+            else:
+                self._rotate_left(x)
+        self._unlink(x)
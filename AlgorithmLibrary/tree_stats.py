@@ -0,0 +1,295 @@
+import time
+from typing import TypeVar, Generic, Callable, NamedTuple
+
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+
+T = TypeVar('T')
+
+OPERATIONS = ("insert", "remove", "contains")
+
+
+class OperationStats(NamedTuple):
+    """
+    Costs of one operation, passed to the callback
+    """
+    operation: str
+    seconds: float
+    comparisons: int
+    depth: int
+    rotations: int
+    recolors: int
+
+
+class _CountingKey:
+    """
+    Wraps the searched key and counts its comparisons with node keys. It is only
+    a probe of the descent, it never becomes the key of a node.
+    Every visited node is compared for equality once, so equalities give the depth.
+    """
+    __slots__ = ('value', 'comparisons', 'equalities')
+
+    def __init__(self, value) -> None:
+        self.value = value
+        self.comparisons: int = 0
+        self.equalities: int = 0
+
+    def __eq__(self, other) -> bool:
+        self.comparisons += 1
+        self.equalities += 1
+        return self.value == other
+
+    def __ne__(self, other) -> bool:
+        self.comparisons += 1
+        self.equalities += 1
+        return self.value != other
+
+    def __lt__(self, other) -> bool:
+        self.comparisons += 1
+        return self.value < other
+
+    def __le__(self, other) -> bool:
+        self.comparisons += 1
+        return self.value <= other
+
+    def __gt__(self, other) -> bool:
+        self.comparisons += 1
+        return self.value > other
+
+    def __ge__(self, other) -> bool:
+        self.comparisons += 1
+        return self.value >= other
+
+
+class TreeStats:
+    """
+    A class that represent counters of an instrumented tree.
+
+    ...
+
+    Attributes
+    ----------
+    callback : Callable[[OperationStats], None] | None
+        Called after every operation with its costs
+    operations : dict[str, int]
+        Number of operations by name
+    comparisons, rotations, recolors : int
+        Totals over all operations, rotations and recolors include batch operations
+    depth_total, depth_max : int
+        Sum and maximum of nodes visited by a descent
+    histograms : dict[str, list[int]]
+        Latency histograms by operation, bucket i counts operations
+        which took less than 2^i nanoseconds and at least 2^(i-1)
+    """
+
+    def __init__(self, callback: Callable[[OperationStats], None] | None = None) -> None:
+        self.callback = callback
+        self.operations: dict[str, int] = dict.fromkeys(OPERATIONS, 0)
+        self.comparisons: int = 0
+        self.rotations: int = 0
+        self.recolors: int = 0
+        self.depth_total: int = 0
+        self.depth_max: int = 0
+        self.histograms: dict[str, list[int]] = {name: [0] * 64 for name in OPERATIONS}
+
+    def record(self, operation: str, nanoseconds: int, key: _CountingKey,
+               rotations: int, recolors: int) -> None:
+        """
+        Adds one finished operation
+
+        :param operation: Name of the operation
+        :param nanoseconds: Duration of the operation
+        :param key: The counting key used by the operation
+        :param rotations: Rotations done by the operation
+        :param recolors: Recolored nodes of the operation
+        """
+        self.operations[operation] += 1
+        self.comparisons += key.comparisons
+        self.depth_total += key.equalities
+        self.depth_max = max(self.depth_max, key.equalities)
+        self.histograms[operation][min(nanoseconds.bit_length(), 63)] += 1
+        if self.callback is not None:
+            self.callback(OperationStats(operation, nanoseconds / 1e9, key.comparisons,
+                                         key.equalities, rotations, recolors))
+
+    def snapshot(self) -> dict:
+        """
+        Returns a copy of the counters. Histograms contain only non-empty buckets,
+        keyed by their upper bound in nanoseconds.
+
+        :return: The counters as a dictionary
+        """
+        count = sum(self.operations.values())
+        return {
+            "operations": dict(self.operations),
+            "comparisons": self.comparisons,
+            "rotations": self.rotations,
+            "recolors": self.recolors,
+            "depth_mean": self.depth_total / count if count else 0.0,
+            "depth_max": self.depth_max,
+            "latency_ns": {name: {1 << i: n for i, n in enumerate(buckets) if n}
+                           for name, buckets in self.histograms.items()},
+        }
+
+
+class _InstrumentedTree(Generic[T]):
+    """
+    Mixin placed in front of the tree class while stats are enabled. Insert, remove and
+    contains search with a counting key and measure their time. It derives from Generic
+    like the trees, so instances of both have the same layout and can switch classes.
+    """
+    _plain_class: type = None
+    _stats: TreeStats
+
+    def stats(self) -> dict:
+        """
+        Returns snapshot of the counters
+
+        :return: The counters as a dictionary
+        """
+        return self._stats.snapshot()
+
+    def insert(self, value) -> bool:
+        self._check_value(value)
+
+        start = self.__begin()
+        sort_key = self._sort_key(value)
+        key = _CountingKey(sort_key)
+        # only the descent sees the counting key, the node is built with the key itself
+        node, created = self._insert_key(sort_key, key)
+        if created:
+            self._set_item(node, value)
+        self.__end("insert", start, key)
+        return created
+
+    def remove(self, value) -> None:
+        self._check_value(value)
+
+        start = self.__begin()
+        key = _CountingKey(self._sort_key(value))
+        node = self._find_node(key)
+        if node is not None:
+            self._remove_node(node)
+        self.__end("remove", start, key)
+
+    def contains(self, value) -> bool:
+        self._check_value(value)
+
+        start = self.__begin()
+        key = _CountingKey(self._sort_key(value))
+        found = self._find_node(key) is not None
+        self.__end("contains", start, key)
+        return found
+
+    def __begin(self) -> tuple[int, int, int]:
+        return time.perf_counter_ns(), self._stats.rotations, self._stats.recolors
+
+    def __end(self, operation: str, start: tuple[int, int, int], key: _CountingKey) -> None:
+        stats = self._stats
+        stats.record(operation, time.perf_counter_ns() - start[0], key,
+                     stats.rotations - start[1], stats.recolors - start[2])
+
+
+class _InstrumentedBinarySearchTree(_InstrumentedTree):
+    """
+    BinarySearchTree has no key function, values are the keys themselves
+    """
+
+    def _sort_key(self, value):
+        return value
+
+    def _set_item(self, node, value) -> None:
+        pass
+
+
+class _InstrumentedRedBlackTree(_InstrumentedTree):
+    """
+    Adds counting of rotations and recolors. The private balancing methods of RedBlackTree
+    are overridden under their mangled names; recolors are found by comparing colors
+    of the nodes the balancing can reach before and after it.
+    """
+
+    def _RedBlackTree__left_rotation(self, x) -> None:
+        self._stats.rotations += 1
+        super()._RedBlackTree__left_rotation(x)
+
+    def _RedBlackTree__right_rotation(self, x) -> None:
+        self._stats.rotations += 1
+        super()._RedBlackTree__right_rotation(x)
+
+    def _RedBlackTree__insert_balance(self, x) -> bool:
+        # colors change only on the path up from x and at uncles
+        colors = {}
+        node = x
+        while node is not None:
+            colors[node] = node.color
+            parent = node.parent
+            if parent is not None:
+                sibling = parent.left_child if node is parent.right_child \
+                    else parent.right_child
+                colors[sibling] = sibling.color
+            node = parent
+        grew = super()._RedBlackTree__insert_balance(x)
+        self.__count_recolors(colors)
+        return grew
+
+    def _RedBlackTree__remove_balance(self, x, parent) -> bool:
+        # colors change at x, on the path up from its parent and up to three levels below it
+        colors = {x: x.color}
+        ancestor = parent
+        while ancestor is not None:
+            level = [ancestor]
+            for _ in range(4):
+                for node in level:
+                    colors[node] = node.color
+                level = [child for node in level
+                         for child in (node.left_child, node.right_child) if child is not None]
+            ancestor = ancestor.parent
+        shrunk = super()._RedBlackTree__remove_balance(x, parent)
+        self.__count_recolors(colors)
+        return shrunk
+
+    def __count_recolors(self, colors: dict) -> None:
+        self._stats.recolors += sum(node.color is not color for node, color in colors.items())
+
+
+# tree class -> its instrumented subclass
+_instrumented_classes: dict[type, type] = {}
+
+
+def enable_stats(tree, callback: Callable[[OperationStats], None] | None = None) -> None:
+    """
+    Starts collecting stats of RedBlackTree, BinarySearchTree or their subclass.
+    The class of the tree is switched to an instrumented subclass, so a tree
+    without stats runs exactly the code it would run without this module.
+
+    :param tree: The tree to instrument
+    :param callback: Called after every insert, remove and contains with its OperationStats
+    """
+    if isinstance(tree, _InstrumentedTree):
+        tree._stats.callback = callback
+        return
+    plain_class = type(tree)
+    if plain_class not in _instrumented_classes:
+        if issubclass(plain_class, RedBlackTree):
+            mixin = _InstrumentedRedBlackTree
+        elif issubclass(plain_class, BinarySearchTree):
+            mixin = _InstrumentedBinarySearchTree
+        else:
+            raise TypeError("Stats are not supported for: " + plain_class.__name__)
+        _instrumented_classes[plain_class] = type("Instrumented" + plain_class.__name__,
+                                                  (mixin, plain_class),
+                                                  {"_plain_class": plain_class})
+    tree._stats = TreeStats(callback)
+    tree.__class__ = _instrumented_classes[plain_class]
+
+
+def disable_stats(tree) -> None:
+    """
+    Stops collecting stats, the tree gets back its own class
+
+    :param tree: The instrumented tree
+    """
+    if isinstance(tree, _InstrumentedTree):
+        tree.__class__ = tree._plain_class
+        del tree._stats
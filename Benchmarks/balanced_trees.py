@@ -0,0 +1,95 @@
+"""
+Benchmark of the balanced search trees on mixed workloads: an insert-heavy mix
+(90 % inserts, 10 % lookups) and a lookup-heavy mix (10 % inserts, 90 % lookups),
+with keys arriving in random or mostly sorted order. Prints time per operation
+and the fastest tree of every case.
+
+Run: python -m Benchmarks.balanced_trees [size] [bst_limit]
+"""
+import random
+import sys
+import time
+
+from AlgorithmLibrary.search_trees import create_tree
+
+KINDS = ("bst", "avl", "treap", "scapegoat", "red-black")
+# name -> share of inserts in the operation stream
+MIXES: dict[str, float] = {"insert-heavy": 0.9, "lookup-heavy": 0.1}
+
+
+def random_keys(size: int, rng: random.Random) -> list[int]:
+    return rng.sample(range(4 * size), size)
+
+
+def mostly_sorted_keys(size: int, rng: random.Random) -> list[int]:
+    """
+    Ascending keys where 5 % of positions are swapped with a random other one,
+    like an ingest of timestamps which arrive slightly out of order
+    """
+    keys = list(range(size))
+    for _ in range(size // 20):
+        i, j = rng.randrange(size), rng.randrange(size)
+        keys[i], keys[j] = keys[j], keys[i]
+    return keys
+
+
+ORDERS = {"random": random_keys, "mostly sorted": mostly_sorted_keys}
+
+
+def operations(keys: list[int], insert_share: float, rng: random.Random) -> list[tuple[bool, int]]:
+    """
+    Interleaves inserts of keys with lookups, half of them of already inserted keys
+
+    :return: Pairs (is insert, key)
+    """
+    result = []
+    inserted = []
+    remaining = iter(keys)
+    while len(inserted) < len(keys):
+        if rng.random() < insert_share:
+            key = next(remaining)
+            inserted.append(key)
+            result.append((True, key))
+        elif inserted and rng.random() < 0.5:
+            result.append((False, inserted[rng.randrange(len(inserted))]))
+        else:
+            result.append((False, -1 - rng.randrange(len(keys))))
+    return result
+
+
+def measure(kind: str, stream: list[tuple[bool, int]]) -> float:
+    """
+    :return: Seconds per operation of the whole stream
+    """
+    tree = create_tree(kind, int)
+    insert, contains = tree.insert, tree.contains
+    start = time.perf_counter()
+    for is_insert, key in stream:
+        if is_insert:
+            insert(key)
+        else:
+            contains(key)
+    return (time.perf_counter() - start) / len(stream)
+
+
+def main(size: int = 100_000, bst_limit: int = 20_000) -> None:
+    print("{:>13}  {:>13}".format("keys", "mix") +
+          "".join("  {:>10}".format(kind) for kind in KINDS) + "  [us/op]  fastest")
+    for order, make_keys in ORDERS.items():
+        for mix, insert_share in MIXES.items():
+            rng = random.Random(0)
+            stream = operations(make_keys(size, rng), insert_share, rng)
+            times = {}
+            for kind in KINDS:
+                # the plain tree degenerates on sorted keys, O(n) per operation
+                if kind == "bst" and order != "random" and size > bst_limit:
+                    continue
+                times[kind] = measure(kind, stream)
+            print("{:>13}  {:>13}".format(order, mix) + "".join(
+                "  {:>10.2f}".format(times[kind] * 1e6) if kind in times
+                else "  {:>10}".format("skipped") for kind in KINDS) +
+                "           " + min(times, key=times.get))
+
+
+if __name__ == "__main__":
+    main(*[int(float(arg)) for arg in sys.argv[1:]])
@@ -0,0 +1,51 @@
+"""
+Crossover benchmark of BTree against RedBlackTree: time of random inserts,
+lookups and removals by number of keys, for several B-tree fanouts.
+
+Run: python -m Benchmarks.btree_crossover [max_size]
+"""
+import random
+import sys
+import time
+
+from AlgorithmLibrary.b_tree import BTree
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+
+
+def measure(tree, keys: list[int]) -> tuple[float, float, float]:
+    """
+    :return: Seconds per operation of insert, contains and remove
+    """
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    inserted = time.perf_counter()
+    for key in keys:
+        tree.contains(key)
+    searched = time.perf_counter()
+    for key in keys:
+        tree.remove(key)
+    removed = time.perf_counter()
+    count = len(keys)
+    return (inserted - start) / count, (searched - inserted) / count, (removed - searched) / count
+
+
+def main(max_size: int = 1_000_000) -> None:
+    fanouts = (8, 32, 128)
+    print("{:>9}  {:>22}".format("size", "red-black [us/op]") +
+          "".join("  {:>22}".format("B-tree " + str(f) + " [us/op]") for f in fanouts))
+    print("{:>9}  {:>22}".format("", "insert/contains/remove") +
+          "  {:>22}".format("insert/contains/remove") * len(fanouts))
+    size = 1_000
+    while size <= max_size:
+        keys = random.sample(range(4 * size), size)
+        columns = [measure(RedBlackTree[int](), keys)]
+        columns += [measure(BTree[int](fanout), keys) for fanout in fanouts]
+        print("{:>9,}".format(size) + "".join(
+            "  {:>6.2f} {:>7.2f} {:>7.2f}".format(*(t * 1e6 for t in column))
+            for column in columns))
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
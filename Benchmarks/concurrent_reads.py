@@ -0,0 +1,103 @@
+"""
+Stress benchmark of ConcurrentTree: read throughput by number of reader threads
+while one writer keeps changing the tree, against a single global lock. The last
+column wraps PersistentRedBlackTree, whose readers search published snapshots
+without taking any lock.
+
+Run: python -m Benchmarks.concurrent_reads [size] [seconds]
+"""
+import random
+import sys
+import threading
+import time
+
+from AlgorithmLibrary.concurrent_tree import ConcurrentTree
+from AlgorithmLibrary.persistent_red_black_tree import PersistentRedBlackTree
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+
+
+class GlobalLockTree:
+    """
+    Baseline wrapper which serializes every operation on one lock
+    """
+
+    def __init__(self, tree) -> None:
+        self.__tree = tree
+        self.__lock: threading.Lock = threading.Lock()
+
+    def insert(self, value) -> bool:
+        with self.__lock:
+            return self.__tree.insert(value)
+
+    def remove(self, value) -> None:
+        with self.__lock:
+            self.__tree.remove(value)
+
+    def contains(self, value) -> bool:
+        with self.__lock:
+            return self.__tree.contains(value)
+
+
+def measure(wrapper, size: int, readers: int, seconds: float, batched: bool = False) -> float:
+    """
+    Runs reader threads and one writer for given time
+
+    :return: Reads per second summed over all reader threads
+    """
+    stop = threading.Event()
+    counts = [0] * readers
+
+    def read(index: int) -> None:
+        rng = random.Random(index)
+        reads = 0
+        while not stop.is_set():
+            batch = [rng.randrange(2 * size) for _ in range(100)]
+            if batched:
+                wrapper.contains_many(batch)
+            else:
+                for key in batch:
+                    wrapper.contains(key)
+            reads += 100
+        counts[index] = reads
+
+    def write() -> None:
+        rng = random.Random(-1)
+        while not stop.is_set():
+            key = rng.randrange(2 * size)
+            wrapper.insert(key)
+            wrapper.remove(key)
+            time.sleep(0.0005)
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / seconds
+
+
+def persistentTree(keys: list[int]) -> PersistentRedBlackTree[int]:
+    tree = PersistentRedBlackTree[int]()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def main(size: int = 100_000, seconds: float = 2.0) -> None:
+    keys = random.sample(range(2 * size), size)
+    print("readers  global lock  concurrent  concurrent batched  snapshot reads   [reads/s]")
+    for readers in (1, 2, 4, 8):
+        results = []
+        for wrapper_class, build, batched in ((GlobalLockTree, RedBlackTree.from_iterable, False),
+                                              (ConcurrentTree, RedBlackTree.from_iterable, False),
+                                              (ConcurrentTree, RedBlackTree.from_iterable, True),
+                                              (ConcurrentTree, persistentTree, False)):
+            results.append(measure(wrapper_class(build(keys)), size, readers, seconds, batched))
+        print("{:7d}  {:11,.0f}  {:10,.0f}  {:18,.0f}  {:14,.0f}".format(readers, *results))
+
+
+if __name__ == "__main__":
+    main(*[cast(arg) for cast, arg in zip((int, float), sys.argv[1:])])
@@ -0,0 +1,272 @@
+"""
+Benchmark suite of the search trees against a sorted list with bisect
+and the built-in set: time of insert, contains, remove and to_list for several key
+streams, int and long string keys and several sizes. Results are written as JSON,
+so runs of different releases can be compared.
+
+Run: python -m Benchmarks.suite [--sizes 1e3 1e4 1e5] [--output results.json]
+     python -m Benchmarks.suite --sizes 1e3 1e4 1e5 1e6 1e7 --workloads random zipfian
+
+Quadratic cases are capped and recorded as skipped above the cap: a degenerate
+BinarySearchTree walks O(n) nodes per operation (--bst-limit keys), a sorted list
+moves O(n) references per insert or removal in the middle (--list-limit keys).
+"""
+import argparse
+import bisect
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from AlgorithmLibrary.avl_tree import AVLTree
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+from AlgorithmLibrary.scapegoat_tree import ScapegoatTree
+from AlgorithmLibrary.treap import Treap
+
+OPERATIONS = ("insert", "contains", "remove", "to_list")
+
+
+class SortedListBaseline:
+    """
+    Sorted list with bisect, inserts and removals shift the tail of the list
+    """
+
+    def __init__(self) -> None:
+        self.__keys: list = []
+
+    def insert(self, value) -> bool:
+        index = bisect.bisect_left(self.__keys, value)
+        if index < len(self.__keys) and self.__keys[index] == value:
+            return False
+        self.__keys.insert(index, value)
+        return True
+
+    def remove(self, value) -> None:
+        index = bisect.bisect_left(self.__keys, value)
+        if index < len(self.__keys) and self.__keys[index] == value:
+            del self.__keys[index]
+
+    def contains(self, value) -> bool:
+        index = bisect.bisect_left(self.__keys, value)
+        return index < len(self.__keys) and self.__keys[index] == value
+
+    def to_list(self) -> list:
+        return list(self.__keys)
+
+
+class SetBaseline:
+    """
+    Built-in hash set, to_list has to sort the keys
+    """
+
+    def __init__(self) -> None:
+        self.__keys: set = set()
+
+    def insert(self, value) -> bool:
+        size = len(self.__keys)
+        self.__keys.add(value)
+        return len(self.__keys) != size
+
+    def remove(self, value) -> None:
+        self.__keys.discard(value)
+
+    def contains(self, value) -> bool:
+        return value in self.__keys
+
+    def to_list(self) -> list:
+        return sorted(self.__keys)
+
+
+# name -> factory taking the key datatype
+STRUCTURES: dict[str, Callable] = {
+    "BinarySearchTree": lambda key_type: BinarySearchTree[key_type](),
+    "RedBlackTree": lambda key_type: RedBlackTree[key_type](),
+    "AVLTree": lambda key_type: AVLTree[key_type](),
+    "Treap": lambda key_type: Treap[key_type](seed=0),
+    "ScapegoatTree": lambda key_type: ScapegoatTree[key_type](),
+    "sorted list": lambda key_type: SortedListBaseline(),
+    "set": lambda key_type: SetBaseline(),
+}
+
+
+def random_stream(size: int, rng: random.Random) -> list[int]:
+    return rng.sample(range(4 * size), size)
+
+
+def ascending_stream(size: int, rng: random.Random) -> list[int]:
+    return list(range(size))
+
+
+def descending_stream(size: int, rng: random.Random) -> list[int]:
+    return list(range(size - 1, -1, -1))
+
+
+def zipfian_stream(size: int, rng: random.Random, skew: float = 1.1) -> list[int]:
+    """
+    Keys drawn with probability proportional to 1 / rank^skew, so a few keys
+    repeat often; ranks are shuffled over the key space
+    """
+    keys = rng.sample(range(4 * size), size)
+    weights = list(itertools.accumulate(1 / rank ** skew for rank in range(1, size + 1)))
+    return rng.choices(keys, cum_weights=weights, k=size)
+
+
+def adversarial_stream(size: int, rng: random.Random) -> list[int]:
+    """
+    Alternating smallest and greatest remaining key: 0, n-1, 1, n-2, ...
+    It makes a zig-zag path of BinarySearchTree and rebalances RedBlackTree often.
+    """
+    low, high = range(size // 2), range(size - 1, size // 2 - 1, -1)
+    stream = [key for pair in zip(low, high) for key in pair]
+    if size % 2:
+        stream.append(size // 2)
+    return stream
+
+
+WORKLOADS: dict[str, Callable[[int, random.Random], list[int]]] = {
+    "random": random_stream,
+    "ascending": ascending_stream,
+    "descending": descending_stream,
+    "zipfian": zipfian_stream,
+    "adversarial": adversarial_stream,
+}
+
+
+def long_string(key: int) -> str:
+    """
+    Maps int key to a 64 character string with a long common prefix,
+    so comparisons cost more than for ints. The order of keys is kept.
+    """
+    return "benchmark-key-" + "x" * 38 + "{:012d}".format(key)
+
+
+KEY_TYPES: dict[str, tuple[type, Callable]] = {
+    "int": (int, int),
+    "str": (str, long_string),
+}
+
+
+def size_limit(structure: str, workload: str, bst_limit: int, list_limit: int) -> int | None:
+    """
+    Returns the greatest size measured for the structure on the workload, None means
+    no limit. Limited are the cases which need O(n) time per operation.
+    """
+    if structure == "BinarySearchTree" and workload in ("ascending", "descending",
+                                                         "adversarial"):
+        return bst_limit
+    if structure == "sorted list" and workload != "ascending":
+        return list_limit
+    return None
+
+
+def measure(structure: Callable, stream: list, lookups: list) -> dict[str, float]:
+    """
+    Runs all operations on a new structure
+
+    :param structure: Factory of the empty structure
+    :param stream: Keys to insert and then remove
+    :param lookups: Keys to search for, half of them are missing
+    :return: Seconds of every operation
+    """
+    seconds = {}
+    tree = structure()
+    start = time.perf_counter()
+    for key in stream:
+        tree.insert(key)
+    seconds["insert"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in lookups:
+        tree.contains(key)
+    seconds["contains"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree.to_list()
+    seconds["to_list"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in stream:
+        tree.remove(key)
+    seconds["remove"] = time.perf_counter() - start
+    return seconds
+
+
+def run(sizes: Iterable[int], structures: Iterable[str], workloads: Iterable[str],
+        key_types: Iterable[str], repeat: int = 1, bst_limit: int = 20_000,
+        list_limit: int = 200_000, seed: int = 0, log=sys.stderr) -> list[dict]:
+    """
+    Runs every combination and returns one record per structure, workload, key datatype,
+    size and operation. Every case is run repeat times and the fastest run is kept.
+    """
+    results = []
+    for size, workload, key_name in itertools.product(sizes, workloads, key_types):
+        key_type, convert = KEY_TYPES[key_name]
+        rng = random.Random(seed)
+        stream = [convert(key) for key in WORKLOADS[workload](size, rng)]
+        lookups = stream[:size // 2] + [convert(key) for key in
+                                        rng.sample(range(4 * size, 8 * size), size - size // 2)]
+        rng.shuffle(lookups)
+
+        for name in structures:
+            case = {"structure": name, "workload": workload, "key_type": key_name,
+                    "size": size}
+            limit = size_limit(name, workload, bst_limit, list_limit)
+            if limit is not None and size > limit:
+                results.extend(dict(case, operation=operation, skipped="quadratic")
+                               for operation in OPERATIONS)
+                print("{:>16}  {:>11}  {:>3}  {:>10,}  skipped".format(
+                    name, workload, key_name, size), file=log)
+                continue
+
+            runs = [measure(lambda: STRUCTURES[name](key_type), stream, lookups)
+                    for _ in range(repeat)]
+            for operation in OPERATIONS:
+                seconds = min(result[operation] for result in runs)
+                count = 1 if operation == "to_list" else len(stream)
+                results.append(dict(case, operation=operation, seconds=seconds,
+                                    ns_per_op=seconds / count * 1e9))
+            print("{:>16}  {:>11}  {:>3}  {:>10,}  ".format(name, workload, key_name, size) +
+                  "  ".join("{} {:.3f}s".format(operation, min(r[operation] for r in runs))
+                            for operation in OPERATIONS), file=log)
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", nargs="+", type=lambda arg: int(float(arg)),
+                        default=[1_000, 10_000, 100_000])
+    parser.add_argument("--structures", nargs="+", choices=STRUCTURES, default=list(STRUCTURES))
+    parser.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument("--keys", nargs="+", choices=KEY_TYPES, default=list(KEY_TYPES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--bst-limit", type=int, default=20_000)
+    parser.add_argument("--list-limit", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="", help="name of the measured release")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.structures, args.workloads, args.keys,
+                  args.repeat, args.bst_limit, args.list_limit, args.seed)
+    report = {
+        "label": args.label,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "parameters": {"sizes": args.sizes, "repeat": args.repeat, "bst_limit": args.bst_limit,
+                       "list_limit": args.list_limit, "seed": args.seed},
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=1)
+    print("written " + str(len(results)) + " records to " + args.output, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,68 @@
+from typing import IO, Iterable, Iterator
 from Structures.Node import Node
 from Structures.Edge import Edge
+from StructureDrawer.tree_layout import TreeLayout
 from Utilities.Config import Config
 import json
 
+# templates are filled by the % operator, it is faster than str.format for many elements
+NODE_TEMPLATE: str = '<g class="point" transform="translate(%s,%s)">' \
+                     '<circle></circle>' \
+                     '<text class="pointIndex" text-anchor="middle" y="5">' \
+                     '%s' \
+                     '</text>' \
+                     '</g>'
+EDGE_TEMPLATE: str = '<line x1="%s" y1="%s" x2="%s" y2="%s" stroke="black"/>'
+
+# size of the write buffer of save(), fragments are joined in memory up to it
+BUFFER_SIZE: int = 1 << 20
+
+
+def writeFragments(file: str | IO[str], fragments: Iterable[str]) -> None:
+    """
+    Writes fragments to a path or an open text file, which is left open. Fragments
+    are joined into chunks of BUFFER_SIZE characters, so the file gets one write per chunk.
+    """
+    if isinstance(file, str):
+        with open(file, "w", encoding="utf-8", buffering=BUFFER_SIZE) as opened:
+            writeFragments(opened, fragments)
+        return
+    chunk: list[str] = []
+    length: int = 0
+    for fragment in fragments:
+        chunk.append(fragment)
+        length += len(fragment)
+        if length >= BUFFER_SIZE:
+            file.write("".join(chunk))
+            chunk.clear()
+            length = 0
+    file.write("".join(chunk))
+
+
+def readJSONLines(file_name: str) -> Iterator[tuple[str, dict]]:
+    """
+    Lazily reads a graph stored as one JSON object per line, nodes as
+    {"key": 1, "x": 80, "y": 80} and edges as {"first": 1, "second": "ABC"}.
+    Blank lines are skipped.
+
+    :return: Iterator over pairs of kind, "node" or "edge", and the object
+    """
+    with open(file_name, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if "key" in item:
+                yield "node", item
+            elif "first" in item and "second" in item:
+                yield "edge", item
+            else:
+                raise ValueError("Line " + str(number) + " of " + file_name +
+                                 " is neither a node nor an edge")
+
 
 def nodeToSVG(node: (Node, (int, int))) -> str:
-    return '<g class="point" transform="translate({x},{y})">' \
-           '<circle></circle>' \
-           '<text class="pointIndex" text-anchor="middle" y="5">' \
-           '{key}' \
-           '</text>' \
-           '</g>' \
-        .format(key=str(node[0].key), x=node[1][0], y=node[1][1])
+    return NODE_TEMPLATE % (node[1][0], node[1][1], node[0].key)
 
 
 class SVGWriter:
@@ -22,49 +73,114 @@ class SVGWriter:
         self.__y_size: int = y_size
         self.__nodes: list[(Node, (int, int))] = list()
         self.__edges: list[Edge] = list()
+        # id of added node -> its coords, the nodes are kept alive by self.__nodes
+        self.__coords: dict[int, (int, int)] = dict()
 
     def addNode(self, node: Node, x: int, y: int) -> None:
         self.__nodes.append((node, (x, y)))
+        self.__coords.setdefault(id(node), (x, y))
 
     def addEdge(self, a: Node, b: Node) -> None:
         self.__edges.append(Edge(a, b))
 
+    def addLayout(self, layout: TreeLayout) -> None:
+        # adds all nodes and edges of the layout, the canvas grows to hold it
+        for node, x, y in zip(layout.nodes, layout.xs, layout.ys):
+            self.addNode(node, x, y)
+        for parent, child in layout.edges():
+            self.addEdge(layout.nodes[parent], layout.nodes[child])
+        self.__x_size = max(self.__x_size, layout.width)
+        self.__y_size = max(self.__y_size, layout.height)
+
     def edgeToSVG(self, edge: Edge) -> str:
-        # find coords of nodes
-        first: (int, int) = [x for x in self.__nodes if x[0] == edge.first][0][1]
-        second: (int, int) = [x for x in self.__nodes if x[0] == edge.second][0][1]
-        return '<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="black"/>' \
-            .format(x1=first[0], y1=first[1], x2=second[0], y2=second[1])
-
-    def save(self, file_name: str):
-        with open(file_name, "w", encoding="utf-8") as file:
-            # Write header SVG tag
-            file.write('<svg version="1.1" xmlns="http://www.w3.org/2000/svg" '
-                       'width="{x}" height="{y}">\n'.format(x=self.__x_size, y=self.__y_size))
-
-            # Write styles
-            file.write(self.__cfg.get("styles")+"\n")
-
-            # Write edges
-            for edge in self.__edges:
-                file.write(self.edgeToSVG(edge))
-                print(self.edgeToSVG(edge))
-
-            # Write nodes
-            for node in self.__nodes:
-                file.write(nodeToSVG(node))
-                print(nodeToSVG(node))
-
-            # Write footer SVG tag
-            file.write("</svg>")
+        return EDGE_TEMPLATE % (self.__coordsOf(edge.first) + self.__coordsOf(edge.second))
+
+    def save(self, file: str | IO[str]) -> None:
+        # file is a path or an open text file, which is left open
+        writeFragments(file, self.fragments())
+
+    def write(self, file: IO[str]) -> None:
+        writeFragments(file, self.fragments())
+
+    def fragments(self) -> Iterator[str]:
+        yield from self.__header()
+
+        # Edges
+        coords = self.__coords
+        for edge in self.__edges:
+            first = coords.get(id(edge.first)) or self.__coordsOf(edge.first)
+            second = coords.get(id(edge.second)) or self.__coordsOf(edge.second)
+            yield EDGE_TEMPLATE % (first + second)
+
+        # Nodes
+        for node, (x, y) in self.__nodes:
+            yield NODE_TEMPLATE % (x, y, node.key)
+
+        # Footer SVG tag
+        yield "</svg>"
+
+    def convertJSONLines(self, file_name: str, output: str | IO[str]) -> None:
+        # Streams a graph in JSON Lines to SVG without building it. Only a key -> coords
+        # index of nodes is kept in memory. Edges have to be drawn under the nodes,
+        # so the input is read three times: the index, the edges and the nodes.
+        writeFragments(output, self.__jsonLinesFragments(file_name))
+
+    def __jsonLinesFragments(self, file_name: str) -> Iterator[str]:
+        coords: dict = dict()
+        for kind, item in readJSONLines(file_name):
+            if kind == "node":
+                coords.setdefault(item["key"], (item["x"], item["y"]))
+
+        yield from self.__header()
+
+        for kind, item in readJSONLines(file_name):
+            if kind == "edge":
+                if item["first"] not in coords or item["second"] not in coords:
+                    raise ValueError("Edge between unknown nodes: " +
+                                     str(item["first"]) + ", " + str(item["second"]))
+                yield EDGE_TEMPLATE % (coords[item["first"]] + coords[item["second"]])
+
+        for kind, item in readJSONLines(file_name):
+            if kind == "node":
+                yield NODE_TEMPLATE % (item["x"], item["y"], item["key"])
+
+        yield "</svg>"
+
+    def __header(self) -> Iterator[str]:
+        # Header SVG tag
+        yield '<svg version="1.1" xmlns="http://www.w3.org/2000/svg" ' \
+              'width="{x}" height="{y}">\n'.format(x=self.__x_size, y=self.__y_size)
+
+        # Styles
+        yield self.__cfg.get("styles") + "\n"
 
     def loadFromJSON(self, file_name: str):
         with open(file_name, "r", encoding="utf-8") as f:
-            load = json.loads(f.read())
-        for node in load["nodes"]:
-            self.__nodes.append((Node(node["key"]), (node["x"], node["y"])))
-        for edge in load["edges"]:
-            self.__edges.append(Edge(
-                [x for x in self.__nodes if edge["first"] == x[0].key][0][0],
-                [x for x in self.__nodes if edge["second"] == x[0].key][0][0]
-            ))
+            load = json.load(f)
+        self.__addGraph(load["nodes"], load["edges"])
+
+    def loadFromJSONLines(self, file_name: str):
+        # nodes and edges are built in memory, convertJSONLines() streams them instead
+        nodes, edges = [], []
+        for kind, item in readJSONLines(file_name):
+            (nodes if kind == "node" else edges).append(item)
+        self.__addGraph(nodes, edges)
+
+    def __addGraph(self, nodes: list[dict], edges: list[dict]):
+        # key -> first loaded node with it
+        by_key: dict = dict()
+        for item in nodes:
+            node = Node(item["key"])
+            self.addNode(node, item["x"], item["y"])
+            by_key.setdefault(item["key"], node)
+        for edge in edges:
+            if edge["first"] not in by_key or edge["second"] not in by_key:
+                raise ValueError("Edge between unknown nodes: " +
+                                 str(edge["first"]) + ", " + str(edge["second"]))
+            self.addEdge(by_key[edge["first"]], by_key[edge["second"]])
+
+    def __coordsOf(self, node: Node) -> (int, int):
+        coords = self.__coords.get(id(node))
+        if coords is None:
+            raise ValueError("Edge ends at a node which was not added: " + str(node.key))
+        return coords
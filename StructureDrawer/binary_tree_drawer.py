@@ -1,11 +1,17 @@
-import random
-from AlgorithmLibrary.binary_search_tree import BinarySearchTree, Node, T
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from Structures.Node import Node, T
+from Structures.Traversal import height
+from StructureDrawer.render_cache import NodeSprites
+from StructureDrawer.tiled_renderer import TiledRenderer
+from StructureDrawer.tree_layout import TreeLayout, layoutTree, tidyLayout
 import matplotlib.pyplot as plt
 from Utilities.Config import Config
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 
-class ChartNode(Node):
+class ChartNode(Node[T]):
+    __slots__ = ('x', 'y')
+
     def __init__(self, value: T, x: int, y: int):
         super().__init__(value)
         self.x: int = x
@@ -13,15 +19,8 @@ class ChartNode(Node):
 
 
 def getTreeDepth(node: Node, depth: int) -> int:
-    ldepth: int = 0
-    rdepth: int = 0
-    if node.left_child is not None:
-        ldepth = getTreeDepth(node.left_child, depth+1)
-    if node.right_child is not None:
-        rdepth = getTreeDepth(node.right_child, depth+1)
-    if ldepth+rdepth != 0:
-        depth = ldepth if ldepth > rdepth else rdepth
-    return depth
+    # depth of the deepest node, counted from the given depth of node
+    return depth+height(node)-1
 
 
 class Drawing:
@@ -33,11 +32,19 @@ class Drawing:
     def __init__(self, x_size: int, y_size: int, config: str):
         self.__cfg_file: str = config
         self.__cfg: Config = Config(config)
+        # fonts and node sprites are kept across canvases
+        self.__sprites: NodeSprites = NodeSprites()
+        self.__newCanvas(x_size, y_size)
+
+    def __newCanvas(self, x_size: int, y_size: int) -> None:
         self.__x_size = x_size
         self.__y_size = y_size
         self.__background: Drawing.Layer = self.Layer(x_size, y_size, (255, 255, 255, 255))
         self.__layout: Drawing.Layer = self.Layer(x_size, y_size, (255, 255, 255, 0))
-        self.__layout: Drawing.Layer = self.Layer(x_size, y_size, (255, 255, 255, 0))
+
+    def cacheStats(self) -> dict[str, dict[str, int]]:
+        # hits and misses of the font and the sprite cache
+        return self.__sprites.stats()
 
     def drawGrid(self, step: int) -> None:
         for x_pos in range(0, self.__x_size, step):
@@ -49,26 +56,22 @@ class Drawing:
                                         fill=(169, 169, 169),
                                         width=1)
 
-    def drawNodeAt(self, node: Node, x: int, y: int) -> None:
+    def drawNodeAt(self, node: Node, x: int, y: int,
+                   fill: tuple[int, int, int] = (255, 255, 255),
+                   outline: tuple[int, int, int] = (0, 0, 0)) -> None:
         node_radius = self.__cfg.get("node_radius")
-        node_line_width = self.__cfg.get("node_line_width")
-        x_min, y_min = x-(node_radius / 2), y-(node_radius / 2)
-        text_height: int = node_radius
-        font: ImageFont = ImageFont.truetype("Roboto-Medium.ttf", text_height)
-        text_width: float = self.__layout.draw.textlength(str(node.key), font)
-        text_ratio: float = (node_radius * (1 / 2)) / text_width
-
-        font = ImageFont.truetype("Roboto-Medium.ttf", int(text_height * text_ratio))
-
-        self.__layout.draw.ellipse((x_min, y_min, x_min+node_radius, y_min+node_radius),
-                                   outline=(0, 0, 0),
-                                   fill=(255, 255, 255),
-                                   width=node_line_width)
-        self.__layout.draw.text((x, y), str(node.key),
-                                align="center",
-                                anchor="mm",
-                                fill=(0, 0, 0),
-                                font=font)
+        label: str = str(node.key)
+        sprite, font = self.__sprites.sprite(label, node_radius,
+                                             self.__cfg.get("node_line_width"), fill, outline)
+
+        x_min, y_min = int(x-(node_radius / 2)), int(y-(node_radius / 2))
+        self.__layout.image.paste(sprite, (x_min, y_min), sprite)
+        if font is not None:
+            self.__layout.draw.text((x, y), label,
+                                    align="center",
+                                    anchor="mm",
+                                    fill=outline,
+                                    font=font)
 
     def drawNode(self, node: ChartNode) -> None:
         self.drawNodeAt(node, node.x, node.y)
@@ -78,61 +81,51 @@ class Drawing:
                                 fill=(0, 0, 0),
                                 width=self.__cfg.get("line_width"))
 
-    def drawNodeTree(self, node: Node, x_pos: int, y_depth: int) -> None:
-        y_step: int = self.__cfg.get("node_radius")
-        new_depth: int = int(y_depth+y_step * 1.5)
-        height: int = int(new_depth / y_step)
-        x_step: int = int(self.__x_size / (2 ** height))
-        x_left: int = int(x_pos-x_step)
-        x_right: int = int(x_pos+x_step)
-        if node.left_child is not None:
-            self.drawNodeConnection(
-                    ChartNode(node.key, x_pos, y_depth),
-                    ChartNode(node.left_child, x_left, new_depth))
-            self.drawNodeTree(node.left_child, x_left, new_depth)
-        if node.right_child is not None:
-            self.drawNodeConnection(
-                    ChartNode(node.key, x_pos, y_depth),
-                    ChartNode(node.right_child, x_right, new_depth))
-            self.drawNodeTree(node.right_child, x_right, new_depth)
-        self.drawNodeAt(node, x_pos, y_depth)
+    def drawNodeTree(self, node: Node, x_pos: int, y_depth: int, nil: Node | None = None) -> None:
+        # the subtree is laid out tidily and shifted, so its root is at x_pos, y_depth
+        step: int = int(self.__cfg.get("node_radius") * 1.5)
+        layout: TreeLayout = tidyLayout(node, nil, step, step)
+        if len(layout):
+            self.drawLayout(layout, x_pos - layout.xs[0], y_depth)
+
+    def drawLayout(self, layout: TreeLayout, x_shift: int = 0, y_shift: int = 0) -> None:
+        # lines are drawn first and nodes over them
+        charts: list[ChartNode] = [ChartNode(node.key, x + x_shift, y + y_shift)
+                                   for node, x, y in zip(layout.nodes, layout.xs, layout.ys)]
+        for parent, child in layout.edges():
+            self.drawNodeConnection(charts[parent], charts[child])
+        for node, chart in zip(layout.nodes, charts):
+            self.drawNodeAt(node, chart.x, chart.y)
 
     def drawTree(self, tree: BinarySearchTree) -> None:
-        self.drawGrid(25)
+        # the canvas is sized by the layout, it grows linearly with the number of nodes
+        node_radius: int = self.__cfg.get("node_radius")
+        step: int = int(node_radius * 1.5)
+        layout: TreeLayout = layoutTree(tree, step, step, node_radius)
+        self.__newCanvas(max(layout.width, 1), max(layout.height, 1))
 
-        height: int = getTreeDepth(tree.root, 0)
-        max_size: int = 2 ** (height+1)
-        x_size: int = self.__cfg.get("node_radius") * (max_size-8)
-        y_size: int = self.__cfg.get("node_radius") * int(height*2)
-        self.__init__(x_size, y_size, self.__cfg_file)
-
-        canvas_center: int = int(x_size / 2)
+        self.drawGrid(25)
+        self.drawLayout(layout)
 
-        y_depth = self.__cfg.get("node_radius")
-        self.drawNodeTree(tree.root, canvas_center, y_depth)
-        print()
+    def tiledRenderer(self, tree: BinarySearchTree, tile_size: int = 256) -> TiledRenderer:
+        # large trees are drawn tile by tile, without the full-size layers of drawTree
+        return TiledRenderer.fromTree(tree, self.__cfg_file, tile_size)
 
     def show(self):
         self.__layout.image.show()
 
     def print_to_plot(self):
-        plt.imshow(self.__image)
+        # the same layer as show(), in a matplotlib window
+        plt.imshow(self.__layout.image)
         plt.show()
 
 
-drawing = Drawing(500, 300, "params.cfg")
-
-bst = BinarySearchTree[int]()
-
-size = 1024
-for i in range(1, 5):
-
-    print(2**(i+1))
+if __name__ == "__main__":
+    drawing = Drawing(500, 300, "params.cfg")
 
-count = 10
-#for i in [-3, -5, 6, -9, 5, 8, 2, 7, 9, -1]:
-for i in [60, 50, 70, 40, 55, 65, 80, 30, 45, 53, 58, 63, 68, 75, 90, 20, 35, 42, 255]:
-    bst.insert(i)
+    bst = BinarySearchTree[int]()
+    for i in [60, 50, 70, 40, 55, 65, 80, 30, 45, 53, 58, 63, 68, 75, 90, 20, 35, 42, 255]:
+        bst.insert(i)
 
-drawing.drawTree(bst)
-drawing.show()
+    drawing.drawTree(bst)
+    drawing.show()
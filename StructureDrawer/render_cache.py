@@ -0,0 +1,100 @@
+from PIL import Image, ImageDraw, ImageFont
+
+FONT_FILE: str = "Roboto-Medium.ttf"
+
+# labels are not drawn with smaller fonts, they would not be readable
+MIN_FONT_SIZE: int = 4
+
+
+class CacheCounter:
+    __slots__ = ('hits', 'misses')
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class NodeSprites:
+    """
+    A class to represent caches of fonts and pre-rendered nodes.
+
+    Attributes
+    ----------
+    __fonts : dict[int, ImageFont.FreeTypeFont]
+        Loaded fonts by size
+    __sprites : dict[tuple, tuple[Image.Image, ImageFont.FreeTypeFont | None]]
+        Circle of a node on a transparent image with the font which fits labels of its
+        length, by label length, colors, diameter and line width
+    font_counter, sprite_counter : CacheCounter
+        Hits and misses of the caches
+
+    Methods
+    -------
+    font(size: int)
+        Returns the font of size
+    sprite(label: str, diameter: int, line_width: int, fill: tuple, outline: tuple)
+        Returns the node image and the font of its label
+    stats()
+        Returns hits and misses of both caches
+    """
+
+    def __init__(self, font_file: str = FONT_FILE) -> None:
+        self.__font_file: str = font_file
+        self.__fonts: dict[int, ImageFont.FreeTypeFont] = {}
+        self.__sprites: dict[tuple, tuple[Image.Image, ImageFont.FreeTypeFont | None]] = {}
+        self.font_counter: CacheCounter = CacheCounter()
+        self.sprite_counter: CacheCounter = CacheCounter()
+
+    def font(self, size: int) -> ImageFont.FreeTypeFont:
+        font = self.__fonts.get(size)
+        if font is None:
+            self.font_counter.misses += 1
+            font = self.__fonts[size] = ImageFont.truetype(self.__font_file, size)
+        else:
+            self.font_counter.hits += 1
+        return font
+
+    def sprite(self, label: str | None, diameter: int, line_width: int,
+               fill: tuple[int, int, int] = (255, 255, 255),
+               outline: tuple[int, int, int] = (0, 0, 0)
+               ) -> tuple[Image.Image, ImageFont.FreeTypeFont | None]:
+        """
+        Returns the circle of a node rendered once and the font which fits labels
+        of the same length into half of the diameter. Label None gives no font.
+
+        :param label: Label of the node, its length selects the font
+        :param diameter: Diameter of the circle in pixels
+        :param line_width: Width of the outline
+        :param fill: Color inside the circle
+        :param outline: Color of the outline
+        :return: Pair of the image and the font
+        """
+        key = (None if label is None else len(label), diameter, line_width, fill, outline)
+        sprite = self.__sprites.get(key)
+        if sprite is not None:
+            self.sprite_counter.hits += 1
+            return sprite
+        self.sprite_counter.misses += 1
+
+        font = None
+        if label is not None and diameter >= MIN_FONT_SIZE:
+            text_width: float = self.font(diameter).getlength(label)
+            size = int(diameter * (diameter * (1 / 2)) / text_width) if text_width else 0
+            if size >= MIN_FONT_SIZE:
+                font = self.font(size)
+
+        image: Image.Image = Image.new("RGBA", (diameter + 1, diameter + 1),
+                                       (255, 255, 255, 0))
+        ImageDraw.Draw(image).ellipse((0, 0, diameter, diameter),
+                                      outline=outline,
+                                      fill=fill,
+                                      width=line_width)
+        sprite = self.__sprites[key] = (image, font)
+        return sprite
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {"fonts": self.font_counter.snapshot(),
+                "sprites": self.sprite_counter.snapshot()}
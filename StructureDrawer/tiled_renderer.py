@@ -0,0 +1,282 @@
+"""
+Rendering of laid-out trees in tiles. Only one tile image exists at a time and every
+tile draws only the nodes and edges which intersect it, found in a grid index of the
+layout, so peak memory stays near one tile however large the whole picture is.
+
+A tile pyramid stores the picture at several zooms: level levels() - 1 is drawn
+in full size, every lower level at half the scale of the next one and level 0 fits
+into a single tile. Tiles are written as <directory>/<level>/<column>_<row>.<format>,
+the layout used by Deep Zoom viewers; tiles without any node or edge are not written.
+"""
+
+import math
+import os
+from typing import Iterator
+
+from PIL import Image, ImageDraw
+
+from StructureDrawer.render_cache import NodeSprites
+from StructureDrawer.tree_layout import TreeLayout, layoutTree
+from Utilities.Config import Config
+
+# pixels drawn around every image and cut off
+PADDING: int = 8
+
+
+class SpatialIndex:
+    """
+    A class to represent uniform grid over the layout. Every cell lists the nodes
+    and edges whose bounding boxes intersect it.
+
+    Attributes
+    ----------
+    cell_size : int
+        Side of a square cell in pixels of the full-size picture
+    __nodes, __edges : dict[tuple[int, int], list[int]]
+        Indices of nodes and of child nodes of edges by column and row of cells
+
+    Methods
+    -------
+    query(x_min: float, y_min: float, x_max: float, y_max: float)
+        Returns indices of nodes and edges whose cells intersect the rectangle
+    """
+
+    def __init__(self, layout: TreeLayout, cell_size: int, node_margin: int,
+                 edge_margin: int) -> None:
+        """
+        It fills the grid.
+
+        :param layout: The indexed layout
+        :param cell_size: Side of a cell in pixels
+        :param node_margin: Distance of edges of a node picture from its center
+        :param edge_margin: Half of width of an edge line
+        """
+        self.cell_size: int = cell_size
+        self.__nodes: dict[tuple[int, int], list[int]] = {}
+        self.__edges: dict[tuple[int, int], list[int]] = {}
+        xs, ys = layout.xs, layout.ys
+        for index in range(len(layout)):
+            self.__add(self.__nodes, index, xs[index] - node_margin, ys[index] - node_margin,
+                       xs[index] + node_margin, ys[index] + node_margin)
+        for parent, child in layout.edges():
+            self.__add(self.__edges, child,
+                       min(xs[parent], xs[child]) - edge_margin,
+                       min(ys[parent], ys[child]) - edge_margin,
+                       max(xs[parent], xs[child]) + edge_margin,
+                       max(ys[parent], ys[child]) + edge_margin)
+
+    def __cells(self, x_min: float, y_min: float, x_max: float,
+                y_max: float) -> Iterator[tuple[int, int]]:
+        size = self.cell_size
+        for column in range(math.floor(x_min / size), math.floor(x_max / size) + 1):
+            for row in range(math.floor(y_min / size), math.floor(y_max / size) + 1):
+                yield column, row
+
+    def __add(self, grid: dict[tuple[int, int], list[int]], index: int, x_min: float,
+              y_min: float, x_max: float, y_max: float) -> None:
+        for cell in self.__cells(x_min, y_min, x_max, y_max):
+            bucket = grid.get(cell)
+            if bucket is None:
+                grid[cell] = [index]
+            else:
+                bucket.append(index)
+
+    def query(self, x_min: float, y_min: float, x_max: float,
+              y_max: float) -> tuple[list[int], list[int]]:
+        """
+        Returns indices of nodes and of child nodes of edges which may intersect
+        the rectangle, each once and in ascending order
+
+        :return: Pair of node indices and edge indices
+        """
+        nodes: set[int] = set()
+        edges: set[int] = set()
+        for cell in self.__cells(x_min, y_min, x_max, y_max):
+            nodes.update(self.__nodes.get(cell, ()))
+            edges.update(self.__edges.get(cell, ()))
+        return sorted(nodes), sorted(edges)
+
+
+class TiledRenderer:
+    """
+    A class that represent renderer of a tree layout into viewport crops or a tile pyramid.
+
+    ...
+
+    Attributes
+    ----------
+    layout : TreeLayout
+        The drawn layout
+    tile_size : int
+        Side of a square tile in pixels
+    labels : bool
+        Whether keys of nodes are drawn, labels need the font file
+    __index : SpatialIndex
+        Grid of the layout with cells of one full-size tile
+    __sprites : NodeSprites
+        Cache of fonts and node images
+
+    Methods
+    -------
+    renderViewport(x: float, y: float, width: int, height: int, scale: float)
+        Draws a rectangle of the picture into a new image
+    saveViewport(path: str, x: float, y: float, width: int, height: int, scale: float)
+        Draws a rectangle of the picture into a file
+    levels()
+        Returns number of levels of the tile pyramid
+    renderTile(level: int, column: int, row: int)
+        Draws one tile of the pyramid, None for an empty tile
+    writePyramid(directory: str, image_format: str)
+        Writes all non-empty tiles of the pyramid
+    cacheStats()
+        Returns hits and misses of the font and the sprite cache
+    """
+
+    def __init__(self, layout: TreeLayout, config: str, tile_size: int = 256,
+                 labels: bool = True) -> None:
+        """
+        It indexes the layout.
+
+        :param layout: The drawn layout
+        :param config: Config with node_radius, node_line_width and line_width
+        :param tile_size: Side of a square tile in pixels
+        :param labels: Draw keys of nodes
+        """
+        self.__cfg: Config = Config(config)
+        self.layout: TreeLayout = layout
+        self.tile_size: int = tile_size
+        self.labels: bool = labels
+        self.__node_radius: int = self.__cfg.get("node_radius")
+        self.__node_line_width: int = self.__cfg.get("node_line_width")
+        self.__line_width: int = self.__cfg.get("line_width")
+        self.__index: SpatialIndex = SpatialIndex(layout, tile_size,
+                                                  self.__node_radius // 2 + 1,
+                                                  self.__line_width // 2 + 1)
+        self.__sprites: NodeSprites = NodeSprites()
+
+    @classmethod
+    def fromTree(cls, tree, config: str, tile_size: int = 256,
+                 labels: bool = True) -> 'TiledRenderer':
+        """
+        Lays out BinarySearchTree or RedBlackTree with the spacing of Drawing.drawTree
+
+        :param tree: The drawn tree
+        :param config: Config with node_radius, node_line_width and line_width
+        :param tile_size: Side of a square tile in pixels
+        :param labels: Draw keys of nodes
+        :return: The renderer
+        """
+        node_radius: int = Config(config).get("node_radius")
+        step: int = int(node_radius * 1.5)
+        return cls(layoutTree(tree, step, step, node_radius), config, tile_size, labels)
+
+    def cacheStats(self) -> dict[str, dict[str, int]]:
+        return self.__sprites.stats()
+
+    def renderViewport(self, x: float, y: float, width: int, height: int,
+                       scale: float = 1.0) -> Image.Image:
+        """
+        Draws the rectangle of the picture with the top left corner x, y in full-size
+        pixels into a new transparent image of width x height pixels
+
+        :param x: Left edge of the rectangle in the full-size picture
+        :param y: Top edge of the rectangle in the full-size picture
+        :param width: Width of the image
+        :param height: Height of the image
+        :param scale: Zoom of the picture, 1 is the full size
+        :return: The image
+        """
+        image = self.__render(x, y, width, height, scale)
+        return Image.new("RGBA", (width, height), (255, 255, 255, 0)) if image is None else image
+
+    def saveViewport(self, path: str, x: float, y: float, width: int, height: int,
+                     scale: float = 1.0) -> None:
+        self.renderViewport(x, y, width, height, scale).save(path)
+
+    def levels(self) -> int:
+        """
+        Returns number of levels of the pyramid, the lowest fits into one tile
+        """
+        longest = max(self.layout.width, self.layout.height, 1)
+        return max(math.ceil(math.log2(longest / self.tile_size)), 0) + 1
+
+    def __scale(self, level: int) -> float:
+        return 2.0 ** (level - self.levels() + 1)
+
+    def renderTile(self, level: int, column: int, row: int) -> Image.Image | None:
+        """
+        Draws one tile of the pyramid
+
+        :param level: Level of the pyramid, levels() - 1 is the full size
+        :param column: Column of the tile from the left
+        :param row: Row of the tile from the top
+        :return: The tile, None when no node or edge intersects it
+        """
+        scale = self.__scale(level)
+        x, y = column * self.tile_size / scale, row * self.tile_size / scale
+        return self.__render(x, y, self.tile_size, self.tile_size, scale)
+
+    def writePyramid(self, directory: str, image_format: str = "png") -> int:
+        """
+        Writes every non-empty tile of every level, one tile at a time
+
+        :param directory: Directory of the pyramid, created when missing
+        :param image_format: Extension of tile files, it selects the format
+        :return: Number of written tiles
+        """
+        written = 0
+        for level in range(self.levels()):
+            scale = self.__scale(level)
+            path = os.path.join(directory, str(level))
+            os.makedirs(path, exist_ok=True)
+            for column in range(max(math.ceil(self.layout.width * scale / self.tile_size), 1)):
+                for row in range(max(math.ceil(self.layout.height * scale / self.tile_size), 1)):
+                    tile = self.renderTile(level, column, row)
+                    if tile is not None:
+                        tile.save(os.path.join(path, "{}_{}.{}".format(column, row,
+                                                                        image_format)))
+                        written += 1
+        return written
+
+    def __render(self, x: float, y: float, width: int, height: int,
+                 scale: float) -> Image.Image | None:
+        # the image is drawn with a padding which is cut off, lines clipped at the edge
+        # of an image are rounded differently and tiles would not join seamlessly
+        x, y = x - PADDING / scale, y - PADDING / scale
+        width, height = width + 2 * PADDING, height + 2 * PADDING
+        nodes, edges = self.__index.query(x, y, x + width / scale, y + height / scale)
+        if not nodes and not edges:
+            return None
+        image: Image.Image = Image.new("RGBA", (width, height), (255, 255, 255, 0))
+        self.__draw(image, nodes, edges, x, y, scale)
+        return image.crop((PADDING, PADDING, width - PADDING, height - PADDING))
+
+    def __draw(self, image: Image.Image, nodes: list[int], edges: list[int], x: float,
+               y: float, scale: float) -> None:
+        # lines are drawn first and nodes over them
+
+        layout = self.layout
+        xs, ys, parents = layout.xs, layout.ys, layout.parents
+        draw: ImageDraw.ImageDraw = ImageDraw.Draw(image)
+        line_width = max(round(self.__line_width * scale), 1)
+        for child in edges:
+            parent = parents[child]
+            draw.line([((xs[parent] - x) * scale, (ys[parent] - y) * scale),
+                       ((xs[child] - x) * scale, (ys[child] - y) * scale)],
+                      fill=(0, 0, 0),
+                      width=line_width)
+
+        diameter = max(int(self.__node_radius * scale), 1)
+        node_line_width = max(round(self.__node_line_width * scale), 1)
+        for index in nodes:
+            label = str(layout.nodes[index].key) if self.labels else None
+            sprite, font = self.__sprites.sprite(label, diameter, node_line_width)
+            center_x, center_y = (xs[index] - x) * scale, (ys[index] - y) * scale
+            image.paste(sprite, (math.floor(center_x - diameter / 2),
+                                 math.floor(center_y - diameter / 2)), sprite)
+            if font is not None:
+                draw.text((center_x, center_y), label,
+                          align="center",
+                          anchor="mm",
+                          fill=(0, 0, 0),
+                          font=font)
@@ -0,0 +1,216 @@
+"""
+Tidy layout of binary trees after Reingold and Tilford. Every subtree is laid out
+once, its two child subtrees are pushed apart only as far as their facing contours
+need, and the contours are followed through threads, so the whole layout takes O(n)
+time. The width grows with the number of nodes, not exponentially with the height:
+it is at most (n - 1) * x_step. A single child is still put half of x_step aside,
+so a degenerate path of n nodes is (n - 1) * x_step / 2 wide.
+
+Nodes are drawn at integer coordinates; every two nodes of one level are at least
+x_step apart and levels are y_step apart. The walks are iterative like in Traversal,
+so a tree of any depth is laid out without RecursionError.
+"""
+
+from typing import Iterator
+
+from AlgorithmLibrary.red_black_tree import RedBlackTree, NIL
+from Structures.Node import Node
+
+
+class TreeLayout:
+    """
+    A class to represent computed positions of tree nodes.
+
+    Attributes
+    ----------
+    nodes : list[Node]
+        Nodes of the tree in pre-order
+    xs, ys : list[int]
+        Coordinates of the nodes, parallel to nodes
+    parents : list[int]
+        Index of the parent of every node, -1 for the root
+    width, height : int
+        Size of the canvas which holds the drawing with its margins
+
+    Methods
+    -------
+    edges()
+        Lazily iterates pairs of parent and child indices
+    position(index: int)
+        Returns coordinates of the node at index
+    """
+    __slots__ = ('nodes', 'xs', 'ys', 'parents', 'width', 'height')
+
+    def __init__(self, nodes: list[Node], xs: list[int], ys: list[int], parents: list[int],
+                 width: int, height: int) -> None:
+        self.nodes: list[Node] = nodes
+        self.xs: list[int] = xs
+        self.ys: list[int] = ys
+        self.parents: list[int] = parents
+        self.width: int = width
+        self.height: int = height
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def edges(self) -> Iterator[tuple[int, int]]:
+        """
+        Lazily iterates edges of the tree as pairs of parent and child indices
+        """
+        for child, parent in enumerate(self.parents):
+            if parent >= 0:
+                yield parent, child
+
+    def position(self, index: int) -> tuple[int, int]:
+        """
+        Returns coordinates of the node at index
+
+        :param index: Index of the node in nodes
+        :return: Pair x, y
+        """
+        return self.xs[index], self.ys[index]
+
+
+def tidyLayout(root: Node | None, nil: Node | None = None, x_step: int = 2,
+               y_step: int = 1, margin: int = 0) -> TreeLayout:
+    """
+    Lays out the tree under root. Trees with a sentinel instead of None pass it as nil.
+
+    :param root: Root of the tree, None or nil for an empty tree
+    :param nil: Node which marks a missing child
+    :param x_step: Least horizontal distance of two nodes of a level
+    :param y_step: Vertical distance of two levels
+    :param margin: Space around the drawing
+    :return: The layout
+    """
+    if root is None or root is nil:
+        return TreeLayout([], [], [], [], 2 * margin, 2 * margin)
+
+    # nodes in pre-order with indices of parents and children, children follow parents
+    nodes: list[Node] = [root]
+    parents: list[int] = [-1]
+    depths: list[int] = [0]
+    lefts: list[int] = [-1]
+    rights: list[int] = [-1]
+    stack = [0]
+    while stack:
+        index = stack.pop()
+        node = nodes[index]
+        for child, children in ((node.right_child, rights), (node.left_child, lefts)):
+            if child is not None and child is not nil:
+                children[index] = len(nodes)
+                stack.append(len(nodes))
+                nodes.append(child)
+                parents.append(index)
+                depths.append(depths[index] + 1)
+                lefts.append(-1)
+                rights.append(-1)
+
+    # positions in units of half x_step: offsets from parents, threads of contours
+    # and the leftmost and rightmost node of the deepest level of every subtree
+    count = len(nodes)
+    offsets = [0] * count
+    threads = [-1] * count
+    thread_offsets = [0] * count
+    heights = [0] * count
+    left_extremes = list(range(count))
+    left_xs = [0] * count
+    right_extremes = list(range(count))
+    right_xs = [0] * count
+
+    for index in range(count - 1, -1, -1):
+        left, right = lefts[index], rights[index]
+        if left < 0 and right < 0:
+            continue
+        if left < 0 or right < 0:
+            # a single child is put aside, so its side is seen
+            child = left if right < 0 else right
+            shift = -1 if right < 0 else 1
+            offsets[child] = shift
+            heights[index] = heights[child] + 1
+            left_extremes[index] = left_extremes[child]
+            left_xs[index] = left_xs[child] + shift
+            right_extremes[index] = right_extremes[child]
+            right_xs[index] = right_xs[child] + shift
+            continue
+
+        # the right contour of the left subtree against the left contour of the right one,
+        # separation is the distance of roots of the subtrees
+        separation = 2
+        inner_left, left_x, inner_right, right_x = left, 0, right, 0
+        while True:
+            if separation < left_x - right_x + 2:
+                separation = left_x - right_x + 2
+            if rights[inner_left] >= 0:
+                next_left = rights[inner_left]
+                next_left_x = left_x + offsets[next_left]
+            elif lefts[inner_left] >= 0:
+                next_left = lefts[inner_left]
+                next_left_x = left_x + offsets[next_left]
+            else:
+                next_left = threads[inner_left]
+                next_left_x = left_x + thread_offsets[inner_left]
+            if lefts[inner_right] >= 0:
+                next_right = lefts[inner_right]
+                next_right_x = right_x + offsets[next_right]
+            elif rights[inner_right] >= 0:
+                next_right = rights[inner_right]
+                next_right_x = right_x + offsets[next_right]
+            else:
+                next_right = threads[inner_right]
+                next_right_x = right_x + thread_offsets[inner_right]
+            if next_left < 0 or next_right < 0:
+                break
+            inner_left, left_x, inner_right, right_x = \
+                next_left, next_left_x, next_right, next_right_x
+        separation += separation % 2
+        half = separation // 2
+        offsets[left] = -half
+        offsets[right] = half
+
+        # the contour of the shorter subtree continues in the deeper one
+        left_height, right_height = heights[left], heights[right]
+        if next_left >= 0:
+            extreme = right_extremes[right]
+            threads[extreme] = next_left
+            thread_offsets[extreme] = next_left_x - right_xs[right] - separation
+        elif next_right >= 0:
+            extreme = left_extremes[left]
+            threads[extreme] = next_right
+            thread_offsets[extreme] = next_right_x - left_xs[left] + separation
+
+        heights[index] = max(left_height, right_height) + 1
+        if left_height >= right_height:
+            left_extremes[index], left_xs[index] = left_extremes[left], left_xs[left] - half
+        else:
+            left_extremes[index], left_xs[index] = left_extremes[right], left_xs[right] + half
+        if right_height >= left_height:
+            right_extremes[index], right_xs[index] = right_extremes[right], right_xs[right] + half
+        else:
+            right_extremes[index], right_xs[index] = right_extremes[left], right_xs[left] - half
+
+    # absolute positions, parents precede children in pre-order
+    units = offsets
+    for index in range(1, count):
+        units[index] += units[parents[index]]
+    low = min(units)
+    xs = [margin + (unit - low) * x_step // 2 for unit in units]
+    ys = [margin + depth * y_step for depth in depths]
+    width = 2 * margin + (max(units) - low) * x_step // 2
+    height = 2 * margin + heights[0] * y_step
+    return TreeLayout(nodes, xs, ys, parents, width, height)
+
+
+def layoutTree(tree, x_step: int = 2, y_step: int = 1, margin: int = 0) -> TreeLayout:
+    """
+    Lays out BinarySearchTree, RedBlackTree or their subclass
+
+    :param tree: The tree to lay out
+    :param x_step: Least horizontal distance of two nodes of a level
+    :param y_step: Vertical distance of two levels
+    :param margin: Space around the drawing
+    :return: The layout
+    """
+    if isinstance(tree, RedBlackTree):
+        return tidyLayout(tree._root_node(), NIL, x_step, y_step, margin)
+    return tidyLayout(tree.root, None, x_step, y_step, margin)
@@ -0,0 +1,17 @@
+from Structures.Node import Node, T
+
+
+class AVLNode(Node[T]):
+    """
+    A class to represent a node of AVL tree.
+
+    Attributes
+    ----------
+    height : int
+        number of nodes on the longest path from the node down to a leaf
+    """
+    __slots__ = ('height',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.height: int = 1
@@ -0,0 +1,22 @@
+from typing import TypeVar, Generic
+
+T = TypeVar('T')
+
+
+class BTreeNode(Generic[T]):
+    """
+    A class to represent a node of B-tree.
+
+    Attributes
+    ----------
+    keys : list[T]
+        sorted keys of the node
+    children : list[BTreeNode]
+        children of the node, len(keys) + 1 of them, empty for a leaf
+    """
+    __slots__ = ('keys', 'children')
+
+    def __init__(self, keys: list[T] | None = None,
+                 children: 'list[BTreeNode[T]] | None' = None) -> None:
+        self.keys: list[T] = [] if keys is None else keys
+        self.children: list[BTreeNode[T]] = [] if children is None else children
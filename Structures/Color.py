@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class Color(Enum):
+    """
+    An Enum which represents 2 possible colors of node
+
+    ...
+    """
+    RED = 1
+    BLACK = 0
@@ -1,23 +1,19 @@
-from Structures import Node
+from Structures.Node import Node
 
 
 class Edge:
-    def __init__(self, a: Node, b: Node) -> None:
-        self.__first: Node = a
-        self.__second: Node = b
-
-    @property
-    def first(self) -> Node:
-        return self.__first
+    """
+    A class to represent an edge between two nodes.
 
-    @first.setter
-    def first(self, node: Node) -> None:
-        self.__first = node
+    Attributes
+    ----------
+    first : Node
+        first end of the edge
+    second : Node
+        second end of the edge
+    """
+    __slots__ = ('first', 'second')
 
-    @property
-    def second(self) -> Node:
-        return self.__second
-
-    @second.setter
-    def second(self, node: Node) -> None:
-        self.__second = node
+    def __init__(self, a: Node, b: Node) -> None:
+        self.first: Node = a
+        self.second: Node = b
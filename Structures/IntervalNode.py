@@ -0,0 +1,18 @@
+from Structures.Node import T
+from Structures.RedBlackNode import RedBlackNode
+
+
+class IntervalNode(RedBlackNode[T]):
+    """
+    A class to represent a node of interval tree, its key is a pair (low, high).
+
+    Attributes
+    ----------
+    max_high : any
+        the greatest high endpoint of intervals in the subtree of the node
+    """
+    __slots__ = ('max_high',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.max_high = value[1]
@@ -0,0 +1,19 @@
+from Structures.Node import T
+from Structures.RedBlackNode import RedBlackNode
+
+
+class KeyedNode(RedBlackNode[T]):
+    """
+    A class to represent a node of red-black tree ordered by a key function.
+    The key holds the computed sort key, the item holds the stored value.
+
+    Attributes
+    ----------
+    item : any
+        the stored value, whose sort key is the key of the node
+    """
+    __slots__ = ('item',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.item = None
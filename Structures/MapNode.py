@@ -0,0 +1,18 @@
+from Structures.Node import T
+from Structures.RedBlackNode import RedBlackNode
+
+
+class MapNode(RedBlackNode[T]):
+    """
+    A class to represent a node of red-black tree which maps its key to a value.
+
+    Attributes
+    ----------
+    value : any
+        value mapped to the key
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.value = None
@@ -0,0 +1,18 @@
+from Structures.Node import T
+from Structures.RedBlackNode import RedBlackNode
+
+
+class MultisetNode(RedBlackNode[T]):
+    """
+    A class to represent a node of red-black tree which counts occurrences of its key.
+
+    Attributes
+    ----------
+    count : int
+        number of occurrences of the key
+    """
+    __slots__ = ('count',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.count: int = 1
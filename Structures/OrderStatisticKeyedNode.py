@@ -0,0 +1,19 @@
+from Structures.Node import T
+from Structures.OrderStatisticNode import OrderStatisticNode
+
+
+class OrderStatisticKeyedNode(OrderStatisticNode[T]):
+    """
+    A class to represent a node of red-black tree augmented with subtree size,
+    ordered by a key function.
+
+    Attributes
+    ----------
+    item : any
+        the stored value, whose sort key is the key of the node
+    """
+    __slots__ = ('item',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.item = None
@@ -0,0 +1,19 @@
+from Structures.Node import T
+from Structures.OrderStatisticNode import OrderStatisticNode
+
+
+class OrderStatisticMapNode(OrderStatisticNode[T]):
+    """
+    A class to represent a node of red-black tree augmented with subtree size,
+    which maps its key to a value.
+
+    Attributes
+    ----------
+    value : any
+        value mapped to the key
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.value = None
@@ -0,0 +1,19 @@
+from Structures.Node import T
+from Structures.OrderStatisticNode import OrderStatisticNode
+
+
+class OrderStatisticMultisetNode(OrderStatisticNode[T]):
+    """
+    A class to represent a node of red-black tree augmented with subtree size,
+    which counts occurrences of its key. The size sums the counts of the subtree.
+
+    Attributes
+    ----------
+    count : int
+        number of occurrences of the key
+    """
+    __slots__ = ('count',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.count: int = 1
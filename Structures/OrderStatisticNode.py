@@ -0,0 +1,18 @@
+from Structures.Node import T
+from Structures.RedBlackNode import RedBlackNode
+
+
+class OrderStatisticNode(RedBlackNode[T]):
+    """
+    A class to represent a node of red-black tree augmented with subtree size.
+
+    Attributes
+    ----------
+    size : int
+        number of nodes in the subtree rooted at the node
+    """
+    __slots__ = ('size',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.size: int = 1
@@ -0,0 +1,32 @@
+from typing import TypeVar, Generic
+from Structures.Color import Color
+
+T = TypeVar('T')
+
+
+class PersistentNode(Generic[T]):
+    """
+    A class to represent an immutable node of persistent red-black tree.
+
+    Nodes are never changed after construction, so they can be shared
+    between versions of the tree. They have no parent link for the same reason.
+
+    Attributes
+    ----------
+    key : TypeVar
+        key value of T datatype
+    color : Color
+        color of the node
+    left_child : PersistentNode | None
+        left child of the node
+    right_child : PersistentNode | None
+        right child of the node
+    """
+    __slots__ = ('key', 'color', 'left_child', 'right_child')
+
+    def __init__(self, color: Color, left_child: 'PersistentNode | None',
+                 value: T, right_child: 'PersistentNode | None') -> None:
+        self.key: T = value
+        self.color: Color = color
+        self.left_child: PersistentNode | None = left_child
+        self.right_child: PersistentNode | None = right_child
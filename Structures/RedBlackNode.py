@@ -0,0 +1,22 @@
+from Structures.Color import Color
+from Structures.Node import Node, T
+
+
+class RedBlackNode(Node[T]):
+    """
+    A class to represent a node of red-black tree.
+
+    Attributes
+    ----------
+    color : Color
+        color of the node
+    count : int
+        number of occurrences of the key, a class constant 1 unless
+        a multiset node keeps it in a slot
+    """
+    __slots__ = ('color',)
+    count: int = 1
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.color: Color = Color.RED
@@ -0,0 +1,137 @@
+"""
+Iterative walks over binary trees of Node. Every walk keeps an explicit stack or queue
+instead of recursion, so a degenerate tree of any depth is walked without RecursionError
+and without a Python frame per node. The trees are never modified during a walk, which
+keeps the walks safe for concurrent readers.
+
+Trees with a sentinel instead of None (RedBlackTree) pass it as nil.
+"""
+
+from typing import Any, Callable, Iterator, TypeVar
+
+from Structures.Node import Node
+
+S = TypeVar('S')
+
+
+def pre_order(root: Node | None, nil: Node | None = None) -> Iterator[Node]:
+    """
+    Lazily iterates nodes, every node before its left and then its right subtree
+
+    :param root: Root of the walked tree
+    :param nil: Node which marks a missing child
+    :return: Iterator over nodes
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is not nil:
+            yield node
+            stack.append(node.right_child)
+            stack.append(node.left_child)
+
+
+def in_order(root: Node | None, nil: Node | None = None) -> Iterator[Node]:
+    """
+    Lazily iterates nodes in ascending order of keys with a stack of one path
+
+    :param root: Root of the walked tree
+    :param nil: Node which marks a missing child
+    :return: Iterator over nodes
+    """
+    stack = []
+    node = root
+    while stack or node is not nil:
+        while node is not nil:
+            stack.append(node)
+            node = node.left_child
+        node = stack.pop()
+        yield node
+        node = node.right_child
+
+
+def post_order(root: Node | None, nil: Node | None = None) -> Iterator[Node]:
+    """
+    Lazily iterates nodes, every node after both of its subtrees
+
+    :param root: Root of the walked tree
+    :param nil: Node which marks a missing child
+    :return: Iterator over nodes
+    """
+    stack = []
+    node = root
+    last = None
+    while stack or node is not nil:
+        while node is not nil:
+            stack.append(node)
+            node = node.left_child
+        top = stack[-1]
+        # the right subtree is entered once, the node follows when it is done
+        if top.right_child is not nil and top.right_child is not last:
+            node = top.right_child
+        else:
+            last = stack.pop()
+            yield last
+
+
+def levels(root: Node | None, nil: Node | None = None) -> Iterator[list[Node]]:
+    """
+    Lazily iterates levels of the tree from the root down, each as a list of nodes
+    from left to right
+
+    :param root: Root of the walked tree
+    :param nil: Node which marks a missing child
+    :return: Iterator over levels
+    """
+    level = [] if root is nil else [root]
+    while level:
+        yield level
+        level = [child for node in level for child in (node.left_child, node.right_child)
+                 if child is not nil]
+
+
+def level_order(root: Node | None, nil: Node | None = None) -> Iterator[Node]:
+    """
+    Lazily iterates nodes level by level, breadth first
+
+    :param root: Root of the walked tree
+    :param nil: Node which marks a missing child
+    :return: Iterator over nodes
+    """
+    for level in levels(root, nil):
+        yield from level
+
+
+def height(root: Node | None, nil: Node | None = None) -> int:
+    """
+    Returns number of levels of the tree, 0 for an empty tree
+
+    :param root: Root of the tree
+    :param nil: Node which marks a missing child
+    :return: Number of levels
+    """
+    return sum(1 for _ in levels(root, nil))
+
+
+def pre_order_states(root: Node | None, state: S,
+                     child_state: Callable[[S, bool], S],
+                     nil: Node | None = None) -> Iterator[tuple[Node, S]]:
+    """
+    Lazily iterates nodes in pre-order together with a state passed down the tree,
+    e.g. a position of the node in a drawing or an indentation of a printout
+
+    :param root: Root of the walked tree
+    :param state: State of the root
+    :param child_state: Returns state of a child from the state of its parent
+    and whether the child is the right one
+    :param nil: Node which marks a missing child
+    :return: Iterator over pairs of node and its state
+    """
+    stack: list[tuple[Any, S]] = [] if root is nil else [(root, state)]
+    while stack:
+        node, state = stack.pop()
+        yield node, state
+        if node.right_child is not nil:
+            stack.append((node.right_child, child_state(state, True)))
+        if node.left_child is not nil:
+            stack.append((node.left_child, child_state(state, False)))
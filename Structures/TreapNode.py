@@ -0,0 +1,17 @@
+from Structures.Node import Node, T
+
+
+class TreapNode(Node[T]):
+    """
+    A class to represent a node of treap.
+
+    Attributes
+    ----------
+    priority : float
+        random priority, a parent has higher priority than its children
+    """
+    __slots__ = ('priority',)
+
+    def __init__(self, value: T) -> None:
+        super().__init__(value)
+        self.priority: float = 0.0
@@ -1,5 +1,13 @@
 from unittest import TestCase
+from contextlib import redirect_stdout
+import io
+import json
+import os
+import random
+import tempfile
 from SVGWriter import SVGWriter
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+from StructureDrawer.tree_layout import layoutTree
 from Structures.Node import Node
 
 
@@ -18,3 +26,81 @@ class TestSVGWriter(TestCase):
         writer.loadFromJSON("import.json")
         writer.save("test.svg")
 
+
+    def test_streamToFileObject(self):
+        writer = SVGWriter(200, 200, "svgWriterConfig.cfg")
+        count: int = 1_000
+        nodes = [Node[int](key) for key in random.sample(range(count), count)]
+        for index, node in enumerate(nodes):
+            writer.addNode(node, index, 2 * index)
+        for a, b in zip(nodes, nodes[1:]):
+            writer.addEdge(a, b)
+
+        output = io.StringIO()
+        with redirect_stdout(io.StringIO()) as console:
+            writer.save(output)
+        self.assertEqual(console.getvalue(), "")
+        svg = output.getvalue()
+        self.assertTrue(svg.startswith("<svg ") and svg.endswith("</svg>"))
+        self.assertEqual(svg.count("<line "), count - 1)
+        self.assertEqual(svg.count('class="point"'), count)
+        self.assertIn('<line x1="1" y1="2" x2="2" y2="4" stroke="black"/>', svg)
+
+    def test_edgeToUnknownNode(self):
+        writer = SVGWriter(200, 200, "svgWriterConfig.cfg")
+        a = Node[int](1)
+        writer.addNode(a, 10, 10)
+        writer.addEdge(a, Node[int](1))
+        self.assertRaises(ValueError, writer.save, io.StringIO())
+
+    def test_JSONLinesLoad(self):
+        writer = SVGWriter(200, 200, "svgWriterConfig.cfg")
+        writer.loadFromJSONLines("import.jsonl")
+        output = io.StringIO()
+        writer.save(output)
+
+        other = SVGWriter(200, 200, "svgWriterConfig.cfg")
+        other.loadFromJSON("import.json")
+        expected = io.StringIO()
+        other.save(expected)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_convertJSONLines(self):
+        count: int = 1_000
+        keys = random.sample(range(count), count)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.jsonl")
+            with open(path, "w", encoding="utf-8") as file:
+                for index, key in enumerate(keys):
+                    file.write(json.dumps({"key": key, "x": index, "y": key}) + "\n")
+                for a, b in zip(keys, keys[1:]):
+                    file.write(json.dumps({"first": a, "second": b}) + "\n")
+
+            writer = SVGWriter(200, 200, "svgWriterConfig.cfg")
+            writer.loadFromJSONLines(path)
+            expected = io.StringIO()
+            writer.save(expected)
+
+            output = io.StringIO()
+            SVGWriter(200, 200, "svgWriterConfig.cfg").convertJSONLines(path, output)
+            self.assertEqual(output.getvalue(), expected.getvalue())
+            self.assertEqual(output.getvalue().count("<line "), count - 1)
+
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(json.dumps({"first": keys[0], "second": -1}) + "\n")
+            self.assertRaises(ValueError, SVGWriter(200, 200, "svgWriterConfig.cfg")
+                              .convertJSONLines, path, io.StringIO())
+
+    def test_addLayout(self):
+        tree = RedBlackTree[int]()
+        tree.insert_many(random.sample(range(1_000), 100))
+        writer = SVGWriter(10, 10, "svgWriterConfig.cfg")
+        layout = layoutTree(tree, 50, 60, 25)
+        writer.addLayout(layout)
+
+        output = io.StringIO()
+        writer.save(output)
+        svg = output.getvalue()
+        self.assertIn('width="{}" height="{}"'.format(layout.width, layout.height), svg)
+        self.assertEqual(svg.count("<line "), 99)
+        self.assertEqual(svg.count('class="point"'), 100)
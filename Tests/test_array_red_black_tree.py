@@ -0,0 +1,64 @@
+import string
+from unittest import TestCase
+import random
+from AlgorithmLibrary.array_red_black_tree import ArrayRedBlackTree
+
+
+class TestArrayRedBlackTree(TestCase):
+    def test_int_insert_remove(self):
+        rbt = ArrayRedBlackTree[int]()
+
+        count: int = 20_000
+        test_list: list[int] = random.sample(range(-count, count), count)
+
+        for num in test_list:
+            self.assertTrue(rbt.insert(num))
+            self.assertFalse(rbt.insert(num))
+        self.assertTrue(rbt.size == count)
+        self.assertEqual(rbt.to_list(), sorted(test_list))
+
+        for num in test_list[:count // 2]:
+            rbt.remove(num)
+            self.assertFalse(rbt.contains(num))
+        for num in test_list[count // 2:]:
+            self.assertTrue(rbt.contains(num))
+        self.assertTrue(rbt.size == count - count // 2)
+
+    def test_str_insert(self):
+        rbt = ArrayRedBlackTree[str]()
+        letters: str = string.ascii_letters+string.digits+string.punctuation
+        test_list: list[str] = [''.join(random.choice(letters) for _ in range(20))
+                                for _ in range(2_000)]
+        for sentence in test_list:
+            rbt.insert(sentence)
+        self.assertEqual(rbt.to_list(), sorted(set(test_list)))
+        with self.assertRaises(TypeError):
+            rbt.insert(1)
+
+    def test_slot_reuse(self):
+        rbt = ArrayRedBlackTree.from_sorted(range(1_000))
+        self.assertEqual(rbt.to_list(), list(range(1_000)))
+        bytes_per_key: float = rbt.bytes_per_key()
+
+        # removed slots are reused, so the arrays do not grow
+        for _ in range(5):
+            removed: list[int] = random.sample(range(1_000), 500)
+            self.assertEqual(rbt.remove_many(removed), 500)
+            self.assertTrue(rbt.size == 500)
+            self.assertEqual(rbt.insert_many(removed), 500)
+        self.assertEqual(rbt.to_list(), list(range(1_000)))
+        self.assertEqual(rbt.bytes_per_key(), bytes_per_key)
+        self.assertEqual(rbt.contains_many([-1, 0, 999, 1_000]), [False, True, True, False])
+
+    def test_empty_build(self):
+        rbt = ArrayRedBlackTree.from_sorted([])
+        self.assertTrue(rbt.insert(3))
+        with self.assertRaises(TypeError):
+            rbt.insert("3")
+
+        typed = ArrayRedBlackTree.from_iterable([], int)
+        self.assertIs(typed.key_type, int)
+        with self.assertRaises(TypeError):
+            typed.insert("3")
+        with self.assertRaises(TypeError):
+            ArrayRedBlackTree.from_iterable(["a"], int)
@@ -0,0 +1,46 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.avl_tree import AVLTree
+
+
+class TestAVLTree(TestCase):
+    def check_balance(self, node, parent=None) -> int:
+        if node is None:
+            return 0
+        self.assertIs(node.parent, parent)
+        left = self.check_balance(node.left_child, node)
+        right = self.check_balance(node.right_child, node)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(node.height, 1 + max(left, right))
+        return node.height
+
+    def test_insert_remove(self):
+        avl = AVLTree[int]()
+        count: int = 2_000
+        test_list: list[int] = random.sample(range(-count, count), count)
+
+        for num in test_list:
+            self.assertTrue(avl.insert(num))
+            self.assertFalse(avl.insert(num))
+        self.check_balance(avl.root)
+        self.assertEqual(avl.to_list(), sorted(test_list))
+
+        for num in test_list[:count // 2]:
+            avl.remove(num)
+            self.assertFalse(avl.contains(num))
+        self.check_balance(avl.root)
+        self.assertEqual(avl.size, count - count // 2)
+        self.assertEqual(avl.to_list(), sorted(test_list[count // 2:]))
+
+    def test_sorted_ingest(self):
+        avl = AVLTree[int]()
+        count: int = 10_000
+        self.assertEqual(avl.insert_many(range(count)), count)
+        # height of AVL tree is below 1.44 log2(n)
+        self.assertLessEqual(self.check_balance(avl.root), 1.44 * count.bit_length())
+
+        self.assertEqual(avl.remove_many(range(0, count, 2)), count // 2)
+        self.check_balance(avl.root)
+        self.assertEqual(avl.contains_many([1, 2]), [True, False])
+        with self.assertRaises(TypeError):
+            avl.insert("1")
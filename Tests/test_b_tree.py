@@ -0,0 +1,62 @@
+import string
+from unittest import TestCase
+import random
+from AlgorithmLibrary.b_tree import BTree
+
+
+class TestBTree(TestCase):
+    def test_int_insert_remove(self):
+        for fanout in (4, 7, 64):
+            btree = BTree[int](fanout)
+
+            count: int = 10_000
+            test_list: list[int] = random.sample(range(-count, count), count)
+
+            for num in test_list:
+                self.assertTrue(btree.insert(num))
+                self.assertFalse(btree.insert(num))
+            self.assertTrue(btree.size == count)
+            self.assertEqual(btree.to_list(), sorted(test_list))
+            self.assertEqual(list(btree), sorted(test_list))
+
+            for num in test_list[:count // 2]:
+                btree.remove(num)
+                self.assertFalse(btree.contains(num))
+            for num in test_list[count // 2:]:
+                self.assertTrue(btree.contains(num))
+            self.assertTrue(btree.size == count - count // 2)
+            self.assertEqual(btree.to_list(), sorted(test_list[count // 2:]))
+
+    def test_str_batch(self):
+        btree = BTree[str](8)
+        letters: str = string.ascii_letters+string.digits
+        test_list: list[str] = [''.join(random.choice(letters) for _ in range(3))
+                                for _ in range(3_000)]
+        self.assertEqual(btree.insert_many(test_list), len(set(test_list)))
+        self.assertEqual(btree.to_list(), sorted(set(test_list)))
+        self.assertEqual(btree.contains_many(test_list), [True] * len(test_list))
+        self.assertEqual(btree.remove_many(test_list), len(set(test_list)))
+        self.assertTrue(btree.size == 0)
+        with self.assertRaises(TypeError):
+            btree.insert(1)
+        with self.assertRaises(ValueError):
+            BTree[int](3)
+
+    def test_untyped(self):
+        # the datatype comes from key_type, a subclass of BTree[int] or the first key
+        class IntBTree(BTree[int]):
+            pass
+
+        for btree in (BTree(), BTree(key_type=int), IntBTree(4)):
+            self.assertTrue(btree.insert(1))
+            self.assertTrue(btree.contains(1))
+            self.assertIs(btree.key_type, int)
+            with self.assertRaises(TypeError):
+                btree.insert("1")
+        self.assertIsNone(BTree().key_type)
+        with self.assertRaises(TypeError):
+            BTree(key_type=str).insert(1)
+
+        trusting = BTree(validate=False)
+        self.assertEqual(trusting.insert_many([3, 1, 2]), 3)
+        self.assertEqual(trusting.to_list(), [1, 2, 3])
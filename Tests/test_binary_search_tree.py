@@ -0,0 +1,58 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+
+
+class TestBinarySearchTree(TestCase):
+    def test_insert_remove(self):
+        bst = BinarySearchTree[int]()
+
+        count: int = 2_000
+        test_list: list[int] = random.sample(range(-count, count), count)
+
+        for num in test_list:
+            self.assertTrue(bst.insert(num))
+            self.assertFalse(bst.insert(num))
+            self.assertTrue(bst.contains(num))
+        self.assertTrue(bst.size == count)
+
+        for num in test_list[:count // 2]:
+            bst.remove(num)
+            self.assertFalse(bst.contains(num))
+        self.assertTrue(bst.size == count - count // 2)
+        for num in test_list[count // 2:]:
+            self.assertTrue(bst.contains(num))
+
+    def test_batch_operations(self):
+        bst = BinarySearchTree[int]()
+        count: int = 2_000
+        test_list: list[int] = [random.randint(-count, count) for _ in range(count)]
+        expected: set[int] = set(test_list)
+
+        self.assertEqual(bst.insert_many(test_list), len(expected))
+        self.assertTrue(bst.size == len(expected))
+
+        queries: list[int] = [random.randint(-2 * count, 2 * count) for _ in range(count)]
+        self.assertEqual(bst.contains_many(queries), [num in expected for num in queries])
+
+        to_remove: list[int] = random.sample(range(-count, count), count // 2)
+        self.assertEqual(bst.remove_many(to_remove), len(expected & set(to_remove)))
+        expected -= set(to_remove)
+        self.assertTrue(bst.size == len(expected))
+        self.assertEqual(bst.contains_many(sorted(expected)), [True] * len(expected))
+
+        with self.assertRaises(TypeError):
+            bst.insert_many([1, "2"])
+
+    def test_to_list(self):
+        bst = BinarySearchTree[int]()
+        test_list: list[int] = random.sample(range(10_000), 2_000)
+        for num in test_list:
+            bst.insert(num)
+        self.assertEqual(bst.to_list(), sorted(test_list))
+
+        # ascending keys build a degenerate tree
+        degenerate = BinarySearchTree[int]()
+        for num in range(5_000):
+            degenerate.insert(num)
+        self.assertEqual(degenerate.to_list(), list(range(5_000)))
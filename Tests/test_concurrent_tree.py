@@ -0,0 +1,90 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from AlgorithmLibrary.concurrent_tree import ConcurrentTree
+from AlgorithmLibrary.persistent_red_black_tree import PersistentRedBlackTree
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+
+
+class TestConcurrentTree(TestCase):
+    def test_parallel_changes(self):
+        for tree in (RedBlackTree[int](), BinarySearchTree[int]()):
+            ctree = ConcurrentTree(tree)
+            count: int = 4_000
+            test_list: list[int] = random.sample(range(-count, count), count)
+            chunks: list[list[int]] = [test_list[i::8] for i in range(8)]
+
+            def work(chunk: list[int]) -> None:
+                for num in chunk[:len(chunk) // 2]:
+                    ctree.insert(num)
+                    self.assertTrue(ctree.contains(num))
+                ctree.insert_many(chunk[len(chunk) // 2:])
+                ctree.remove_many(chunk[::3])
+                self.assertFalse(any(ctree.contains_many(chunk[::3])))
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(work, chunks))
+
+            expected: list[int] = sorted(set(test_list) - set().union(*(c[::3] for c in chunks)))
+            with ctree.reading() as inner:
+                self.assertTrue(inner.size == len(expected))
+            self.assertTrue(ctree.size == len(expected))
+            self.assertEqual(sorted(num for num in test_list if ctree.contains(num)), expected)
+
+    def test_snapshot(self):
+        ctree = ConcurrentTree(PersistentRedBlackTree[int]())
+        for num in range(100):
+            ctree.insert(num)
+        snapshot = ctree.snapshot()
+        with ctree.writing() as tree:
+            for num in range(50):
+                tree.remove(num)
+        self.assertEqual(snapshot.to_list(), list(range(100)))
+        self.assertEqual(ctree.to_list(), list(range(50, 100)))
+
+    def test_lock_free_reads(self):
+        ctree = ConcurrentTree(PersistentRedBlackTree[int]())
+        self.assertEqual(ctree.insert_many(range(0, 1000, 2)), 500)
+        done = threading.Event()
+
+        # readers see whole versions: every even key is there, odd keys come and go
+        def write() -> None:
+            for num in range(1, 1000, 2):
+                ctree.insert(num)
+                ctree.remove(num)
+            done.set()
+
+        # failures are collected, assertions would not fail the test from a thread
+        failures: list[str] = []
+
+        def read() -> None:
+            while not done.is_set():
+                with ctree.reading() as snapshot:
+                    if not snapshot.read_only or snapshot.size not in (500, 501):
+                        failures.append("snapshot of size {}".format(snapshot.size))
+                if not all(ctree.contains_many(range(0, 1000, 50))):
+                    failures.append("missing key")
+
+        writer = threading.Thread(target=write)
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in readers + [writer]:
+            thread.start()
+        for thread in readers + [writer]:
+            thread.join()
+        self.assertEqual(failures, [])
+
+        self.assertEqual(ctree.remove_many(range(0, 1000, 4)), 250)
+        self.assertEqual(ctree.size, 250)
+        self.assertEqual(ctree.to_list(), list(range(2, 1000, 4)))
+        with self.assertRaises(TypeError):
+            ConcurrentTree(RedBlackTree[int]()).snapshot()
+
+        # the default backend is persistent and read without the lock
+        default = ConcurrentTree()
+        default.insert_many([3, 1, 2])
+        self.assertTrue(default.snapshot().read_only)
+        self.assertEqual(default.to_list(), [1, 2, 3])
+        with self.assertRaises(TypeError):
+            default.insert("4")
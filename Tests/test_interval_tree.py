@@ -0,0 +1,72 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.interval_tree import IntervalTree
+from AlgorithmLibrary.red_black_tree import NIL
+
+
+class TestIntervalTree(TestCase):
+    def check_max_high(self, node) -> object:
+        if node is NIL:
+            return None
+        max_high = node.key[1]
+        for child in (node.left_child, node.right_child):
+            high = self.check_max_high(child)
+            if high is not None and high > max_high:
+                max_high = high
+        self.assertEqual(node.max_high, max_high)
+        return max_high
+
+    def random_intervals(self, count: int) -> list[tuple[int, int]]:
+        starts = random.sample(range(10 * count), count)
+        return [(start, start + random.randrange(count // 10)) for start in starts]
+
+    def assert_queries(self, tree: IntervalTree, intervals: list[tuple[int, int]]) -> None:
+        for _ in range(50):
+            low = random.randrange(-10, 1_100)
+            high = low + random.randrange(30)
+            self.assertEqual(list(tree.overlapping(low, high)),
+                             sorted(i for i in intervals if i[0] <= high and low <= i[1]))
+            self.assertEqual(list(tree.stabbing(low)),
+                             sorted(i for i in intervals if i[0] <= low <= i[1]))
+
+    def test_insert_remove(self):
+        for order_statistics in (False, True):
+            tree = IntervalTree(order_statistics=order_statistics)
+            intervals = self.random_intervals(100)
+            for interval in intervals:
+                self.assertTrue(tree.insert(interval))
+            self.check_max_high(tree._root_node())
+            self.assert_queries(tree, intervals)
+
+            # rotations of the removal keep the endpoints up to date
+            for interval in intervals[:50]:
+                tree.remove(interval)
+            self.check_max_high(tree._root_node())
+            self.assert_queries(tree, intervals[50:])
+
+    def test_bulk_build(self):
+        intervals = self.random_intervals(100)
+        tree = IntervalTree.from_iterable(intervals)
+        self.assertEqual(tree.size, len(intervals))
+        self.check_max_high(tree._root_node())
+        self.assert_queries(tree, intervals)
+
+        extra = self.random_intervals(100)
+        tree.insert_many(extra)
+        self.check_max_high(tree._root_node())
+        self.assert_queries(tree, list(set(intervals + extra)))
+
+    def test_invalid_interval(self):
+        tree = IntervalTree()
+        self.assertRaises(ValueError, tree.insert, (2, 1))
+        self.assertRaises(ValueError, tree.insert, (1, 2, 3))
+        self.assertRaises(TypeError, tree.insert, [1, 2])
+        self.assertRaises(ValueError, IntervalTree.from_sorted, [(1, 2), (3, 0)])
+        self.assertEqual(list(tree.overlapping(0, 10)), [])
+        self.assertEqual(list(IntervalTree.from_sorted([(1, 5)]).overlapping(3, 2)), [])
+        self.assertRaises(TypeError, IntervalTree, key_type=int)
+        self.assertRaises(TypeError, IntervalTree.from_sorted, [(1, 2)], int)
+        self.assertRaises(TypeError, IntervalTree.from_iterable, [(1, 2)], key_type=int)
+        self.assertEqual(IntervalTree.from_iterable([(3, 4), (1, 2)], tuple).to_list(),
+                         [(1, 2), (3, 4)])
+        self.assertEqual(IntervalTree(key_type=tuple).size, 0)
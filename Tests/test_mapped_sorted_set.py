@@ -0,0 +1,101 @@
+import os
+import random
+import string
+import tempfile
+from unittest import TestCase
+
+from AlgorithmLibrary.mapped_sorted_set import MappedSortedSet, save_keys
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+
+
+class TestMappedSortedSet(TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_int_keys(self):
+        keys = random.sample(range(-10**12, 10**12), 5_000)
+        rbt = RedBlackTree.from_iterable(keys)
+        self.assertEqual(rbt.save(self.path), len(keys))
+        keys.sort()
+
+        with RedBlackTree.load_mmap(self.path) as mapped:
+            self.assertIs(mapped.key_type, int)
+            self.assertEqual(mapped.size, len(keys))
+            self.assertEqual(mapped.to_list(), keys)
+            for index in random.sample(range(len(keys)), 200):
+                self.assertTrue(mapped.contains(keys[index]))
+                self.assertEqual(mapped.rank(keys[index]), index)
+                self.assertEqual(mapped.select(index), keys[index])
+            self.assertFalse(mapped.contains(10**13))
+            low, high = keys[100], keys[300]
+            self.assertEqual(mapped.count_range(low, high), 201)
+            self.assertEqual(list(mapped.irange(low, high, (False, False))), keys[101:300])
+            with self.assertRaises(TypeError):
+                mapped.contains("1")
+
+    def test_float_keys(self):
+        keys = sorted({random.uniform(-1, 1) for _ in range(1_000)})
+        save_keys(self.path, keys, float)
+
+        with MappedSortedSet(self.path) as mapped:
+            self.assertEqual(list(mapped), keys)
+            self.assertEqual(mapped.rank(0.0), sum(k < 0.0 for k in keys))
+
+    def test_str_keys(self):
+        alphabet = string.ascii_letters + "äöü日本"
+        keys = ["".join(random.choices(alphabet, k=random.randint(0, 20))) for _ in range(1_000)]
+        rbt = RedBlackTree.from_iterable(keys)
+        rbt.save(self.path)
+        keys = sorted(set(keys))
+
+        with RedBlackTree.load_mmap(self.path) as mapped:
+            self.assertIs(mapped.key_type, str)
+            self.assertEqual(mapped.to_list(), keys)
+            for key in random.sample(keys, 100):
+                self.assertTrue(mapped.contains(key))
+                self.assertEqual(mapped.rank(key), keys.index(key))
+            self.assertFalse(mapped.contains(keys[-1] + "!"))
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b"not a saved tree")
+        with self.assertRaises(ValueError):
+            MappedSortedSet(self.path)
+        with self.assertRaises(TypeError):
+            save_keys(self.path, [(1, 2)], tuple)
+
+    def test_rejected_keys(self):
+        # the file stays empty after a rejected save
+        with self.assertRaises(TypeError):
+            RedBlackTree().save(self.path)
+        with self.assertRaises(TypeError):
+            save_keys(self.path, [], None)
+        for key in (2 ** 63, -2 ** 63 - 1):
+            rbt = RedBlackTree.from_iterable([1, key])
+            with self.assertRaises(ValueError):
+                rbt.save(self.path)
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+        self.assertEqual(RedBlackTree[int]().save(self.path), 0)
+        with RedBlackTree.load_mmap(self.path) as mapped:
+            self.assertEqual(mapped.to_list(), [])
+        self.assertEqual(save_keys(self.path, [-2 ** 63, 2 ** 63 - 1], int), 2)
+        with RedBlackTree.load_mmap(self.path) as mapped:
+            self.assertEqual(mapped.to_list(), [-2 ** 63, 2 ** 63 - 1])
+
+    def test_multiset_and_key_function(self):
+        test_list: list[int] = [random.randrange(-100, 100) for _ in range(500)]
+        multiset = RedBlackTree[int](multiset=True)
+        multiset.insert_many(test_list)
+        keyed = RedBlackTree.from_iterable(test_list, key=lambda num: -num)
+        for tree in (multiset, keyed):
+            self.assertEqual(tree.save(self.path), len(set(test_list)))
+            with RedBlackTree.load_mmap(self.path) as mapped:
+                self.assertEqual(mapped.to_list(), sorted(set(test_list)))
+                for num in test_list[:50]:
+                    self.assertTrue(mapped.contains(num))
+                    self.assertEqual(mapped.rank(num), sum(k < num for k in set(test_list)))
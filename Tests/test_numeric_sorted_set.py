@@ -0,0 +1,125 @@
+from unittest import TestCase
+import random
+import numpy as np
+from AlgorithmLibrary.numeric_sorted_set import NumericSortedSet
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+
+
+class TestNumericSortedSet(TestCase):
+    def test_insert_remove(self):
+        nss = NumericSortedSet[int](buffer_limit=64)
+        expected: set[int] = set()
+
+        count: int = 5_000
+        for _ in range(count):
+            num: int = random.randint(-count, count)
+            if random.randint(0, 2) == 0:
+                nss.remove(num)
+                expected.discard(num)
+            else:
+                self.assertEqual(nss.insert(num), num not in expected)
+                expected.add(num)
+            self.assertTrue(nss.contains(num) == (num in expected))
+        self.assertTrue(nss.size == len(expected))
+        self.assertEqual(nss.to_list(), sorted(expected))
+
+        with self.assertRaises(TypeError):
+            nss.insert(1.5)
+        with self.assertRaises(TypeError):
+            nss.contains_many([1.5])
+
+    def test_vectorized_queries(self):
+        count: int = 100_000
+        nss = NumericSortedSet[int]()
+        test_list: list[int] = random.sample(range(-count, count), count // 2)
+        for num in test_list[:100]:
+            nss.insert(num)
+        rbt = RedBlackTree.from_iterable(test_list[100:])
+        bulk = NumericSortedSet.from_tree(rbt)
+        self.assertTrue(bulk.size == rbt.size)
+
+        queries = np.random.randint(-count, count, size=count)
+        content = np.array(sorted(test_list[100:]))
+        np.testing.assert_array_equal(bulk.contains_many(queries), np.isin(queries, content))
+        np.testing.assert_array_equal(bulk.rank_many(queries), np.searchsorted(content, queries))
+
+        self.assertEqual(nss.contains_many(test_list[:100]).tolist(), [True] * 100)
+        self.assertEqual(nss.rank(min(test_list[:100])), 0)
+
+        tree = bulk.to_tree()
+        self.assertEqual(tree.to_list(), content.tolist())
+        self.assertTrue(tree.insert(count))
+
+    def test_float(self):
+        nss = NumericSortedSet[float](buffer_limit=4)
+        for num in (0.5, -1.25, 3.0, 2.5, 0.5):
+            nss.insert(num)
+        nss.remove(3.0)
+        self.assertEqual(nss.to_list(), [-1.25, 0.5, 2.5])
+        self.assertEqual(nss.contains_many([0.5, 1, 2.5]).tolist(), [True, False, True])
+
+    def test_int64_range(self):
+        nss = NumericSortedSet[int](buffer_limit=2)
+        nss.insert(2 ** 63 - 1)
+        nss.insert(-2 ** 63)
+        for num in (2 ** 63, -2 ** 63 - 1, 10 ** 30):
+            for method in (nss.insert, nss.remove, nss.contains, nss.rank):
+                with self.assertRaises(ValueError):
+                    method(num)
+        with self.assertRaises(ValueError):
+            nss.contains_many([1, 2 ** 63])
+        with self.assertRaises(ValueError):
+            nss.rank_many([-2 ** 64, 1])
+
+        # the rejected keys left the set usable
+        for num in range(10):
+            nss.insert(num)
+        self.assertEqual(nss.size, 12)
+        self.assertEqual(nss.to_list(), [-2 ** 63] + list(range(10)) + [2 ** 63 - 1])
+        self.assertEqual(nss.contains_many([2 ** 63 - 1, 5, 11]).tolist(), [True, True, False])
+
+        tree = RedBlackTree[int]()
+        tree.insert(2 ** 64)
+        with self.assertRaises(ValueError):
+            NumericSortedSet.from_tree(tree)
+
+    def test_untyped(self):
+        class FloatSet(NumericSortedSet[float]):
+            pass
+
+        nss = NumericSortedSet(buffer_limit=4)
+        self.assertEqual(nss.to_list(), [])
+        self.assertEqual(nss.contains_many([]).tolist(), [])
+        for num in (5, 3, 9, 1, 7, 3):
+            nss.insert(num)
+        self.assertEqual(nss.to_list(), [1, 3, 5, 7, 9])
+        self.assertEqual(nss.to_tree().key_type, int)
+        with self.assertRaises(TypeError):
+            nss.insert(1.5)
+
+        queried = NumericSortedSet()
+        self.assertEqual(queried.contains_many([1.5, 2.5]).tolist(), [False, False])
+        with self.assertRaises(TypeError):
+            queried.insert(1)
+
+        for typed in (NumericSortedSet(key_type=float), FloatSet()):
+            typed.insert(0.5)
+            self.assertEqual(typed.rank_many([0.25, 1.0]).tolist(), [0, 1])
+            with self.assertRaises(TypeError):
+                typed.insert(1)
+        with self.assertRaises(TypeError):
+            NumericSortedSet(key_type=str)
+        with self.assertRaises(TypeError):
+            NumericSortedSet().insert("a")
+
+    def test_from_unusual_trees(self):
+        test_list: list[int] = [random.randrange(-50, 50) for _ in range(300)]
+        multiset = RedBlackTree[int](multiset=True)
+        multiset.insert_many(test_list)
+        keyed = RedBlackTree.from_iterable(set(test_list), key=lambda num: -num)
+        for tree in (multiset, keyed):
+            nss = NumericSortedSet.from_tree(tree)
+            self.assertEqual(nss.to_list(), sorted(set(test_list)))
+            self.assertEqual(nss.size, len(set(test_list)))
+            self.assertEqual(nss.contains_many(test_list).tolist(), [True] * len(test_list))
+            self.assertEqual(nss.rank(0), sum(num < 0 for num in set(test_list)))
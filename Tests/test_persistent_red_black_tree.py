@@ -0,0 +1,70 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.persistent_red_black_tree import PersistentRedBlackTree
+
+
+class TestPersistentRedBlackTree(TestCase):
+    def test_insert_remove(self):
+        prbt = PersistentRedBlackTree[int]()
+
+        count: int = 10_000
+        test_list: list[int] = random.sample(range(-count, count), count)
+
+        for num in test_list:
+            self.assertTrue(prbt.insert(num))
+            self.assertFalse(prbt.insert(num))
+        self.assertTrue(prbt.size == count)
+        self.assertEqual(prbt.to_list(), sorted(test_list))
+
+        for num in test_list[:count // 2]:
+            prbt.remove(num)
+            self.assertFalse(prbt.contains(num))
+        for num in test_list[count // 2:]:
+            self.assertTrue(prbt.contains(num))
+        self.assertTrue(prbt.size == count - count // 2)
+        self.assertEqual(prbt.to_list(), sorted(test_list[count // 2:]))
+
+    def test_snapshot(self):
+        prbt = PersistentRedBlackTree[int]()
+        expected: set[int] = set()
+        snapshots: list[tuple[PersistentRedBlackTree[int], list[int]]] = []
+
+        for i in range(5_000):
+            num: int = random.randint(0, 1_000)
+            if random.randint(0, 2) == 0:
+                prbt.remove(num)
+                expected.discard(num)
+            else:
+                prbt.insert(num)
+                expected.add(num)
+            if i % 500 == 0:
+                snapshots.append((prbt.snapshot(), sorted(expected)))
+
+        # snapshots keep their content while the tree changes
+        for snapshot, content in snapshots:
+            self.assertTrue(snapshot.read_only)
+            self.assertEqual(snapshot.to_list(), content)
+            self.assertTrue(snapshot.size == len(content))
+        self.assertEqual(prbt.to_list(), sorted(expected))
+
+        with self.assertRaises(TypeError):
+            snapshots[0][0].insert(1)
+        with self.assertRaises(TypeError):
+            snapshots[0][0].remove(1)
+
+    def test_untyped(self):
+        class IntTree(PersistentRedBlackTree[int]):
+            pass
+
+        for tree in (PersistentRedBlackTree(), PersistentRedBlackTree(key_type=int), IntTree()):
+            self.assertTrue(tree.insert(1))
+            self.assertIs(tree.key_type, int)
+            with self.assertRaises(TypeError):
+                tree.insert("1")
+            snapshot = tree.snapshot()
+            self.assertTrue(snapshot.contains(1))
+            with self.assertRaises(TypeError):
+                snapshot.contains("1")
+        self.assertIsNone(PersistentRedBlackTree().key_type)
+        with self.assertRaises(TypeError):
+            PersistentRedBlackTree(key_type=str).insert(1)
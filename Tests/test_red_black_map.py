@@ -0,0 +1,86 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.red_black_map import RedBlackMap
+
+
+class TestRedBlackMap(TestCase):
+    def test_mapping(self):
+        rbm = RedBlackMap[int, str]()
+        expected: dict[int, str] = {}
+
+        count: int = 5_000
+        for i in range(count):
+            key: int = random.randint(-count, count)
+            action: int = random.randint(0, 3)
+            if action == 0:
+                rbm[key] = str(i)
+                expected[key] = str(i)
+            elif action == 1:
+                self.assertEqual(rbm.pop(key, None), expected.pop(key, None))
+            elif action == 2:
+                self.assertEqual(rbm.setdefault(key, "-"), expected.setdefault(key, "-"))
+            else:
+                self.assertEqual(rbm.get(key), expected.get(key))
+                self.assertEqual(key in rbm, key in expected)
+
+        self.assertTrue(len(rbm) == len(expected))
+        self.assertEqual(list(rbm.items()), sorted(expected.items()))
+        self.assertEqual(list(rbm.values()), [expected[key] for key in sorted(expected)])
+        self.assertEqual(list(rbm), sorted(expected))
+        self.assertEqual(rbm, expected)
+
+    def test_missing_keys(self):
+        rbm = RedBlackMap[str, int]()
+        rbm["apple"] = 1
+        with self.assertRaises(KeyError):
+            _ = rbm["banana"]
+        with self.assertRaises(KeyError):
+            del rbm["banana"]
+        with self.assertRaises(KeyError):
+            rbm.pop("banana")
+        with self.assertRaises(TypeError):
+            rbm[1] = 1
+        self.assertEqual(rbm.popitem(), ("apple", 1))
+        with self.assertRaises(KeyError):
+            rbm.popitem()
+
+    def test_range_views(self):
+        rbm = RedBlackMap[int, int](order_statistics=True)
+        rbm.update((key, key * key) for key in range(100))
+
+        self.assertEqual(list(rbm.irange_items(10, 13)),
+                         [(10, 100), (11, 121), (12, 144), (13, 169)])
+        self.assertEqual(list(rbm.irange_items(95, inclusive=(False, True))),
+                         [(key, key * key) for key in range(96, 100)])
+        self.assertEqual(list(reversed(rbm.items()))[:2], [(99, 9801), (98, 9604)])
+        self.assertEqual(rbm.select(50), 50)
+        self.assertEqual(rbm.count_range(10, 19), 10)
+
+    def test_constructors(self):
+        pairs = [(random.randint(0, 200), random.random()) for _ in range(300)]
+        expected = dict(pairs)
+
+        rbm = RedBlackMap.from_iterable(pairs, int, order_statistics=True)
+        self.assertEqual(rbm, expected)
+        self.assertEqual(list(rbm), sorted(expected))
+        self.assertEqual(rbm.select(0), min(expected))
+        self.assertEqual(RedBlackMap.from_iterable(expected), expected)
+        self.assertEqual(RedBlackMap.from_sorted(sorted(expected.items())), expected)
+
+        empty = RedBlackMap.from_sorted([], key_type=int)
+        self.assertEqual(len(empty), 0)
+        empty[1] = "a"
+        with self.assertRaises(TypeError):
+            empty["b"] = "b"
+        with self.assertRaises(TypeError):
+            RedBlackMap.from_sorted([("a", "a")], int)
+        with self.assertRaises(ValueError):
+            RedBlackMap.from_sorted([(2, "b"), (1, "a")])
+
+    def test_contains_other_type(self):
+        rbm = RedBlackMap[int, str]()
+        rbm[1] = "a"
+        self.assertIn(1, rbm)
+        self.assertNotIn("x", rbm)
+        self.assertNotIn(None, rbm)
+        self.assertNotIn(2, rbm)
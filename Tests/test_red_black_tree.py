@@ -96,3 +96,302 @@ class TestRedBlackTree(TestCase):
                 self.assertFalse(rbt.size == count)
                 count -= 1
                 self.assertTrue(rbt.size == count)
+
+    def test_from_sorted(self):
+        count: int = 20_000
+        rbt = RedBlackTree.from_sorted(range(count))
+
+        self.assertTrue(rbt.size == count)
+        self.assertEqual(rbt.to_list(), list(range(count)))
+        for num in random.sample(range(count), 1_000):
+            self.assertTrue(rbt.contains(num))
+        self.assertFalse(rbt.contains(-1))
+
+        # the built tree keeps balancing after further changes
+        test_list: list[int] = random.sample(range(-count, 2 * count), count)
+        expected: set[int] = set(range(count))
+        for num in test_list:
+            if random.randint(0, 1) == 1:
+                rbt.insert(num)
+                expected.add(num)
+            else:
+                rbt.remove(num)
+                expected.discard(num)
+        self.assertEqual(rbt.to_list(), sorted(expected))
+        self.assertTrue(rbt.size == len(expected))
+
+        with self.assertRaises(ValueError):
+            RedBlackTree.from_sorted([1, 3, 2])
+        with self.assertRaises(TypeError):
+            RedBlackTree.from_sorted([1, "2"])
+
+    def test_from_iterable(self):
+        count: int = 2_000
+        test_list: list[int] = [random.randint(-count, count) for _ in range(count)]
+        rbt = RedBlackTree.from_iterable(test_list, int)
+
+        self.assertEqual(rbt.to_list(), sorted(set(test_list)))
+        self.assertTrue(rbt.size == len(set(test_list)))
+        with self.assertRaises(TypeError):
+            rbt.insert("1")
+
+        # key_type types the built tree, even an empty one
+        empty = RedBlackTree.from_iterable([], int)
+        self.assertTrue(empty.size == 0)
+        self.assertIs(empty.key_type, int)
+        with self.assertRaises(TypeError):
+            RedBlackTree.from_iterable(["a"], int)
+        with self.assertRaises(TypeError):
+            RedBlackTree.from_sorted([1], str)
+        empty.union(rbt)
+        self.assertEqual(empty.to_list(), sorted(set(test_list)))
+        self.assertTrue(empty.insert(count + 1))
+        self.assertEqual(RedBlackTree.join(RedBlackTree.from_sorted([], int),
+                                           RedBlackTree.from_sorted([5])).to_list(), [5])
+
+    def test_batch_operations(self):
+        rbt = RedBlackTree[int]()
+        count: int = 5_000
+        test_list: list[int] = [random.randint(-count, count) for _ in range(count)]
+        expected: set[int] = set(test_list)
+
+        self.assertEqual(rbt.insert_many(test_list), len(expected))
+        self.assertEqual(rbt.insert_many(test_list), 0)
+        self.assertTrue(rbt.size == len(expected))
+        self.assertEqual(rbt.to_list(), sorted(expected))
+
+        queries: list[int] = [random.randint(-2 * count, 2 * count) for _ in range(count)]
+        self.assertEqual(rbt.contains_many(queries), [num in expected for num in queries])
+
+        to_remove: list[int] = random.sample(range(-count, count), count // 2)
+        self.assertEqual(rbt.remove_many(to_remove), len(expected & set(to_remove)))
+        expected -= set(to_remove)
+        self.assertTrue(rbt.size == len(expected))
+        self.assertEqual(rbt.to_list(), sorted(expected))
+
+        with self.assertRaises(TypeError):
+            rbt.contains_many([1, "2"])
+
+    def test_order_statistics(self):
+        rbt = RedBlackTree[int](order_statistics=True)
+
+        count: int = 5_000
+        test_list: list[int] = random.sample(range(-count, count), count)
+        rbt.insert_many(test_list[:count // 2])
+        for num in test_list[count // 2:]:
+            rbt.insert(num)
+        for num in test_list[:count // 4]:
+            rbt.remove(num)
+
+        content: list[int] = sorted(test_list[count // 4:])
+        self.assertEqual(rbt.to_list(), content)
+        for index in random.sample(range(len(content)), 500):
+            self.assertEqual(rbt.select(index), content[index])
+            self.assertEqual(rbt.rank(content[index]), index)
+        self.assertEqual(rbt.select(-1), content[-1])
+        with self.assertRaises(IndexError):
+            rbt.select(len(content))
+
+        for _ in range(500):
+            low, high = sorted(random.sample(range(-2 * count, 2 * count), 2))
+            expected: int = sum(1 for num in content if low <= num <= high)
+            self.assertEqual(rbt.count_range(low, high), expected)
+        self.assertEqual(rbt.count_range(1, -1), 0)
+
+        built = RedBlackTree.from_iterable(test_list, order_statistics=True)
+        self.assertEqual(built.select(count // 2), sorted(test_list)[count // 2])
+
+        with self.assertRaises(RuntimeError):
+            RedBlackTree[int]().rank(1)
+
+    def test_iteration(self):
+        count: int = 5_000
+        test_list: list[int] = random.sample(range(-count, count), count)
+        rbt = RedBlackTree[int]()
+        rbt.insert_many(test_list)
+        content: list[int] = sorted(test_list)
+
+        self.assertEqual(list(rbt), content)
+        self.assertEqual(list(reversed(rbt)), content[::-1])
+        self.assertEqual(list(RedBlackTree[int]()), [])
+
+        for _ in range(200):
+            low, high = sorted(random.sample(range(-2 * count, 2 * count), 2))
+            self.assertEqual(list(rbt.irange(low, high)),
+                             [num for num in content if low <= num <= high])
+            self.assertEqual(list(rbt.irange(low, high, inclusive=(False, False))),
+                             [num for num in content if low < num < high])
+        self.assertEqual(list(rbt.irange(high=content[10])), content[:11])
+
+        # only the consumed part of the range is visited
+        scan = rbt.irange(content[100])
+        self.assertEqual([next(scan) for _ in range(3)], content[100:103])
+
+    def test_neighbors(self):
+        rbt = RedBlackTree.from_sorted(range(0, 1_000, 10))
+
+        self.assertEqual(rbt.floor(55), 50)
+        self.assertEqual(rbt.floor(50), 50)
+        self.assertEqual(rbt.ceiling(55), 60)
+        self.assertEqual(rbt.ceiling(60), 60)
+        self.assertEqual(rbt.predecessor(50), 40)
+        self.assertEqual(rbt.successor(50), 60)
+        self.assertIsNone(rbt.floor(-1))
+        self.assertIsNone(rbt.predecessor(0))
+        self.assertIsNone(rbt.ceiling(991))
+        self.assertIsNone(rbt.successor(990))
+
+    def test_split_join(self):
+        for order_statistics in (False, True):
+            keys = random.sample(range(10_000), 2_000)
+            rbt = RedBlackTree.from_iterable(keys, int, order_statistics)
+            pivot = random.choice(keys)
+
+            left, right = rbt.split(pivot)
+            self.assertEqual(rbt.size, 0)
+            self.assertEqual(left.to_list(), sorted(k for k in keys if k < pivot))
+            self.assertEqual(right.to_list(), sorted(k for k in keys if k >= pivot))
+            self.assertEqual(left.size + right.size, len(keys))
+            if order_statistics:
+                self.assertEqual(right.select(0), pivot)
+
+            joined = RedBlackTree.join(left, right)
+            self.assertEqual(joined.to_list(), sorted(keys))
+            self.assertEqual(joined.size, len(keys))
+            self.assertEqual((left.size, right.size), (0, 0))
+            joined.insert(-1)
+            joined.remove(pivot)
+            self.assertEqual(joined.size, len(keys))
+
+        with self.assertRaises(ValueError):
+            RedBlackTree.join(RedBlackTree.from_sorted([5]), RedBlackTree.from_sorted([1]))
+
+    def test_set_operations(self):
+        for order_statistics in (False, True):
+            first = set(random.sample(range(5_000), 1_500))
+            second = set(random.sample(range(5_000), 200))
+            for operation, expected in (("union", first | second),
+                                        ("intersection", first & second),
+                                        ("difference", first - second)):
+                rbt = RedBlackTree.from_iterable(first, int, order_statistics)
+                other = RedBlackTree.from_iterable(second, int, order_statistics)
+                getattr(rbt, operation)(other)
+                self.assertEqual(rbt.to_list(), sorted(expected))
+                self.assertEqual(rbt.size, len(expected))
+                self.assertEqual(other.size, 0)
+                removed = random.sample(sorted(expected), min(50, len(expected)))
+                for key in removed:
+                    rbt.remove(key)
+                self.assertEqual(rbt.size, len(expected) - len(removed))
+
+        with self.assertRaises(TypeError):
+            RedBlackTree[int]().union(RedBlackTree[str]())
+        with self.assertRaises(TypeError):
+            RedBlackTree[int]().union(RedBlackTree[int](order_statistics=True))
+
+    def test_remove_range(self):
+        keys = random.sample(range(10_000), 3_000)
+        rbt = RedBlackTree.from_iterable(keys)
+        low, high = 2_000, 7_000
+
+        removed = rbt.remove_range(low, high)
+        self.assertEqual(removed, sum(low <= k <= high for k in keys))
+        self.assertEqual(rbt.to_list(), sorted(k for k in keys if not low <= k <= high))
+        self.assertEqual(rbt.size, len(keys) - removed)
+        self.assertEqual(rbt.remove_range(high, low), 0)
+
+    def test_key_function(self):
+        for order_statistics in (False, True):
+            records = [(name, random.randrange(1_000)) for name in
+                       random.sample(string.ascii_letters, 40)]
+            calls = []
+
+            def by_score(record):
+                calls.append(record)
+                return record[1], record[0]
+
+            rbt = RedBlackTree[tuple](order_statistics=order_statistics, key=by_score)
+            for record in records:
+                self.assertTrue(rbt.insert(record))
+            self.assertEqual(len(calls), len(records))
+            expected = sorted(records, key=by_score)
+            self.assertEqual(rbt.to_list(), expected)
+            self.assertEqual(list(rbt), expected)
+            self.assertEqual(list(reversed(rbt)), expected[::-1])
+            self.assertTrue(rbt.contains(expected[5]))
+            # scores may repeat, the ceiling is the first record of the score
+            ceiling = next(record for record in expected if record[1] >= expected[5][1])
+            self.assertEqual(rbt.ceiling(("", expected[5][1])), ceiling)
+            self.assertEqual(list(rbt.irange(expected[3], expected[7])), expected[3:8])
+            if order_statistics:
+                self.assertEqual(rbt.select(4), expected[4])
+                self.assertEqual(rbt.rank(expected[4]), 4)
+
+            rbt.remove(expected[0])
+            self.assertEqual(rbt.to_list(), expected[1:])
+            self.assertEqual(rbt.insert_many(records), 1)
+
+            built = RedBlackTree.from_iterable(records, order_statistics=order_statistics,
+                                               key=by_score)
+            self.assertEqual(built.to_list(), expected)
+            left, right = built.split(expected[10])
+            self.assertEqual(right.to_list(), expected[10:])
+            self.assertEqual(RedBlackTree.join(left, right).to_list(), expected)
+
+        with self.assertRaises(TypeError):
+            RedBlackTree[int](key=abs).union(RedBlackTree[int]())
+
+    def test_validation(self):
+        rbt = RedBlackTree()
+        rbt.insert(3)
+        with self.assertRaises(TypeError):
+            rbt.insert("3")
+        self.assertIs(rbt.key_type, int)
+
+        class IntTree(RedBlackTree[int]):
+            pass
+
+        subclass_tree = IntTree()
+        self.assertIs(subclass_tree.key_type, int)
+        with self.assertRaises(TypeError):
+            subclass_tree.insert(1.5)
+
+        trusted = RedBlackTree[int](validate=False)
+        trusted.insert_many(range(100))
+        self.assertTrue(trusted.contains(50))
+        self.assertEqual(trusted.size, 100)
+
+    def test_multiset(self):
+        for order_statistics in (False, True):
+            test_list: list[int] = [random.randrange(50) for _ in range(2_000)]
+            rbt = RedBlackTree[int](order_statistics=order_statistics, multiset=True)
+            for num in test_list:
+                rbt.insert(num)
+            expected = sorted(test_list)
+            self.assertEqual(rbt.size, len(test_list))
+            self.assertEqual(rbt.to_list(), expected)
+            self.assertEqual(list(reversed(rbt)), expected[::-1])
+            self.assertEqual(list(rbt.irange(10, 20)), [k for k in expected if 10 <= k <= 20])
+            self.assertEqual(rbt.count(7), test_list.count(7))
+            if order_statistics:
+                index = random.randrange(len(expected))
+                self.assertEqual(rbt.select(index), expected[index])
+                self.assertEqual(rbt.rank(25), sum(k < 25 for k in expected))
+                self.assertEqual(rbt.count_range(5, 9), sum(5 <= k <= 9 for k in expected))
+
+            for num in test_list[:1_000]:
+                rbt.remove(num)
+            expected = sorted(test_list[1_000:])
+            self.assertEqual(rbt.to_list(), expected)
+            self.assertEqual(rbt.size, len(expected))
+
+            other = RedBlackTree.from_iterable([1, 1, 2, 60], int, order_statistics,
+                                               multiset=True)
+            self.assertEqual(other.count(1), 2)
+            rbt.union(other)
+            self.assertEqual(rbt.to_list(), sorted(expected + [1, 1, 2, 60]))
+
+        with self.assertRaises(TypeError):
+            RedBlackTree[int](multiset=True).union(RedBlackTree[int]())
+        with self.assertRaises(TypeError):
+            RedBlackTree[int](multiset=True, key=abs)
@@ -0,0 +1,73 @@
+from unittest import TestCase, skipUnless
+import os
+from PIL import Image, ImageChops, ImageDraw
+from StructureDrawer.render_cache import FONT_FILE, MIN_FONT_SIZE, CacheCounter, NodeSprites
+
+FONT_PATH: str = os.path.join(os.path.dirname(__file__), "..", "StructureDrawer", FONT_FILE)
+
+
+class TestRenderCache(TestCase):
+    def test_sprite_cache(self):
+        sprites = NodeSprites(FONT_PATH)
+        sprite = sprites.sprite(None, 40, 2)
+        self.assertIs(sprites.sprite(None, 40, 2), sprite)
+        self.assertEqual(sprites.stats()["sprites"], {"hits": 1, "misses": 1})
+
+        # every parameter of the picture is a part of the key
+        others = [sprites.sprite(None, 41, 2),
+                  sprites.sprite(None, 40, 3),
+                  sprites.sprite(None, 40, 2, fill=(255, 0, 0)),
+                  sprites.sprite(None, 40, 2, outline=(0, 0, 255))]
+        for other in others:
+            self.assertIsNot(other[0], sprite[0])
+        self.assertEqual(sprites.stats()["sprites"], {"hits": 1, "misses": 5})
+        self.assertEqual(sprites.stats()["fonts"], {"hits": 0, "misses": 0})
+
+    def test_unchanged_output(self):
+        # a pasted sprite gives the same pixels as the circle drawn directly
+        sprites = NodeSprites(FONT_PATH)
+        for diameter, line_width, fill in ((40, 2, (255, 255, 255)), (25, 5, (200, 30, 30))):
+            expected = Image.new("RGBA", (100, 100), (255, 255, 255, 0))
+            drawn = Image.new("RGBA", (100, 100), (255, 255, 255, 0))
+            for image in (expected, drawn):
+                ImageDraw.Draw(image).line([(0, 0), (100, 100)], fill=(0, 0, 0), width=3)
+            ImageDraw.Draw(expected).ellipse((30, 20, 30 + diameter, 20 + diameter),
+                                             outline=(0, 0, 0), fill=fill, width=line_width)
+            for _ in range(2):
+                sprite = sprites.sprite(None, diameter, line_width, fill)[0]
+                drawn.paste(sprite, (30, 20), sprite)
+                self.assertIsNone(ImageChops.difference(expected, drawn).getbbox())
+
+    @skipUnless(os.path.exists(FONT_PATH), "the font file is not installed")
+    def test_font_cache(self):
+        sprites = NodeSprites(FONT_PATH)
+        font = sprites.font(12)
+        self.assertIs(sprites.font(12), font)
+        self.assertIsNot(sprites.font(13), font)
+        self.assertEqual(sprites.stats()["fonts"], {"hits": 1, "misses": 2})
+
+        # labels of the same length share the sprite and its font
+        sprite, label_font = sprites.sprite("42", 60, 2)
+        self.assertIsNotNone(label_font)
+        self.assertEqual(sprites.sprite("17", 60, 2), (sprite, label_font))
+        self.assertIsNot(sprites.sprite("170", 60, 2)[1], label_font)
+        self.assertIs(sprites.sprite("42", 60, 2, outline=(255, 0, 0))[1], label_font)
+
+    @skipUnless(os.path.exists(FONT_PATH), "the font file is not installed")
+    def test_small_nodes(self):
+        # labels which would be too small to read get no font
+        sprites = NodeSprites(FONT_PATH)
+        self.assertIsNone(sprites.sprite("1", MIN_FONT_SIZE - 1, 1)[1])
+        self.assertIsNone(sprites.sprite("123456789", MIN_FONT_SIZE * 2, 1)[1])
+        self.assertIsNone(sprites.sprite(None, 60, 2)[1])
+        self.assertEqual(sprites.sprite("1", MIN_FONT_SIZE - 1, 1)[0].size,
+                         (MIN_FONT_SIZE, MIN_FONT_SIZE))
+
+    def test_counter(self):
+        counter = CacheCounter()
+        counter.hits += 2
+        counter.misses += 1
+        snapshot = counter.snapshot()
+        self.assertEqual(snapshot, {"hits": 2, "misses": 1})
+        counter.hits += 1
+        self.assertEqual(snapshot["hits"], 2)
@@ -0,0 +1,44 @@
+from unittest import TestCase
+import math
+import random
+from AlgorithmLibrary.scapegoat_tree import ScapegoatTree
+
+
+class TestScapegoatTree(TestCase):
+    def height(self, node, parent=None) -> int:
+        if node is None:
+            return 0
+        self.assertIs(node.parent, parent)
+        return 1 + max(self.height(node.left_child, node), self.height(node.right_child, node))
+
+    def test_insert_remove(self):
+        tree = ScapegoatTree[int]()
+        count: int = 2_000
+        test_list: list[int] = random.sample(range(-count, count), count)
+
+        for num in test_list:
+            self.assertTrue(tree.insert(num))
+            self.assertFalse(tree.insert(num))
+        self.assertEqual(tree.to_list(), sorted(test_list))
+
+        for num in test_list[:count // 2]:
+            tree.remove(num)
+            self.assertFalse(tree.contains(num))
+        self.height(tree.root)
+        self.assertEqual(tree.size, count - count // 2)
+        self.assertEqual(tree.to_list(), sorted(test_list[count // 2:]))
+
+    def test_sorted_ingest(self):
+        for alpha in (0.55, 2 / 3, 0.8):
+            tree = ScapegoatTree[int](alpha=alpha)
+            count: int = 10_000
+            for num in range(count):
+                tree.insert(num)
+            # depth of every node stays within log_{1/alpha}(n)
+            self.assertLessEqual(self.height(tree.root) - 1, math.log(count) / math.log(1 / alpha))
+
+            tree.remove_many(range(count // 2))
+            self.assertEqual(tree.to_list(), list(range(count // 2, count)))
+
+        with self.assertRaises(ValueError):
+            ScapegoatTree[int](alpha=0.5)
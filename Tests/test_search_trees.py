@@ -0,0 +1,24 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.search_trees import TREES, create_tree
+from AlgorithmLibrary.avl_tree import AVLTree
+
+
+class TestSearchTrees(TestCase):
+    def test_create_tree(self):
+        test_list: list[int] = random.sample(range(10_000), 1_000)
+        for kind in TREES:
+            with self.subTest(kind=kind):
+                tree = create_tree(kind, int)
+                self.assertEqual(tree.insert_many(test_list), len(test_list))
+                self.assertEqual(tree.to_list(), sorted(test_list))
+                tree.remove(test_list[0])
+                self.assertFalse(tree.contains(test_list[0]))
+                self.assertEqual(tree.size, len(test_list) - 1)
+                with self.assertRaises(TypeError):
+                    tree.insert("1")
+
+        self.assertIsInstance(create_tree("avl"), AVLTree)
+        self.assertEqual(create_tree("treap", seed=5).size, 0)
+        with self.assertRaises(ValueError):
+            create_tree("splay")
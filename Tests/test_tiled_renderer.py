@@ -0,0 +1,78 @@
+from unittest import TestCase
+import os
+import random
+import tempfile
+from PIL import Image, ImageChops
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+from StructureDrawer.tiled_renderer import SpatialIndex, TiledRenderer
+
+CONFIG: str = os.path.join(os.path.dirname(__file__), "..", "StructureDrawer", "params.cfg")
+
+
+class TestTiledRenderer(TestCase):
+    def setUp(self) -> None:
+        tree = RedBlackTree[int]()
+        tree.insert_many(random.sample(range(1_000), 40))
+        # labels need the font file, shapes are compared without them
+        self.renderer = TiledRenderer.fromTree(tree, CONFIG, 512, labels=False)
+
+    def test_tiles_join_into_viewport(self):
+        layout = self.renderer.layout
+        whole = self.renderer.renderViewport(0, 0, layout.width, layout.height)
+        self.assertIsNotNone(ImageChops.difference(
+            whole, Image.new("RGBA", whole.size, (255, 255, 255, 0))).getbbox())
+
+        level = self.renderer.levels() - 1
+        stitched = Image.new("RGBA", whole.size, (255, 255, 255, 0))
+        for column in range(-(-layout.width // 512)):
+            for row in range(-(-layout.height // 512)):
+                tile = self.renderer.renderTile(level, column, row)
+                if tile is not None:
+                    self.assertEqual(tile.size, (512, 512))
+                    stitched.paste(tile, (column * 512, row * 512))
+        self.assertIsNone(ImageChops.difference(whole, stitched).getbbox())
+
+        crop = self.renderer.renderViewport(700, 300, 900, 600)
+        self.assertIsNone(ImageChops.difference(whole.crop((700, 300, 1600, 900)),
+                                                crop).getbbox())
+        self.assertIsNone(self.renderer.renderTile(level, -5, -5))
+
+    def test_pyramid(self):
+        layout = self.renderer.layout
+        levels = self.renderer.levels()
+        self.assertLessEqual(max(layout.width, layout.height), 512 << (levels - 1))
+        self.assertGreater(max(layout.width, layout.height), 512 << (levels - 2))
+
+        with tempfile.TemporaryDirectory() as directory:
+            written = self.renderer.writePyramid(directory)
+            files = [os.path.join(str(level), name) for level in range(levels)
+                     for name in os.listdir(os.path.join(directory, str(level)))]
+            self.assertEqual(len(files), written)
+            self.assertEqual(os.listdir(os.path.join(directory, "0")), ["0_0.png"])
+            with Image.open(os.path.join(directory, "0", "0_0.png")) as tile:
+                self.assertEqual(tile.size, (512, 512))
+
+    def test_spatial_index(self):
+        layout = self.renderer.layout
+        index = SpatialIndex(layout, 100, 0, 0)
+        for _ in range(50):
+            x, y = random.randrange(layout.width), random.randrange(layout.height)
+            nodes, edges = index.query(x, y, x + 300, y + 300)
+            # every node inside the rectangle is found, the rest are from touched cells
+            inside = [i for i in range(len(layout))
+                      if x <= layout.xs[i] <= x + 300 and y <= layout.ys[i] <= y + 300]
+            self.assertTrue(set(inside) <= set(nodes))
+            for i in nodes:
+                self.assertTrue(x - 100 < layout.xs[i] < x + 400 and
+                                y - 100 < layout.ys[i] < y + 400)
+            self.assertEqual(edges, sorted(set(edges)))
+
+    def test_cached_rendering(self):
+        # the second rendering takes every sprite from the cache and draws the same image
+        layout = self.renderer.layout
+        first = self.renderer.renderViewport(0, 0, layout.width, layout.height, 0.5)
+        misses = self.renderer.cacheStats()["sprites"]["misses"]
+        second = self.renderer.renderViewport(0, 0, layout.width, layout.height, 0.5)
+        self.assertEqual(self.renderer.cacheStats()["sprites"]["misses"], misses)
+        self.assertGreaterEqual(self.renderer.cacheStats()["sprites"]["hits"], len(layout))
+        self.assertIsNone(ImageChops.difference(first, second).getbbox())
@@ -0,0 +1,64 @@
+from unittest import TestCase
+import random
+import sys
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from AlgorithmLibrary.red_black_tree import RedBlackTree, NIL
+from Structures.Traversal import pre_order, in_order, post_order, level_order, levels, \
+    height, pre_order_states
+
+
+class TestTraversal(TestCase):
+    def recursive(self, node, order: str) -> list:
+        if node is None:
+            return []
+        left = self.recursive(node.left_child, order)
+        right = self.recursive(node.right_child, order)
+        if order == "pre":
+            return [node.key] + left + right
+        if order == "in":
+            return left + [node.key] + right
+        return left + right + [node.key]
+
+    def test_orders(self):
+        bst = BinarySearchTree[int]()
+        test_list: list[int] = random.sample(range(10_000), 500)
+        for num in test_list:
+            bst.insert(num)
+
+        self.assertEqual([x.key for x in pre_order(bst.root)], self.recursive(bst.root, "pre"))
+        self.assertEqual([x.key for x in in_order(bst.root)], sorted(test_list))
+        self.assertEqual([x.key for x in post_order(bst.root)], self.recursive(bst.root, "post"))
+
+        keys = [x.key for x in level_order(bst.root)]
+        self.assertEqual(keys[0], test_list[0])
+        self.assertEqual(sorted(keys), sorted(test_list))
+        depths = {x: depth for depth, level in enumerate(levels(bst.root)) for x in level}
+        self.assertTrue(all(depths[x] == depths[x.parent] + 1 for x in depths if x.parent))
+        self.assertEqual(height(bst.root), 1 + max(depths.values()))
+
+        for walk in (pre_order, in_order, post_order, level_order):
+            self.assertEqual(list(walk(None)), [])
+
+    def test_sentinel(self):
+        rbt = RedBlackTree.from_sorted(range(1_000))
+        root = rbt._RedBlackTree__root
+        self.assertEqual([x.key for x in in_order(root, NIL)], list(range(1_000)))
+        self.assertEqual(len(list(post_order(root, NIL))), 1_000)
+        self.assertEqual(height(root, NIL), 10)
+
+        depths = dict((x.key, depth) for x, depth in
+                      pre_order_states(root, 0, lambda depth, right: depth + 1, NIL))
+        self.assertEqual(len(depths), 1_000)
+        self.assertEqual(max(depths.values()), 9)
+
+    def test_degenerate(self):
+        # deeper than the recursion limit
+        count: int = sys.getrecursionlimit() + 1_000
+        bst = BinarySearchTree[int]()
+        for num in range(count):
+            bst.insert(num)
+
+        self.assertEqual(height(bst.root), count)
+        self.assertEqual(sum(1 for _ in pre_order(bst.root)), count)
+        self.assertEqual(next(post_order(bst.root)).key, count - 1)
+        self.assertEqual(bst.to_list(), list(range(count)))
@@ -0,0 +1,45 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.treap import Treap
+
+
+class TestTreap(TestCase):
+    def check_heap(self, node, parent=None) -> int:
+        if node is None:
+            return 0
+        self.assertIs(node.parent, parent)
+        if parent is not None:
+            self.assertLessEqual(node.priority, parent.priority)
+        return 1 + max(self.check_heap(node.left_child, node),
+                       self.check_heap(node.right_child, node))
+
+    def test_insert_remove(self):
+        treap = Treap[int]()
+        count: int = 2_000
+        test_list: list[int] = random.sample(range(-count, count), count)
+
+        for num in test_list:
+            self.assertTrue(treap.insert(num))
+            self.assertFalse(treap.insert(num))
+        self.check_heap(treap.root)
+        self.assertEqual(treap.to_list(), sorted(test_list))
+
+        for num in test_list[:count // 2]:
+            treap.remove(num)
+            self.assertFalse(treap.contains(num))
+        self.check_heap(treap.root)
+        self.assertEqual(treap.size, count - count // 2)
+        self.assertEqual(treap.to_list(), sorted(test_list[count // 2:]))
+
+    def test_sorted_ingest(self):
+        count: int = 10_000
+        treap = Treap[int](seed=1)
+        treap.insert_many(range(count))
+        height = self.check_heap(treap.root)
+        self.assertLess(height, 4 * count.bit_length())
+
+        # the same seed gives the same shape
+        other = Treap[int](seed=1)
+        other.insert_many(range(count))
+        self.assertEqual(other.root.key, treap.root.key)
+        self.assertEqual(self.check_heap(other.root), height)
@@ -0,0 +1,59 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+from StructureDrawer.tree_layout import TreeLayout, layoutTree
+
+
+class TestTreeLayout(TestCase):
+    def check_layout(self, layout: TreeLayout, x_step: int, y_step: int) -> None:
+        levels: dict[int, list[int]] = {}
+        for x, y in zip(layout.xs, layout.ys):
+            levels.setdefault(y, []).append(x)
+            self.assertTrue(0 <= x <= layout.width and 0 <= y <= layout.height)
+        for xs in levels.values():
+            xs.sort()
+            for a, b in zip(xs, xs[1:]):
+                self.assertGreaterEqual(b - a, x_step)
+
+        for parent, child in layout.edges():
+            self.assertEqual(layout.ys[child], layout.ys[parent] + y_step)
+            if layout.nodes[child] is layout.nodes[parent].left_child:
+                self.assertLess(layout.xs[child], layout.xs[parent])
+            else:
+                self.assertGreater(layout.xs[child], layout.xs[parent])
+
+    def test_random_trees(self):
+        for _ in range(50):
+            count: int = random.randrange(200)
+            test_list: list[int] = random.sample(range(1_000), count)
+            bst = BinarySearchTree[int]()
+            for num in test_list:
+                bst.insert(num)
+            rbt = RedBlackTree[int]()
+            rbt.insert_many(test_list)
+
+            for tree in (bst, rbt):
+                layout = layoutTree(tree, 30, 45, 20)
+                self.assertEqual(len(layout), count)
+                self.assertEqual(sorted(node.key for node in layout.nodes), sorted(test_list))
+                self.check_layout(layout, 30, 45)
+
+    def test_canvas_size(self):
+        self.assertEqual((layoutTree(BinarySearchTree[int](), margin=5).width,
+                          layoutTree(RedBlackTree[int](), margin=5).height), (10, 10))
+
+        # a path of 30 levels is as narrow as its nodes
+        path = BinarySearchTree[int]()
+        for num in range(30):
+            path.insert(num)
+        layout = layoutTree(path)
+        self.assertEqual((layout.width, layout.height), (29, 29))
+
+        # width grows linearly with the number of nodes
+        count: int = 1 << 14
+        rbt = RedBlackTree[int]()
+        rbt.insert_many(range(count))
+        layout = layoutTree(rbt)
+        self.check_layout(layout, 2, 1)
+        self.assertLessEqual(layout.width, 2 * count)
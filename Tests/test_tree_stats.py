@@ -0,0 +1,94 @@
+from unittest import TestCase
+import random
+from AlgorithmLibrary.binary_search_tree import BinarySearchTree
+from AlgorithmLibrary.interval_tree import IntervalTree
+from AlgorithmLibrary.red_black_map import RedBlackMap
+from AlgorithmLibrary.red_black_tree import RedBlackTree
+from AlgorithmLibrary.tree_stats import enable_stats, disable_stats
+
+
+class TestTreeStats(TestCase):
+    def test_red_black_tree(self):
+        rbt = RedBlackTree[int]()
+        records = []
+        enable_stats(rbt, records.append)
+
+        test_list: list[int] = random.sample(range(100_000), 2_000)
+        for num in test_list:
+            self.assertTrue(rbt.insert(num))
+        for num in test_list[:1_000]:
+            rbt.remove(num)
+        for num in test_list:
+            self.assertEqual(rbt.contains(num), num in test_list[1_000:])
+        self.assertEqual(rbt.to_list(), sorted(test_list[1_000:]))
+
+        stats = rbt.stats()
+        self.assertEqual(stats["operations"], {"insert": 2_000, "remove": 1_000,
+                                               "contains": 2_000})
+        self.assertEqual(len(records), 5_000)
+        self.assertEqual(stats["comparisons"], sum(r.comparisons for r in records))
+        self.assertEqual(stats["rotations"], sum(r.rotations for r in records))
+        self.assertEqual(stats["recolors"], sum(r.recolors for r in records))
+        self.assertGreater(stats["rotations"], 0)
+        self.assertLessEqual(stats["depth_max"], 2 * (2_000).bit_length())
+        self.assertEqual(sum(stats["latency_ns"]["insert"].values()), 2_000)
+
+        disable_stats(rbt)
+        self.assertIs(type(rbt), RedBlackTree)
+        self.assertFalse(hasattr(rbt, "stats"))
+        rbt.insert(-1)
+        self.assertEqual(len(records), 5_000)
+
+    def test_degenerate_binary_search_tree(self):
+        bst = BinarySearchTree[int]()
+        enable_stats(bst)
+        for num in range(500):
+            bst.insert(num)
+
+        stats = bst.stats()
+        self.assertEqual(stats["depth_max"], 499)
+        self.assertEqual(stats["rotations"], 0)
+        self.assertEqual(bst.to_list(), list(range(500)))
+
+    def test_map(self):
+        rbm = RedBlackMap[int, str]()
+        enable_stats(rbm)
+        rbm[1] = "a"
+        rbm.insert(2)
+        self.assertIn(1, rbm)
+        self.assertEqual(rbm.stats()["operations"]["contains"], 1)
+        self.assertEqual(rbm[1], "a")
+        with self.assertRaises(TypeError):
+            rbm.insert("3")
+
+    def test_augmented_trees(self):
+        # nodes are built with the keys themselves, not with the counting probe
+        it = IntervalTree(order_statistics=True)
+        enable_stats(it)
+        intervals = [(low, low + random.randint(0, 50)) for low in random.sample(range(1000), 300)]
+        for interval in intervals:
+            self.assertTrue(it.insert(interval))
+        self.assertFalse(it.insert(intervals[0]))
+        for interval in intervals[:100]:
+            it.remove(interval)
+        self.assertEqual(sorted(it.stabbing(500)),
+                         sorted(i for i in intervals[100:] if i[0] <= 500 <= i[1]))
+        self.assertEqual(it.select(0), min(intervals[100:]))
+        self.assertTrue(all(type(key) is tuple for key in it))
+        with self.assertRaises(ValueError):
+            it.insert((5, 1))
+        self.assertEqual(it.stats()["operations"]["insert"], 301)
+
+        rbt = RedBlackTree[int](order_statistics=True, multiset=True)
+        enable_stats(rbt)
+        test_list: list[int] = [random.randrange(100) for _ in range(1_000)]
+        for num in test_list:
+            rbt.insert(num)
+        for num in test_list[:500]:
+            rbt.remove(num)
+        expected: list[int] = sorted(test_list[500:])
+        self.assertEqual(rbt.to_list(), expected)
+        self.assertEqual(rbt.count(expected[0]), expected.count(expected[0]))
+        self.assertEqual(rbt.select(250), expected[250])
+        self.assertEqual(rbt.rank(50), sum(num < 50 for num in expected))
+        self.assertTrue(all(type(key) is int for key in rbt))